@@ -0,0 +1,14 @@
+"""Chatserver micro-benchmarks
+
+This package provides a reproducible benchmark suite for hot paths:
+- State validation and atomic persistence
+- WhatsApp message conversion and formatting
+- Flow branching and full flow processor steps
+
+Run from the app directory:
+    python -m benchmarks --json results.json
+    python -m benchmarks --compare baseline.json
+
+Benchmarks run against an in-memory Redis stand-in by default so results
+are comparable across machines. Pass --redis-url to use a real Redis.
+"""
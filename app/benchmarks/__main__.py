@@ -0,0 +1,102 @@
+"""Benchmark command line entry point
+
+Usage (from the app directory):
+    python -m benchmarks                         # run all cases, print table
+    python -m benchmarks --json results.json     # also write JSON report
+    python -m benchmarks --filter flow.step      # run matching cases only
+    python -m benchmarks --compare baseline.json --fail-on-regression
+    python -m benchmarks --state-backend memory  # flow cost without Redis
+"""
+import argparse
+import fnmatch
+import sys
+
+from .environment import setup_django
+from .harness import (CASES, build_report, compare_reports, format_ns,
+                      load_report, run_case, write_report)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Run chatserver micro-benchmarks")
+    parser.add_argument("--json", metavar="PATH", help="Write JSON report to PATH")
+    parser.add_argument(
+        "--filter", metavar="PATTERN", action="append", default=[],
+        help="Only run cases matching PATTERN (substring or glob, repeatable)"
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    parser.add_argument(
+        "--scale", type=float, default=1.0,
+        help="Multiplier for call counts, e.g. 0.1 for a quick smoke run"
+    )
+    parser.add_argument("--redis-url", help="Use a real Redis instead of the in-memory stand-in")
+    parser.add_argument(
+        "--state-backend", choices=("redis", "memory", "sqlite"), default="redis",
+        help="State storage backend; memory measures flow cost without Redis round trips"
+    )
+    parser.add_argument("--compare", metavar="PATH", help="Compare medians against a baseline report")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0,
+        help="Percent slowdown that counts as a regression (default: 10)"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true",
+        help="Exit with status 1 when a regression is detected"
+    )
+    return parser.parse_args(argv)
+
+
+def _selected(name: str, patterns) -> bool:
+    if not patterns:
+        return True
+    return any(pattern in name or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def main(argv=None) -> int:
+    """Run selected benchmarks and report results"""
+    args = parse_args(argv)
+
+    setup_django(args.redis_url, args.state_backend)
+    from . import cases  # noqa: F401 - registers cases
+
+    selected = [case for case in CASES if _selected(case.name, args.filter)]
+    if args.list:
+        for case in selected:
+            print(f"{case.name:<45} {case.description}")
+        return 0
+
+    results = {}
+    width = max((len(case.name) for case in selected), default=0)
+    for case in selected:
+        result = run_case(case, scale=args.scale)
+        results[case.name] = result
+        print(
+            f"{case.name:<{width}}  median {format_ns(result['median_ns']):>10}"
+            f"  min {format_ns(result['min_ns']):>10}"
+            f"  ±{format_ns(result['stdev_ns']):>10}",
+            flush=True
+        )
+
+    report = build_report(results, backend=args.redis_url or "memory", state_backend=args.state_backend)
+    if args.json:
+        write_report(report, args.json)
+        print(f"\nWrote {len(results)} results to {args.json}")
+
+    if args.compare:
+        rows = compare_reports(report, load_report(args.compare), args.threshold / 100)
+        regressions = [row for row in rows if row["regression"]]
+        print(f"\nComparison against {args.compare}:")
+        for row in rows:
+            marker = "  REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['name']:<{width}}  {format_ns(row['baseline_ns']):>10} -> "
+                f"{format_ns(row['current_ns']):>10}  {row['change'] * 100:+6.1f}%{marker}"
+            )
+        if regressions and args.fail_on_regression:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Per flow step call budgets
+
+Runs each flow step once inside a call budget and fails when a step makes
+more Redis round trips/commands or outbound HTTP calls than allowed. This
+catches state writes added inside components without anyone noticing.
+
+Usage (from the app directory):
+    python -m benchmarks.budgets                     # check all steps
+    python -m benchmarks.budgets --redis-url redis://localhost:6379/15
+    python -m pytest benchmarks                      # same budgets as tests
+
+Budgets are targets, not measurements:
+- A webhook step makes at most STEP_ROUND_TRIPS Redis round trips, or
+  DISPLAY_ROUND_TRIPS when it only redraws the current component, and sends
+  one message
+- A component's input phase (the incoming message handled by the component
+  awaiting it) makes at most INPUT_ROUND_TRIPS: one write for its data and
+  one to release the input wait
+"""
+import argparse
+import sys
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .environment import setup_django
+
+# Redis round trips allowed per webhook step
+STEP_ROUND_TRIPS = 10
+DISPLAY_ROUND_TRIPS = 6
+
+# Redis round trips allowed for one component's input phase
+INPUT_ROUND_TRIPS = 2
+
+
+@dataclass
+class StepBudget:
+    """Call limits for one flow step
+
+    Attributes:
+        name: Step name
+        setup: Seeds state and returns the webhook payload
+        component: Component the step is expected to end on (or hand over
+            to, for a phase)
+        limits: Limits named as in core.monitoring.call_budget.LIMIT_FIELDS
+        phase: (path, component) to measure on its own instead of the whole
+            webhook step
+    """
+    name: str
+    setup: Callable[[], Dict[str, Any]]
+    component: str
+    limits: Dict[str, int]
+    phase: Optional[Tuple[str, str]] = None
+
+
+def get_step_budgets() -> List[StepBudget]:
+    """Build step budgets (needs Django configured)"""
+    from . import cases
+
+    step_limits = {
+        "max_redis_round_trips": STEP_ROUND_TRIPS,
+        "max_redis_commands": STEP_ROUND_TRIPS,
+        "max_http_calls": 1
+    }
+    input_limits = {
+        "max_redis_round_trips": INPUT_ROUND_TRIPS,
+        "max_redis_commands": INPUT_ROUND_TRIPS,
+        "max_http_calls": 0
+    }
+
+    return [
+        StepBudget(
+            name="AccountDashboard display",
+            setup=cases._seed_dashboard_display(cases.SMALL_DASHBOARD),
+            component="AccountDashboard",
+            limits={**step_limits, "max_redis_round_trips": DISPLAY_ROUND_TRIPS, "max_redis_commands": DISPLAY_ROUND_TRIPS}
+        ),
+        StepBudget(
+            name="AccountDashboard selection",
+            setup=cases._seed_dashboard_select,
+            component="AmountInput",
+            limits=step_limits
+        ),
+        StepBudget(
+            name="AccountDashboard input phase",
+            setup=cases._seed_dashboard_select,
+            component="AmountInput",
+            limits=input_limits,
+            phase=("account", "AccountDashboard")
+        ),
+        StepBudget(
+            name="AmountInput input",
+            setup=cases._seed_amount_input,
+            component="HandleInput",
+            limits=step_limits
+        ),
+        StepBudget(
+            name="AmountInput input phase",
+            setup=cases._seed_amount_input,
+            component="HandleInput",
+            limits=input_limits,
+            phase=("offer_secured", "AmountInput")
+        ),
+    ]
+
+
+def run_step(step: StepBudget, measure: Callable[[], AbstractContextManager]) -> Any:
+    """Run one step, measuring the whole webhook step or just its phase
+
+    Args:
+        step: Step to run
+        measure: Call budget context manager factory, e.g. track_calls
+
+    Returns:
+        The call budget yielded by measure
+    """
+    from core.flow.component_manager import process_component
+
+    from .cases import _expect, _prepare_webhook_step, _run_webhook_step
+
+    payload = step.setup()
+    if step.phase is None:
+        with measure() as budget:
+            state_manager = _run_webhook_step(payload)
+        _expect(state_manager, step.component)
+        return budget
+
+    state_manager = _prepare_webhook_step(payload)
+    with measure() as budget:
+        next_step = process_component(*step.phase, state_manager)
+    if not next_step or next_step[1] != step.component:
+        raise RuntimeError(f"{step.name} handed over to {next_step}, expected {step.component}")
+    return budget
+
+
+def check_budgets(steps: List[StepBudget]) -> List[Dict[str, Any]]:
+    """Run each step once under its budget
+
+    Returns:
+        One row per step with counters and any violations
+    """
+    from core.monitoring.call_budget import track_calls
+
+    rows = []
+    for step in steps:
+        budget = run_step(step, track_calls)
+        rows.append({
+            "name": step.name,
+            "counts": budget.to_dict(),
+            "summary": budget.header_value(),
+            "violations": budget.violations(**step.limits)
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Check flow step call budgets"""
+    parser = argparse.ArgumentParser(description="Check per flow step call budgets")
+    parser.add_argument("--redis-url", help="Use a real Redis instead of the in-memory stand-in")
+    args = parser.parse_args(argv)
+
+    setup_django(args.redis_url)
+    rows = check_budgets(get_step_budgets())
+
+    width = max(len(row["name"]) for row in rows)
+    for row in rows:
+        status = "OVER BUDGET" if row["violations"] else "ok"
+        print(f"{row['name']:<{width}}  {row['summary']}  {status}")
+        for violation in row["violations"]:
+            print(f"{'':<{width}}    {violation}")
+
+    return 1 if any(row["violations"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
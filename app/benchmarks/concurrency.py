@@ -0,0 +1,171 @@
+"""Concurrent request stress test
+
+Runs many conversations through the webhook flow at once from a thread pool,
+the way gthread (and, with greenlets, gevent) workers serve requests, and
+checks that concurrency changes nothing:
+- Every conversation ends on the component its step leads to
+- Every conversation gets exactly the replies a one-at-a-time run sends it,
+  addressed to its own number
+
+Each reply waits a simulated Graph API round trip, so the run also measures
+throughput per thread count next to the sync worker count that would match it
+(a sync worker serves one request at a time, like one thread here).
+
+Usage (from the app directory):
+    python -m benchmarks.concurrency
+    python -m benchmarks.concurrency --threads 1 8 32 --conversations 300 --latency-ms 50
+"""
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .environment import setup_django
+
+# (component, awaiting input, payload builder, component the step ends on)
+STEPS = (
+    ("AccountDashboard", False, lambda channel_id: ("text", "ok"), "AccountDashboard"),
+    ("AccountDashboard", True, lambda channel_id: ("list_reply", "offer_secured"), "AmountInput"),
+    ("AmountInput", True, lambda channel_id: ("text", "5 USD"), "HandleInput"),
+)
+
+PATHS = {"AccountDashboard": "account", "AmountInput": "offer_secured"}
+
+
+def plan_conversations(count: int) -> List[Tuple[str, int]]:
+    """Channel ID and step index of each conversation"""
+    return [(f"2637{index:08d}", index % len(STEPS)) for index in range(count)]
+
+
+def seed_conversations(conversations: List[Tuple[str, int]]) -> Dict[str, bytes]:
+    """Write each conversation's state and return its webhook body"""
+    from .environment import (build_dashboard, list_reply_payload,
+                              seed_state, text_payload)
+
+    bodies = {}
+    for index, (channel_id, step) in enumerate(conversations):
+        component, awaiting, payload, _ = STEPS[step]
+        seed_state(
+            {"path": PATHS[component], "component": component, "awaiting_input": awaiting},
+            dashboard=build_dashboard(seed=index),
+            channel_id=channel_id
+        )
+        kind, value = payload(channel_id)
+        body = text_payload(value, channel_id) if kind == "text" else list_reply_payload(value, channel_id=channel_id)
+        bodies[channel_id] = json.dumps(body).encode()
+    return bodies
+
+
+def step_runner(latency: float) -> Callable[[str, bytes], Tuple[Optional[str], List[Dict[str, Any]]]]:
+    """Build a function running one webhook body through the flow"""
+    from core.messaging.service import MessagingService
+    from core.state.manager import StateManager
+    from services.whatsapp.flow_processor import WhatsAppFlowProcessor
+    from services.whatsapp.inbound import parse_webhook
+    from services.whatsapp.state_manager import \
+        StateManager as WhatsAppStateManager
+
+    from .environment import get_recording_service_class
+
+    recording_class = get_recording_service_class()
+
+    class SlowRecordingService(recording_class):
+        """Recording service whose sends take a Graph API round trip"""
+
+        def _record(self, message, whatsapp_message):
+            time.sleep(latency)
+            return recording_class._record(self, message, whatsapp_message)
+
+        _handle_mock_send = _record
+        _handle_production_send = _record
+
+    def run(channel_id: str, body: bytes) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        event = parse_webhook(body)
+        state_manager = WhatsAppStateManager(StateManager(f"channel:{channel_id}"))
+        state_manager.initialize_channel(channel_type="whatsapp", channel_id=channel_id, mock_testing=False)
+        channel_service = SlowRecordingService()
+        service = MessagingService(channel_service=channel_service, state_manager=state_manager)
+        WhatsAppFlowProcessor(service, state_manager).process_message(event)
+        return state_manager.get_component(), channel_service.sent
+
+    return run
+
+
+def run_stress(threads: int, conversations: int, latency: float, expected: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Process conversations on a thread pool and check every result
+
+    Args:
+        threads: Concurrent requests
+        conversations: Number of conversations, one message each
+        latency: Seconds each outbound message takes
+        expected: Per-conversation (component, replies) of a reference run
+
+    Returns:
+        Dict with elapsed time, throughput, results and any mismatches
+    """
+    plan = plan_conversations(conversations)
+    bodies = seed_conversations(plan)
+    run = step_runner(latency)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="stress") as executor:
+        futures = {channel_id: executor.submit(run, channel_id, bodies[channel_id]) for channel_id, _ in plan}
+        results = {channel_id: future.result() for channel_id, future in futures.items()}
+    elapsed = time.perf_counter() - started
+
+    problems = []
+    for channel_id, step in plan:
+        component, sent = results[channel_id]
+        if component != STEPS[step][3]:
+            problems.append(f"{channel_id} ended on {component}, expected {STEPS[step][3]}")
+        if not sent or any(payload.get("to") != channel_id for payload in sent):
+            problems.append(f"{channel_id} replies went to {[payload.get('to') for payload in sent]}")
+        if expected is not None and results[channel_id] != expected[channel_id]:
+            problems.append(f"{channel_id} replies differ from the one-at-a-time run")
+
+    return {
+        "threads": threads,
+        "elapsed": elapsed,
+        "per_second": conversations / elapsed,
+        "results": results,
+        "problems": problems
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the stress test at each thread count"""
+    parser = argparse.ArgumentParser(description="Concurrent webhook stress test")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--conversations", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated Graph API round trip")
+    parser.add_argument("--redis-url", help="Use a real Redis instead of the in-memory stand-in")
+    args = parser.parse_args(argv)
+
+    setup_django(args.redis_url)
+    latency = args.latency_ms / 1000
+
+    reference = run_stress(1, args.conversations, latency)
+    single_rate = reference["per_second"]
+    runs = [reference] + [
+        run_stress(threads, args.conversations, latency, expected=reference["results"])
+        for threads in args.threads if threads != 1
+    ]
+
+    print(f"{args.conversations} conversations, {args.latency_ms:g} ms per outbound message")
+    print(f"{'threads':>7}  {'elapsed':>8}  {'msgs/s':>8}  {'sync workers to match':>21}  result")
+    for run in runs:
+        status = "ok" if not run["problems"] else f"{len(run['problems'])} PROBLEMS"
+        print(
+            f"{run['threads']:>7}  {run['elapsed']:>7.2f}s  {run['per_second']:>8.1f}  "
+            f"{run['per_second'] / single_rate:>21.1f}  {status}"
+        )
+        for problem in run["problems"][:10]:
+            print(f"           {problem}")
+
+    return 1 if any(run["problems"] for run in runs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,468 @@
+"""Benchmark environment
+
+This module prepares a self-contained environment for benchmarks:
+- Django settings with safe defaults for required env vars
+- In-memory Redis stand-in supporting the pipeline/watch operations RedisAtomic uses,
+  reporting the same round trips to call budgets as redis-py would
+- State storage on any backend (redis through the stand-in, memory, sqlite)
+- Recording WhatsApp service that captures payloads instead of posting them
+- Local keep-alive HTTP sink standing in for the Graph API
+- Deterministic fixtures (dashboards, webhook payloads, seeded state)
+"""
+import json
+import os
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from core.monitoring.call_budget import payload_size, record_http_call, record_redis
+
+# Required settings for importing the app outside docker. Real values from
+# the environment always win.
+BENCHMARK_ENV = {
+    "DJANGO_SETTINGS_MODULE": "config.settings",
+    "DJANGO_SECRET": "benchmark-secret",
+    "APP_LOG_LEVEL": "WARNING",
+    "MYCREDEX_APP_URL": "http://localhost:5000/",
+    "CLIENT_API_KEY": "benchmark-client-key",
+    "JWT_SECRET": "benchmark-jwt-secret",
+    "WHATSAPP_PHONE_NUMBER_ID": "390447444143042",
+    "WHATSAPP_ACCESS_TOKEN": "benchmark-access-token",
+    "WHATSAPP_API_URL": "http://localhost:9/",
+}
+
+CHANNEL_ID = "263778177125"
+
+_redis_client = None
+
+
+def _resp_length(*args: Any) -> int:
+    """Length of a command encoded with the Redis protocol"""
+    total = len(f"*{len(args)}\r\n")
+    for arg in args:
+        size = len(str(arg).encode())
+        total += len(f"${size}\r\n") + size + 2
+    return total
+
+
+class InMemoryPipeline:
+    """Pipeline stand-in with optimistic locking semantics
+
+    Commands issued before multi() run immediately (like redis-py after watch),
+    commands issued after multi() are buffered until execute(). If a watched
+    key changed in between, execute() raises WatchError.
+
+    Wire activity is reported to call budgets as redis-py sends it: WATCH,
+    MULTI..EXEC in one round trip, then UNWATCH when the pipeline resets.
+    """
+
+    def __init__(self, store: "InMemoryRedis"):
+        self._store = store
+        self._buffer: List[tuple] = []
+        self._watched: Dict[str, int] = {}
+        self._in_multi = False
+
+    def watch(self, *keys: str) -> None:
+        record_redis(commands=1, round_trips=1, bytes_sent=_resp_length("WATCH", *keys))
+        for key in keys:
+            self._watched[key] = self._store._versions.get(key, 0)
+
+    def multi(self) -> None:
+        self._in_multi = True
+
+    def _queue(self, command: str, *args: Any) -> Any:
+        if self._in_multi:
+            self._buffer.append((command, args))
+            return self
+        return self._store._run(command, *args)
+
+    def get(self, key: str) -> Any:
+        return self._queue("get", key)
+
+    def setex(self, key: str, ttl: int, value: str) -> Any:
+        return self._queue("setex", key, ttl, value)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None) -> Any:
+        return self._queue("set", key, value, ex)
+
+    def delete(self, *keys: str) -> Any:
+        return self._queue("delete", *keys)
+
+    def execute(self) -> List[Any]:
+        from redis import WatchError
+
+        record_redis(
+            commands=len(self._buffer) + 2,
+            round_trips=1,
+            bytes_sent=(
+                _resp_length("MULTI") + _resp_length("EXEC")
+                + sum(_resp_length(command.upper(), *args) for command, args in self._buffer)
+            )
+        )
+        with self._store._lock:
+            for key, version in self._watched.items():
+                if self._store._versions.get(key, 0) != version:
+                    raise WatchError(f"Watched key changed: {key}")
+            results = [getattr(self._store, f"_{command}")(*args) for command, args in self._buffer]
+        record_redis(bytes_received=payload_size(results))
+        self.reset()
+        return results
+
+    def reset(self) -> None:
+        if self._watched:
+            record_redis(commands=1, round_trips=1, bytes_sent=_resp_length("UNWATCH"))
+        self._buffer = []
+        self._watched = {}
+        self._in_multi = False
+
+
+class InMemoryRedis:
+    """Minimal in-process Redis stand-in for benchmarks
+
+    Stores decoded strings (matching decode_responses=True) and ignores TTLs.
+    Commands called on the client are reported to call budgets as one round
+    trip each.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, str] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def _touch(self, key: str) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _run(self, command: str, *args: Any) -> Any:
+        """Run a command and report it like redis-py sends it"""
+        result = getattr(self, f"_{command}")(*args)
+        record_redis(
+            commands=1,
+            round_trips=1,
+            bytes_sent=_resp_length(command.upper(), *args),
+            bytes_received=payload_size(result)
+        )
+        return result
+
+    def pipeline(self, transaction: bool = True) -> InMemoryPipeline:
+        return InMemoryPipeline(self)
+
+    def watch(self, *keys: str) -> None:
+        """Present for interface checks; watching happens on pipelines"""
+
+    def get(self, key: str) -> Optional[str]:
+        return self._run("get", key)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        return self._run("set", key, value, ex)
+
+    def setex(self, key: str, ttl: int, value: str) -> bool:
+        return self._run("setex", key, ttl, value)
+
+    def delete(self, *keys: str) -> int:
+        return self._run("delete", *keys)
+
+    def _get(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    def _set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        with self._lock:
+            self._data[key] = value
+            self._touch(key)
+        return True
+
+    def _setex(self, key: str, ttl: int, value: str) -> bool:
+        return self._set(key, value, ttl)
+
+    def _delete(self, *keys: str) -> int:
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    removed += 1
+                self._touch(key)
+        return removed
+
+    def ping(self) -> bool:
+        return True
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            for key in list(self._data):
+                self._touch(key)
+            self._data.clear()
+        return True
+
+
+_http_sink_url = None
+
+
+def get_http_sink_url() -> str:
+    """Start (once) a local HTTP/1.1 server that answers like the Graph API
+
+    Returns:
+        URL to POST messages to
+    """
+    global _http_sink_url
+    if _http_sink_url is None:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        body = json.dumps({"messaging_product": "whatsapp", "messages": [{"id": "wamid.sink"}]}).encode()
+
+        class SinkHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), SinkHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        _http_sink_url = f"http://127.0.0.1:{server.server_address[1]}/messages"
+    return _http_sink_url
+
+
+def setup_django(redis_url: Optional[str] = None, state_backend: str = "redis"):
+    """Configure Django and route state storage to the benchmark backend
+
+    Args:
+        redis_url: Optional real Redis URL; defaults to the in-memory stand-in
+        state_backend: State storage backend (redis, memory, sqlite); memory
+            and sqlite measure flow cost without any Redis round trips
+
+    Returns:
+        Redis client used for redis state storage
+    """
+    global _redis_client
+
+    for key, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(key, value)
+
+    import django
+    django.setup()
+
+    if redis_url:
+        import redis
+
+        from core.monitoring.call_budget import CountingConnectionPool
+        _redis_client = redis.Redis(
+            connection_pool=CountingConnectionPool.from_url(redis_url, decode_responses=True)
+        )
+    else:
+        _redis_client = InMemoryRedis()
+
+    # State storage resolves its backend and Redis client through this module
+    import core.state.persistence.client as persistence_client
+    persistence_client.get_redis_client = get_redis_client
+    persistence_client.STATE_BACKEND = state_backend
+    persistence_client._storage = None
+    if state_backend == "sqlite":
+        import tempfile
+        persistence_client.STATE_SQLITE_PATH = os.path.join(tempfile.mkdtemp(prefix="benchmark-"), "state.sqlite3")
+
+    return _redis_client
+
+
+def get_redis_client():
+    """Redis client factory used by state storage during benchmarks"""
+    if _redis_client is None:
+        raise RuntimeError("Benchmark environment not initialized")
+    return _redis_client
+
+
+def get_recording_service_class():
+    """Build WhatsApp service subclass that records payloads instead of posting
+
+    Built lazily since the service module needs Django configured.
+    """
+    from datetime import datetime
+
+    from services.whatsapp.service import WhatsAppMessagingService
+
+    class RecordingWhatsAppService(WhatsAppMessagingService):
+        """WhatsApp service that keeps converted payloads in memory"""
+
+        def __init__(self):
+            super().__init__()
+            self.sent: List[Dict[str, Any]] = []
+
+        def _record(self, message, whatsapp_message: Dict) -> Any:
+            # Stands in for the Graph API call, so it counts as one
+            record_http_call("whatsapp")
+            self.sent.append(whatsapp_message)
+            message.metadata = {
+                "sent_at": datetime.utcnow().isoformat(),
+                "status_code": 200
+            }
+            return message
+
+        _handle_mock_send = _record
+        _handle_production_send = _record
+
+    return RecordingWhatsAppService
+
+
+def build_dashboard(accounts: int = 2, offers_per_account: int = 5, seed: int = 7) -> Dict[str, Any]:
+    """Build deterministic dashboard matching credex-core response shape
+
+    Args:
+        accounts: Number of accounts (first is PERSONAL)
+        offers_per_account: Pending offers in each direction per account
+        seed: Random seed for reproducible amounts
+
+    Returns:
+        Dashboard dict
+    """
+    rng = random.Random(seed)
+    denoms = ["USD", "CAD", "ZWG", "XAU", "CXX"]
+
+    def offer(index: int, direction: str) -> Dict[str, Any]:
+        amount = rng.randint(1, 99999) / 100
+        denom = denoms[index % len(denoms)]
+        sign = "" if direction == "in" else "-"
+        return {
+            "credexID": f"{direction}-{index:04d}-{rng.getrandbits(32):08x}",
+            "formattedInitialAmount": f"{sign}{amount:.2f} {denom}",
+            "counterpartyAccountName": f"Counterparty {index}",
+            "secured": True
+        }
+
+    account_list = []
+    for i in range(accounts):
+        account_list.append({
+            "accountID": f"acct-{i:04d}",
+            "accountName": "Personal" if i == 0 else f"Business {i}",
+            "accountHandle": f"member{i}",
+            "accountType": "PERSONAL" if i == 0 else "BUSINESS",
+            "defaultDenom": "USD",
+            "isOwnedAccount": True,
+            "balanceData": {
+                "securedNetBalancesByDenom": [f"{rng.randint(1, 9999)}.00 USD", f"{rng.randint(1, 9999)}.00 ZWG"],
+                "unsecuredBalancesInDefaultDenom": {
+                    "totalPayables": "0.00 USD",
+                    "totalReceivables": "0.00 USD",
+                    "netPayRec": "0.00 USD"
+                },
+                "netCredexAssetsInDefaultDenom": f"{rng.randint(1, 9999)}.00 USD"
+            },
+            "pendingInData": [offer(n, "in") for n in range(offers_per_account)],
+            "pendingOutData": [offer(n, "out") for n in range(offers_per_account)],
+        })
+
+    return {
+        "member": {
+            "memberID": "member-0001",
+            "memberTier": 1,
+            "firstname": "Bench",
+            "lastname": "Mark",
+            "memberHandle": "member0",
+            "defaultDenom": "USD",
+            "remainingAvailableUSD": 10.0
+        },
+        "accounts": account_list
+    }
+
+
+def seed_state(
+    component_data: Dict[str, Any],
+    dashboard: Optional[Dict[str, Any]] = None,
+    channel_id: str = CHANNEL_ID,
+    mock_testing: bool = False
+) -> str:
+    """Write a complete member state directly to state storage
+
+    Args:
+        component_data: Flow state (path, component, awaiting_input, data)
+        dashboard: Optional dashboard; defaults to a small one
+        channel_id: Channel identifier
+        mock_testing: Mock testing flag
+
+    Returns:
+        Key used for the state
+    """
+    dashboard = dashboard if dashboard is not None else build_dashboard()
+    state = {
+        "channel": {"type": "whatsapp", "identifier": channel_id},
+        "mock_testing": mock_testing,
+        "auth": {"token": "benchmark.jwt.token"},
+        "dashboard": dashboard,
+        "active_account_id": dashboard["accounts"][0]["accountID"],
+        "action": {
+            "id": "action-0001",
+            "type": "MEMBER_DASHBOARD_RETRIEVED",
+            "timestamp": "2024-01-01T00:00:00Z",
+            "actor": "member-0001",
+            "details": {}
+        },
+        "component_data": {
+            "path": "",
+            "component": "",
+            "data": {},
+            "component_result": None,
+            "awaiting_input": False,
+            **component_data
+        }
+    }
+    key = f"channel:{channel_id}"
+    store_state(key, state)
+    return key
+
+
+def store_state(key: str, state: Dict[str, Any], ttl: int = 300) -> None:
+    """Write a state to the configured state storage"""
+    from core.state.persistence.client import get_state_storage
+
+    success, _, error = get_state_storage().execute_atomic(key, "set", value=state, ttl=ttl)
+    if not success:
+        raise RuntimeError(f"Could not store benchmark state: {error}")
+
+
+def webhook_value(channel_id: str, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a message in a WhatsApp webhook payload"""
+    return {
+        "object": "whatsapp_business_account",
+        "entry": [{
+            "id": "WHATSAPP_BUSINESS_ACCOUNT_ID",
+            "changes": [{
+                "value": {
+                    "messaging_product": "whatsapp",
+                    "metadata": {
+                        "display_phone_number": "263787274250",
+                        "phone_number_id": BENCHMARK_ENV["WHATSAPP_PHONE_NUMBER_ID"]
+                    },
+                    "contacts": [{"profile": {"name": "Bench Mark"}, "wa_id": channel_id}],
+                    "messages": [{
+                        "from": channel_id,
+                        "id": "wamid.benchmark",
+                        "timestamp": "1704067200",
+                        **message
+                    }]
+                },
+                "field": "messages"
+            }]
+        }]
+    }
+
+
+def text_payload(body: str, channel_id: str = CHANNEL_ID) -> Dict[str, Any]:
+    """Build text message webhook payload"""
+    return webhook_value(channel_id, {"type": "text", "text": {"body": body}})
+
+
+def list_reply_payload(selection_id: str, title: str = "", channel_id: str = CHANNEL_ID) -> Dict[str, Any]:
+    """Build list reply webhook payload"""
+    return webhook_value(channel_id, {
+        "type": "interactive",
+        "interactive": {
+            "type": "list_reply",
+            "list_reply": {"id": selection_id, "title": title or selection_id}
+        }
+    })
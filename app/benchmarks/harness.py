@@ -0,0 +1,218 @@
+"""Benchmark harness
+
+This module provides the timing and reporting pieces of the suite:
+- Case registry populated by the @benchmark decorator
+- Timing with optional untimed per-iteration setup
+- JSON reports and comparison against a saved baseline
+"""
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+# Registered benchmark cases in definition order
+CASES: List["Case"] = []
+
+
+@dataclass
+class Case:
+    """A single benchmark case
+
+    Attributes:
+        name: Dotted case name (group.case)
+        func: Callable under test; receives the setup result if setup is given
+        setup: Optional untimed callable run before every timed call
+        number: Calls per timed sample (ignored when setup is given)
+        repeat: Number of samples
+        description: Short human readable description
+    """
+    name: str
+    func: Callable[..., Any]
+    setup: Optional[Callable[[], Any]] = None
+    number: int = 1000
+    repeat: int = 7
+    description: str = ""
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+def benchmark(
+    name: str,
+    number: int = 1000,
+    repeat: int = 7,
+    setup: Optional[Callable[[], Any]] = None,
+    **params: Any
+) -> Callable:
+    """Register a function as a benchmark case
+
+    Args:
+        name: Dotted case name
+        number: Calls per sample when no setup is given
+        repeat: Number of samples
+        setup: Optional untimed per-call setup; its result is passed to the case
+        **params: Fixture parameters recorded in the report
+    """
+    def decorator(func: Callable) -> Callable:
+        CASES.append(Case(
+            name=name,
+            func=func,
+            setup=setup,
+            number=number,
+            repeat=repeat,
+            description=(func.__doc__ or "").strip().split("\n")[0],
+            params=params
+        ))
+        return func
+    return decorator
+
+
+def _time_case(case: Case, scale: float) -> List[float]:
+    """Collect per-call timings in nanoseconds"""
+    samples = []
+    repeat = max(3, int(case.repeat * scale)) if scale < 1 else case.repeat
+
+    if case.setup is not None:
+        # Per-call timing with untimed setup between calls
+        calls = max(5, int(case.number * scale))
+        for _ in range(repeat):
+            total = 0
+            for _ in range(calls):
+                arg = case.setup()
+                start = time.perf_counter_ns()
+                case.func(arg)
+                total += time.perf_counter_ns() - start
+            samples.append(total / calls)
+        return samples
+
+    number = max(1, int(case.number * scale))
+    func = case.func
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter_ns() - start) / number)
+    return samples
+
+
+def run_case(case: Case, scale: float = 1.0) -> Dict[str, Any]:
+    """Run a case with a warmup and return timing statistics
+
+    Args:
+        case: Case to run
+        scale: Multiplier for call counts (e.g. 0.1 for a quick run)
+
+    Returns:
+        Dict with per-call statistics in nanoseconds
+    """
+    # Warm caches and lazy imports before measuring
+    arg = case.setup() if case.setup is not None else None
+    case.func(arg) if case.setup is not None else case.func()
+
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        samples = _time_case(case, scale)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    median = statistics.median(samples)
+    return {
+        "description": case.description,
+        "params": case.params,
+        "samples": len(samples),
+        "min_ns": min(samples),
+        "median_ns": median,
+        "mean_ns": statistics.fmean(samples),
+        "stdev_ns": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "max_ns": max(samples),
+        "ops_per_sec": 1e9 / median if median else None
+    }
+
+
+def _git_revision() -> Optional[str]:
+    """Get current git revision if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def build_report(results: Dict[str, Dict[str, Any]], backend: str, state_backend: str = "redis") -> Dict[str, Any]:
+    """Wrap results with metadata needed for fair comparison"""
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "redis_backend": backend,
+            "state_backend": state_backend
+        },
+        "results": results
+    }
+
+
+def format_ns(value: float) -> str:
+    """Format nanoseconds with a readable unit"""
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} ms"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} µs"
+    return f"{value:.0f} ns"
+
+
+def compare_reports(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float
+) -> List[Dict[str, Any]]:
+    """Compare median timings against a baseline report
+
+    Args:
+        current: Current report
+        baseline: Baseline report
+        threshold: Relative slowdown (e.g. 0.1 for 10%) that counts as a regression
+
+    Returns:
+        List of comparison rows for cases present in both reports
+    """
+    rows = []
+    baseline_results = baseline.get("results", {})
+    for name, result in current.get("results", {}).items():
+        previous = baseline_results.get(name)
+        if not previous:
+            continue
+        change = (result["median_ns"] - previous["median_ns"]) / previous["median_ns"]
+        rows.append({
+            "name": name,
+            "baseline_ns": previous["median_ns"],
+            "current_ns": result["median_ns"],
+            "change": change,
+            "regression": change > threshold
+        })
+    return rows
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """Load a JSON report from disk"""
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    """Write a JSON report to disk"""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
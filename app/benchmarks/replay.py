@@ -0,0 +1,383 @@
+"""Recorded traffic replay
+
+Drives a recording made with TRAFFIC_RECORD_PATH (see core.monitoring.traffic)
+back through WhatsAppFlowProcessor:
+- Each conversation starts from the state recorded before its first message,
+  in the in-memory Redis stand-in, a real Redis or another state backend
+- Credex core API calls are answered with the recorded responses, in order,
+  per conversation and endpoint; WhatsApp sends are captured, not posted
+- Messages are dispatched on their recorded schedule (or faster, or as fast
+  as possible), each conversation's in order on one worker thread
+
+The report compares the replay with the recording: processing latency,
+queueing behind the schedule, replies sent per conversation and the stored
+state size after each message. Scrubbing changes the length of names and
+tokens, so state sizes are best compared between builds (--json/--compare)
+rather than with the recording itself. Status callbacks are not recorded.
+
+Usage (from the app directory):
+    python -m benchmarks.replay traffic.ndjson
+    python -m benchmarks.replay traffic.ndjson --speed 10 --threads 8 --json build.json
+    python -m benchmarks.replay traffic.ndjson --speed 0 --compare build.json
+"""
+import argparse
+import json
+import queue
+import statistics
+import sys
+import threading
+import time
+import zlib
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.monitoring.traffic import TOKEN_PLACEHOLDER
+
+from .environment import setup_django
+
+# Report fields compared against a baseline, and whether lower is better
+COMPARED = (
+    ("replay_p50_ms", True),
+    ("replay_p95_ms", True),
+    ("replay_p99_ms", True),
+    ("lag_p95_ms", True),
+    ("state_bytes_mean", True),
+    ("sends", None),
+    ("unmatched_api_calls", True),
+    ("errors", True),
+)
+
+
+def load_recording(path: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Read a recording into webhooks, API responses and send counts
+
+    Args:
+        path: NDJSON recording
+        limit: Only the first this many webhooks (and their API responses)
+
+    Returns:
+        Dict with webhooks (in time order), the first recorded state of each
+        conversation, responses by (channel, endpoint) and sends by channel
+    """
+    entries = []
+    with open(path, encoding="utf-8") as recording:
+        for line in recording:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # Partial line from an interrupted write
+    entries.sort(key=lambda entry: entry["t"])
+
+    webhooks = [entry for entry in entries if entry["kind"] == "webhook"]
+    if limit is not None and len(webhooks) > limit:
+        webhooks = webhooks[:limit]
+        cutoff = webhooks[-1]["t"] + webhooks[-1]["ms"] / 1000
+        entries = [entry for entry in entries if entry["t"] <= cutoff]
+
+    states: Dict[str, Dict[str, Any]] = {}
+    for webhook in webhooks:
+        if "state" in webhook and webhook["channel"] not in states:
+            states[webhook["channel"]] = webhook["state"]
+
+    responses: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+    sends: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        if entry["kind"] == "credex":
+            responses[(entry["channel"], entry["endpoint"])].append(entry)
+        elif entry["kind"] == "send" and entry["channel"]:
+            sends[entry["channel"]] += 1
+
+    return {"webhooks": webhooks, "states": states, "responses": responses, "sends": sends}
+
+
+def mint_token() -> str:
+    """JWT the application accepts, standing in for scrubbed tokens"""
+    from decouple import config
+    from jwt import encode
+
+    return encode({"exp": int(time.time()) + 86400}, config("JWT_SECRET"), algorithm="HS256")
+
+
+def restore_tokens(value: Any, token: str) -> Any:
+    """Copy of a recorded value with token placeholders replaced by token"""
+    if isinstance(value, dict):
+        return {key: restore_tokens(item, token) for key, item in value.items()}
+    if isinstance(value, list):
+        return [restore_tokens(item, token) for item in value]
+    return token if value == TOKEN_PLACEHOLDER else value
+
+
+class RecordedCredexApi:
+    """Stands in for the requests module in core.api.base
+
+    Answers each request with the next recorded response for the current
+    conversation and endpoint.
+    """
+
+    def __init__(self, responses: Dict[Tuple[str, str], Deque[Dict[str, Any]]], token: str):
+        self.responses = responses
+        self.token = token
+        self.unmatched = 0
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, **kwargs: Any):
+        import requests
+        from core.monitoring.metrics import endpoint_label
+        from core.monitoring.traffic import current_channel
+
+        key = (current_channel(), endpoint_label(url))
+        with self._lock:
+            pending = self.responses.get(key)
+            entry = pending.popleft() if pending else None
+            if entry is None:
+                self.unmatched += 1
+
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "application/json"
+        if entry is None:
+            response.status_code = 500
+            response._content = json.dumps({"message": f"No recorded response for {key[1]}"}).encode()
+        else:
+            response.status_code = entry["status"]
+            response._content = json.dumps(restore_tokens(entry["response"], self.token)).encode()
+        return response
+
+
+def seed_states(states: Dict[str, Dict[str, Any]], token: str) -> None:
+    """Write each conversation's recorded starting state"""
+    from .environment import store_state
+
+    for channel, state in states.items():
+        if state:
+            store_state(f"channel:{channel}", restore_tokens(state, token))
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def replay(recording: Dict[str, Any], speed: float, threads: int) -> Dict[str, Any]:
+    """Replay a loaded recording
+
+    Args:
+        recording: Result of load_recording()
+        speed: Schedule speed-up (1 is as recorded, 0 is as fast as possible)
+        threads: Worker threads; each conversation stays on one
+
+    Returns:
+        Report dict
+    """
+    import core.api.base as api_base
+    from core.messaging.service import MessagingService
+    from core.monitoring.traffic import reset_channel, set_channel
+    from core.state.manager import StateManager
+    from services.whatsapp.flow_processor import WhatsAppFlowProcessor
+    from services.whatsapp.inbound import parse_webhook
+    from services.whatsapp.state_manager import \
+        StateManager as WhatsAppStateManager
+
+    from .environment import get_recording_service_class
+
+    token = mint_token()
+    seed_states(recording["states"], token)
+    credex_api = RecordedCredexApi(recording["responses"], token)
+    recording_class = get_recording_service_class()
+
+    results: List[Dict[str, Any]] = []
+    sends: Dict[str, int] = defaultdict(int)
+    results_lock = threading.Lock()
+
+    def process(webhook: Dict[str, Any], due: float) -> None:
+        channel = webhook["channel"]
+        started = time.perf_counter()
+        result = {"recorded_ms": webhook["ms"], "recorded_state_bytes": webhook["state_bytes"],
+                  "lag_ms": (started - due) * 1000, "error": None}
+        channel_token = set_channel(channel)
+        try:
+            event = parse_webhook(json.dumps(webhook["body"]).encode())
+            core_state_manager = StateManager(f"channel:{channel}")
+            state_manager = WhatsAppStateManager(core_state_manager)
+            state_manager.initialize_channel(channel_type="whatsapp", channel_id=channel, mock_testing=False)
+            channel_service = recording_class()
+            service = MessagingService(channel_service=channel_service, state_manager=state_manager)
+            WhatsAppFlowProcessor(service, state_manager).process_message(event)
+            result["ms"] = (time.perf_counter() - started) * 1000
+            result["state_bytes"] = len(StateManager(f"channel:{channel}").serialized_state())
+            sent = len(channel_service.sent)
+        except Exception as e:
+            result["ms"] = (time.perf_counter() - started) * 1000
+            result["error"] = f"{channel}: {e}"
+            sent = 0
+        finally:
+            reset_channel(channel_token)
+        with results_lock:
+            results.append(result)
+            sends[channel] += sent
+
+    def worker(inbox: "queue.Queue") -> None:
+        while True:
+            item = inbox.get()
+            if item is None:
+                return
+            process(*item)
+
+    inboxes = [queue.Queue() for _ in range(threads)]
+    workers = [threading.Thread(target=worker, args=(inbox,), daemon=True) for inbox in inboxes]
+
+    original_requests = api_base.requests
+    api_base.requests = credex_api
+    try:
+        for thread in workers:
+            thread.start()
+        webhooks = recording["webhooks"]
+        first_at = webhooks[0]["t"] if webhooks else 0
+        started = time.perf_counter()
+        for webhook in webhooks:
+            due = started + ((webhook["t"] - first_at) / speed if speed else 0)
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            inbox = inboxes[zlib.crc32(webhook["channel"].encode()) % threads]
+            inbox.put((webhook, due if speed else time.perf_counter()))
+        for inbox in inboxes:
+            inbox.put(None)
+        for thread in workers:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        api_base.requests = original_requests
+
+    return summarize(results, sends, recording["sends"], credex_api.unmatched, elapsed, speed, threads)
+
+
+def summarize(
+    results: List[Dict[str, Any]],
+    sends: Dict[str, int],
+    recorded_sends: Dict[str, int],
+    unmatched: int,
+    elapsed: float,
+    speed: float,
+    threads: int
+) -> Dict[str, Any]:
+    """Reduce per-message results to the report"""
+    replayed = [result["ms"] for result in results]
+    recorded = [result["recorded_ms"] for result in results]
+    lags = [max(result["lag_ms"], 0) for result in results]
+    sizes = [result["state_bytes"] for result in results if "state_bytes" in result]
+    drift = [
+        result["state_bytes"] - result["recorded_state_bytes"] for result in results if "state_bytes" in result
+    ]
+    errors = [result["error"] for result in results if result["error"]]
+    send_mismatches = sorted(
+        channel for channel in set(sends) | set(recorded_sends)
+        if channel in sends and sends[channel] != recorded_sends.get(channel, 0)
+    )
+
+    report = {
+        "messages": len(results),
+        "speed": speed,
+        "threads": threads,
+        "elapsed_s": elapsed,
+        "per_second": len(results) / elapsed if elapsed else 0.0,
+        "sends": sum(sends.values()),
+        "recorded_sends": sum(recorded_sends[channel] for channel in sends),
+        "send_mismatches": send_mismatches,
+        "state_bytes_mean": statistics.fmean(sizes) if sizes else 0.0,
+        "state_drift_mean": statistics.fmean(drift) if drift else 0.0,
+        "state_drift_max": max(drift, key=abs) if drift else 0,
+        "unmatched_api_calls": unmatched,
+        "errors": len(errors),
+        "error_samples": errors[:10],
+    }
+    for name, values in (("replay", replayed), ("recorded", recorded), ("lag", lags)):
+        for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            report[f"{name}_{label}_ms"] = percentile(values, fraction)
+        report[f"{name}_max_ms"] = max(values) if values else 0.0
+    return report
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    """Human-readable report"""
+    speed = f"{report['speed']:g}x" if report["speed"] else "as fast as possible"
+    lines = [
+        f"Replayed {report['messages']} messages at {speed} on {report['threads']} threads "
+        f"in {report['elapsed_s']:.2f}s ({report['per_second']:.1f} msgs/s)",
+        "",
+        f"  {'latency':<10} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}",
+    ]
+    for name in ("replay", "recorded", "lag"):
+        lines.append(
+            f"  {name:<10} " + " ".join(
+                f"{report[f'{name}_{label}_ms']:>7.2f}ms" for label in ("p50", "p95", "p99", "max")
+            )
+        )
+    lines += [
+        "",
+        f"  Sends: {report['sends']} replayed, {report['recorded_sends']} recorded, "
+        f"{len(report['send_mismatches'])} conversations differ",
+        f"  State size: {report['state_bytes_mean']:.0f} bytes mean, drift from recording "
+        f"{report['state_drift_mean']:+.0f} mean, {report['state_drift_max']:+d} max",
+        f"  Unmatched API calls: {report['unmatched_api_calls']}, errors: {report['errors']}",
+    ]
+    for error in report["error_samples"]:
+        lines.append(f"    {error}")
+    return lines
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Metric changes from a baseline report"""
+    lines = [f"  {'metric':<22} {'baseline':>12} {'this build':>12} {'change':>9}"]
+    for field, lower_is_better in COMPARED:
+        before, after = baseline.get(field, 0), report.get(field, 0)
+        change = (after - before) / before if before else 0.0
+        marker = ""
+        if lower_is_better is not None and abs(change) >= 0.1:
+            marker = "  worse" if (change > 0) == lower_is_better else "  better"
+        lines.append(f"  {field:<22} {before:>12.2f} {after:>12.2f} {change:>+8.1%}{marker}")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Replay a recording and print (and optionally save or compare) the report"""
+    parser = argparse.ArgumentParser(description="Recorded traffic replay")
+    parser.add_argument("recording", help="NDJSON file written with TRAFFIC_RECORD_PATH")
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="Schedule speed-up: 1 as recorded, 10 ten times faster, 0 as fast as possible")
+    parser.add_argument("--threads", type=int, default=4, help="Worker threads")
+    parser.add_argument("--limit", type=int, help="Replay only the first N messages")
+    parser.add_argument("--redis-url", help="Use a real Redis instead of the in-memory stand-in")
+    parser.add_argument("--state-backend", choices=("redis", "memory", "sqlite"), default="redis",
+                        help="State storage backend")
+    parser.add_argument("--json", dest="json_path", help="Write the report as JSON")
+    parser.add_argument("--compare", help="Baseline report (from --json) to compare with")
+    args = parser.parse_args(argv)
+
+    setup_django(args.redis_url, args.state_backend)
+    recording = load_recording(args.recording, args.limit)
+    if not recording["webhooks"]:
+        print(f"No messages in {args.recording}")
+        return 1
+
+    report = replay(recording, args.speed, max(args.threads, 1))
+    print("\n".join(format_report(report)))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            print()
+            print(f"Against {args.compare}:")
+            print("\n".join(compare(report, json.load(baseline))))
+
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Startup profile
+
+Two reports on what a new worker pays before it serves like a warm one:
+- Import time: `python -X importtime` of loading the WSGI application,
+  digested into the packages and application modules that cost the most
+- First request: fresh processes load the application and run webhook steps
+  through the flow, without and with config.warmup, timing the first
+  request against the later ones
+
+Usage (from the app directory):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --top 15 --requests 200
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from .environment import BENCHMARK_ENV
+
+APP_PACKAGES = ("core", "services", "config")
+
+LOAD_APPLICATION = "from benchmarks.environment import setup_django; setup_django(); import config.wsgi"
+
+
+def _python(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the app directory"""
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**BENCHMARK_ENV, **os.environ, "PYTHONPATH": app_dir}
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        cwd=app_dir, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def parse_importtime(output: str) -> List[Tuple[str, int, int]]:
+    """(module, self µs, cumulative µs) of each `-X importtime` line"""
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        entries.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def import_report(top: int) -> List[str]:
+    """Digest of the application's import time"""
+    entries = [
+        entry for entry in parse_importtime(_python(LOAD_APPLICATION, "-X", "importtime").stderr)
+        if not entry[0].startswith("benchmarks")
+    ]
+    by_package: Dict[str, int] = defaultdict(int)
+    for module, self_us, _ in entries:
+        by_package[module.split(".")[0]] += self_us
+    total = sum(by_package.values())
+    app_modules = sorted(
+        (entry for entry in entries if entry[0].split(".")[0] in APP_PACKAGES),
+        key=lambda entry: entry[2], reverse=True
+    )
+
+    lines = [f"Import time: {total / 1000:.1f} ms over {len(entries)} modules", "", "Packages (own time):"]
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"  {package:<32} {self_us / 1000:>8.1f} ms  {self_us / total:>6.1%}")
+    lines += ["", "Application modules (including their imports):"]
+    for module, _, cumulative_us in app_modules[:top]:
+        lines.append(f"  {module:<48} {cumulative_us / 1000:>8.1f} ms")
+    return lines
+
+
+def child(warm: bool, requests: int) -> None:
+    """Load the application in this process and time webhook steps
+
+    Prints a JSON object with the load, warm-up and per-request seconds.
+    """
+    from .environment import setup_django
+
+    started = time.perf_counter()
+    setup_django()
+    import config.wsgi  # noqa: F401
+    loaded = time.perf_counter()
+
+    from config.warmup import warm_up
+    if warm:
+        warm_up()
+    warmed = time.perf_counter()
+
+    from .concurrency import seed_conversations, step_runner
+
+    # Dashboard selections: the dashboard handles the input, amount input sends its prompt
+    plan = [(f"2638{index:08d}", 1) for index in range(requests)]
+    bodies = seed_conversations(plan)
+    run = step_runner(0)
+    timings = []
+    for channel_id, _ in plan:
+        step_started = time.perf_counter()
+        run(channel_id, bodies[channel_id])
+        timings.append(time.perf_counter() - step_started)
+
+    print(json.dumps({"load": loaded - started, "warm_up": warmed - loaded, "requests": timings}))
+
+
+def first_request_report(requests: int) -> List[str]:
+    """First against later request latency in fresh processes"""
+    lines = [
+        f"First request after load ({requests} dashboard selections per process):",
+        f"  {'warm-up':<8} {'load':>9} {'warm-up':>9} {'1st':>9} {'2nd':>9} {'median':>9} {'last':>9}"
+    ]
+    for warm in (False, True):
+        output = _python(f"from benchmarks.startup import child; child({warm}, {requests})").stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings = result["requests"]
+        lines.append(
+            f"  {'yes' if warm else 'no':<8} {result['load'] * 1000:>7.1f}ms {result['warm_up'] * 1000:>7.1f}ms "
+            f"{timings[0] * 1000:>7.2f}ms {timings[1] * 1000:>7.2f}ms "
+            f"{statistics.median(timings[1:]) * 1000:>7.2f}ms {timings[-1] * 1000:>7.2f}ms"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Print the import-time digest and the first-request comparison"""
+    parser = argparse.ArgumentParser(description="Startup profile")
+    parser.add_argument("--top", type=int, default=10, help="Rows per import-time table")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per fresh process")
+    args = parser.parse_args(argv)
+
+    print("\n".join(import_report(args.top)))
+    print()
+    print("\n".join(first_request_report(max(args.requests, 2))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""Flow step call budgets enforced as tests
+
+Run from the app directory:
+    python -m pytest benchmarks
+"""
+import pytest
+
+from .environment import setup_django
+
+setup_django()
+
+from core.monitoring.call_budget import assert_call_budget  # noqa: E402
+
+from .budgets import get_step_budgets, run_step  # noqa: E402
+
+STEPS = get_step_budgets()
+
+
+@pytest.mark.parametrize("step", STEPS, ids=[step.name for step in STEPS])
+def test_step_within_budget(step):
+    run_step(step, lambda: assert_call_budget(step.name, **step.limits))
@@ -0,0 +1,15 @@
+import os
+
+from decouple import config
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+application = get_asgi_application()
+
+# Answer webhook POSTs without DRF and the middleware stack; flow work runs on
+# the flow thread pool so one process serves many conversations at once
+if config("WEBHOOK_FAST_PATH", default=True, cast=bool):
+    from core.api.webhook import AsyncWebhookApplication
+
+    application = AsyncWebhookApplication(application)
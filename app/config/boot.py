@@ -0,0 +1,117 @@
+"""Fast container boot
+
+Run by start_app.sh as `python -m config.boot` when FAST_BOOT=true, in place
+of the redis-cli polling loop, collectstatic and migrate:
+- Redis is probed in-process with short timeouts, every REDIS_PROBE_INTERVAL
+  seconds for up to REDIS_WAIT_SECONDS (skipped unless STATE_BACKEND=redis)
+- Data directories are created
+- The time of each phase since BOOT_STARTED_AT is printed; the gunicorn hooks
+  (config/gunicorn.py) continue the report up to the first serving worker
+
+Static files are collected into the image at build time and the app runs
+without a database (DATABASE_ENABLED=false), so nothing else is needed.
+Imports stay limited to redis-py and decouple to keep this step short.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import redis
+from decouple import config
+
+REDIS_URL = config("REDIS_URL", default="redis://redis-state:6379/0")
+STATE_BACKEND = config("STATE_BACKEND", default="redis")
+REDIS_WAIT_SECONDS = config("REDIS_WAIT_SECONDS", default=60, cast=float)
+REDIS_PROBE_INTERVAL = config("REDIS_PROBE_INTERVAL", default=0.25, cast=float)
+REDIS_PROBE_TIMEOUT = config("REDIS_PROBE_TIMEOUT", default=1.0, cast=float)
+
+
+def boot_started_at() -> float:
+    """Epoch time start_app.sh started, or now if it was not recorded"""
+    try:
+        return float(os.environ["BOOT_STARTED_AT"])
+    except (KeyError, ValueError):
+        return time.time()
+
+
+def report(phase: str, since: float, detail: str = "") -> None:
+    """Print a phase's duration and the time since boot started"""
+    now = time.time()
+    suffix = f" ({detail})" if detail else ""
+    print(
+        f"Boot phase {phase}: {now - since:.3f}s, {now - boot_started_at():.3f}s since start{suffix}",
+        flush=True
+    )
+
+
+def wait_for_redis(url: str = REDIS_URL, wait: float = REDIS_WAIT_SECONDS) -> int:
+    """Ping Redis until it answers
+
+    Args:
+        url: Redis URL
+        wait: Seconds to keep trying
+
+    Returns:
+        Number of attempts made
+
+    Raises:
+        redis.RedisError: If Redis did not answer within the wait
+    """
+    client = redis.Redis.from_url(
+        url,
+        socket_connect_timeout=REDIS_PROBE_TIMEOUT,
+        socket_timeout=REDIS_PROBE_TIMEOUT
+    )
+    deadline = time.monotonic() + wait
+    attempts = 0
+    try:
+        while True:
+            attempts += 1
+            try:
+                client.ping()
+                return attempts
+            except redis.RedisError:
+                if time.monotonic() + REDIS_PROBE_INTERVAL >= deadline:
+                    raise
+                time.sleep(REDIS_PROBE_INTERVAL)
+    finally:
+        client.close()
+
+
+def data_path() -> Path:
+    """Data directory, as chosen in settings"""
+    if config("DEPLOYED_TO_AWS", default=False, cast=bool):
+        return Path("/efs-vols/app-data/data")
+    return Path(__file__).resolve().parent.parent / "data"
+
+
+def create_directories(base: Path) -> None:
+    """Create the static, media and logs directories"""
+    for name in ("static", "media", "logs"):
+        (base / name).mkdir(mode=0o755, parents=True, exist_ok=True)
+
+
+def main() -> int:
+    """Run the boot phases; non-zero exit stops the container"""
+    report("shell", boot_started_at())
+
+    started = time.time()
+    if STATE_BACKEND == "redis":
+        try:
+            attempts = wait_for_redis()
+        except redis.RedisError as e:
+            print(f"Redis at {REDIS_URL} unavailable after {REDIS_WAIT_SECONDS:g}s: {e}", file=sys.stderr, flush=True)
+            return 1
+        report("redis", started, f"{attempts} attempt{'s' if attempts != 1 else ''}")
+    else:
+        report("redis", started, f"skipped, STATE_BACKEND={STATE_BACKEND}")
+
+    started = time.time()
+    create_directories(data_path())
+    report("directories", started)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+"""Gunicorn configuration hooks
+
+Loaded with `gunicorn --config python:config.gunicorn`. Command line options
+still win, this module only adds what flags cannot express:
+- Prometheus multiprocess directory shared by all workers, emptied on start
+- Cleanup of a worker's live metrics when it exits
+- Time-to-ready report continuing the one from config.boot: application
+  load (with --preload) and each worker's first moment of serving
+- Warm-up (config/warmup.py): code in the master before workers fork,
+  connection pools in each worker once it has initialised (gevent workers
+  patch sockets then, so pools opened earlier would block the hub)
+"""
+import os
+import shutil
+import time
+
+from config.boot import report
+from config.warmup import describe, warm_code, warm_pools
+
+# Gunicorn loads this module before the application
+CONFIG_LOADED_AT = time.time()
+_ready_at = CONFIG_LOADED_AT
+
+# prometheus_client picks file-backed values only if this is set when it is
+# first imported, so nothing above may import it; the app (with --preload)
+# and the workers import it after this module
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/vimbiso-metrics")
+
+# Metrics files from a previous run would be aggregated with this one
+shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop live gauge values of a worker that exited (counters are kept)"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid, PROMETHEUS_MULTIPROC_DIR)
+
+
+def when_ready(server):
+    """Report the master's application load, then warm code for the workers"""
+    global _ready_at
+    report("app load", CONFIG_LOADED_AT)
+    started = time.time()
+    report("code warm-up", started, describe(warm_code()))
+    # Workers fork after this and inherit it
+    _ready_at = time.time()
+
+
+def post_worker_init(worker):
+    """Open the worker's pools, then report it as about to accept requests"""
+    started = time.time()
+    report(f"worker {worker.pid} pool warm-up", started, describe(warm_pools()))
+    report(f"worker {worker.pid} ready", _ready_at)
@@ -37,35 +37,46 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "core.monitoring.middleware.CallBudgetMiddleware",
 ]
 
+# Expose per-request Redis/HTTP call counts in an X-Call-Budget response header
+CALL_BUDGET_HEADER = env("CALL_BUDGET_HEADER", default=DEBUG, cast=bool)
+
 ROOT_URLCONF = "config.urls"
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 # Storage paths
 DEPLOYED_TO_AWS = env('DEPLOYED_TO_AWS', default=False, cast=bool)
 if DEPLOYED_TO_AWS:
-    BASE_PATH = "/efs-vols/app-data/data"
+    BASE_PATH = Path("/efs-vols/app-data/data")
 else:
     BASE_PATH = BASE_DIR / 'data'
     os.makedirs(BASE_PATH, exist_ok=True)
 
 # Static files configuration
 STATIC_URL = "/static/"
-STATIC_ROOT = BASE_PATH / "static"
+# Images collect static files at build time into their own STATIC_ROOT
+STATIC_ROOT = Path(env("STATIC_ROOT", default=str(BASE_PATH / "static")))
 
 # Minimal SQLite database for Django internals (migrations, etc.)
-# All application state is managed in Redis
+# All application state is managed in Redis, so fast boot runs without one
+DATABASE_ENABLED = env("DATABASE_ENABLED", default=True, cast=bool)
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_PATH / 'db.sqlite3',  # Store in data directory
     }
-}
+} if DATABASE_ENABLED else {}
 
 # Redis configuration
 REDIS_URL = env("REDIS_URL", default="redis://redis-state:6379/0")
 
+# Member state backend (see core.state.persistence.client); only redis needs a
+# Redis server, the others get an in-process cache
+STATE_BACKEND = env("STATE_BACKEND", default="redis")
+
 # Cache configuration using Redis - shared with application state management
 CACHES = {
     "default": {
@@ -76,9 +87,11 @@ CACHES = {
             "SOCKET_CONNECT_TIMEOUT": 5,  # seconds
             "SOCKET_TIMEOUT": 5,  # seconds
             "RETRY_ON_TIMEOUT": True,
-            "MAX_CONNECTIONS": 10,
+            # start_app.sh defaults this to ASYNC_FLOW_THREADS when serving config.asgi
+            "MAX_CONNECTIONS": env("REDIS_MAX_CONNECTIONS", default=10, cast=int),
             "HEALTH_CHECK_INTERVAL": 30,  # seconds
-            "CONNECTION_POOL_CLASS": "redis.ConnectionPool",
+            # Standard pool whose connections report to the active call budget
+            "CONNECTION_POOL_CLASS": "core.monitoring.call_budget.CountingConnectionPool",
             # Removed PARSER_CLASS since it's causing issues with newer Redis versions
             "REDIS_CLIENT_KWARGS": {
                 "decode_responses": True  # Match existing client configuration
@@ -87,6 +100,11 @@ CACHES = {
         "KEY_PREFIX": "vimbiso",  # Namespace cache keys
         "TIMEOUT": None,  # Disable cache timeouts since we're using it for state
     }
+} if STATE_BACKEND == "redis" else {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "vimbiso",
+    }
 }
 
 
@@ -97,6 +115,12 @@ USE_X_FORWARDED_HOST = True
 USE_X_FORWARDED_PORT = True
 
 # Logging configuration
+# Output goes through a background queue listener with PII/token redaction.
+# LOG_SAMPLE_RATES keeps a share of DEBUG/INFO records per logger, e.g.
+# "core.flow=0.1,core.components=0.25"; warnings and errors are never sampled.
+LOG_FORMAT = env("LOG_FORMAT", default="json")  # "json" or "standard"
+LOG_SAMPLE_RATES = env("LOG_SAMPLE_RATES", default="")
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -105,18 +129,32 @@ LOGGING = {
             "format": "[%(asctime)s] %(levelname)s [%(name)s] %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        "json": {
+            "()": "pythonjsonlogger.json.JsonFormatter",
+            "fmt": "%(asctime)s %(levelname)s %(name)s %(message)s",
+            "datefmt": "%Y-%m-%d %H:%M:%S",
+        },
     },
     "filters": {
         "require_debug_false": {
             "()": "django.utils.log.RequireDebugFalse",
         },
+        "sampling": {
+            "()": "core.monitoring.structured_logging.SamplingFilter",
+            "rates": LOG_SAMPLE_RATES,
+        },
     },
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
-            "formatter": "standard",
+            "()": "core.monitoring.structured_logging.QueueingStreamHandler",
+            "formatter": LOG_FORMAT,
+            "filters": ["sampling"],
         },
     },
+    "root": {
+        "handlers": ["console"],
+        "level": "WARNING",
+    },
     "loggers": {
         # Core application logging
         "core": {
@@ -124,6 +162,12 @@ LOGGING = {
             "level": env("APP_LOG_LEVEL", default="DEBUG"),
             "propagate": False,
         },
+        # Channel services (WhatsApp)
+        "services": {
+            "handlers": ["console"],
+            "level": env("APP_LOG_LEVEL", default="DEBUG"),
+            "propagate": False,
+        },
         # Django framework logging
         "django": {
             "handlers": ["console"],
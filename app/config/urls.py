@@ -1,11 +1,15 @@
-from core.api.views import (CredexCloudApiWebhook, CredexSendMessageWebhook,
-                            WipeCache, HealthCheck)
+from core.api.views import (CredexBulkSendMessageWebhook, CredexCloudApiWebhook,
+                            CredexSendMessageWebhook, HealthCheck,
+                            InvalidateAccountHandles, Metrics, WipeCache)
 from django.urls import path
 
 urlpatterns = [
     path("health/", HealthCheck.as_view(), name="health_check"),
+    path("metrics", Metrics.as_view(), name="metrics"),
     # Bot endpoints
     path("bot/webhook", CredexCloudApiWebhook.as_view(), name="webhook"),
     path("bot/notify", CredexSendMessageWebhook.as_view(), name="notify"),
+    path("bot/notify/bulk", CredexBulkSendMessageWebhook.as_view(), name="notify_bulk"),
     path("bot/wipe", WipeCache.as_view(), name="wipe"),
+    path("bot/accounts/invalidate", InvalidateAccountHandles.as_view(), name="invalidate_handles"),
 ]
@@ -0,0 +1,96 @@
+"""Worker warm-up
+
+Work a worker would otherwise do on its first requests, done before it
+accepts any (see the hooks in config/gunicorn.py):
+- warm_code(): import every component (registering its skeletons), then
+  compile every enumerable message skeleton to its WhatsApp payload. Run in
+  the Gunicorn master after the application loads, so forked workers
+  inherit it
+- warm_pools(): open this process's Redis connection (when state is kept in
+  Redis) and build its Graph API senders and status ingestor. Run in each
+  worker after it initialises, since sockets and per-process singletons are
+  reset by the fork and gevent workers only patch sockets in their
+  initialisation
+
+A failing step is logged and skipped; warm-up never stops a worker.
+"""
+import logging
+import time
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def _components() -> None:
+    from core.components.registry import load_all
+
+    load_all()
+
+
+def _skeletons() -> None:
+    from core.messaging.skeletons import registered_shapes
+    from services.whatsapp.payloads import get_skeleton
+
+    for template_id, shape in registered_shapes():
+        get_skeleton(template_id, shape)
+
+
+def _redis() -> None:
+    from core.state.persistence.client import get_redis_client, uses_redis
+
+    if uses_redis():
+        get_redis_client().ping()
+
+
+def _senders() -> None:
+    from services.whatsapp.sender import MOCK, PRODUCTION, get_sender
+
+    get_sender(PRODUCTION)
+    get_sender(MOCK)
+
+
+def _statuses() -> None:
+    from services.whatsapp.statuses import get_ingestor
+
+    get_ingestor()
+
+
+def _run(steps: Dict[str, Callable[[], None]]) -> Dict[str, float]:
+    timings = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning("Warm-up step %s failed: %s", name, e)
+            continue
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def warm_code() -> Dict[str, float]:
+    """Import components and compile skeletons
+
+    Returns:
+        Seconds taken by each step that succeeded
+    """
+    return _run({"components": _components, "skeletons": _skeletons})
+
+
+def warm_pools() -> Dict[str, float]:
+    """Open this process's connections and build its singletons
+
+    Returns:
+        Seconds taken by each step that succeeded
+    """
+    return _run({"redis": _redis, "senders": _senders, "statuses": _statuses})
+
+
+def warm_up() -> Dict[str, float]:
+    """Run every warm-up step (for servers without a pre-fork master)"""
+    return {**warm_code(), **warm_pools()}
+
+
+def describe(timings: Dict[str, float]) -> str:
+    """One-line summary of step timings"""
+    return ", ".join(f"{name} {seconds:.3f}s" for name, seconds in timings.items())
@@ -1,7 +1,14 @@
 import os
 
+from decouple import config
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Answer webhook POSTs without DRF and the middleware stack
+if config("WEBHOOK_FAST_PATH", default=True, cast=bool):
+    from core.api.webhook import WebhookApplication
+
+    application = WebhookApplication(application)
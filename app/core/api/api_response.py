@@ -12,6 +12,7 @@ Components can still store their own unvalidated data in component_data.data.
 """
 
 import logging
+from datetime import datetime
 from typing import Any, Dict, Optional, Tuple
 
 from core.state.interface import StateManagerInterface
@@ -71,3 +72,28 @@ def update_state_from_response(
     except Exception as e:
         logger.error(f"Failed to store API response: {e}")
         return False, str(e)
+
+
+def store_account_found(
+    state_manager: StateManagerInterface,
+    details: Dict[str, Any]
+) -> None:
+    """Store known account details in state.action as getAccountByHandle would
+
+    Used when the account is already known (handle cache, recent
+    counterparties) so later steps find it where the API response puts it.
+
+    Args:
+        state_manager: State manager instance
+        details: Account details (accountID, accountName, accountHandle)
+    """
+    member = state_manager.get_state_value("dashboard", {}).get("member", {})
+    state_manager.update_state({
+        "action": {
+            "id": None,
+            "type": "ACCOUNT_FOUND",
+            "timestamp": datetime.utcnow().isoformat(),
+            "actor": member.get("memberID", ""),
+            "details": details
+        }
+    })
@@ -8,6 +8,9 @@ from urllib.parse import urljoin
 import requests
 from core.error.exceptions import SystemException
 from core.error.handler import ErrorHandler
+from core.monitoring.call_budget import record_http_call
+from core.monitoring.metrics import CREDEX_API_LATENCY, endpoint_label
+from core.monitoring.traffic import get_recorder
 from core.state.interface import StateManagerInterface
 from core.state.validator import StateValidator
 from decouple import config
@@ -199,10 +202,13 @@ def make_api_request(
             logger.debug(f"Headers: {headers}")
             logger.debug(f"Payload: {payload}")
 
+        endpoint = endpoint_label(url)
         retries = 0
         while retries < MAX_RETRIES:
+            started = time.perf_counter()
             try:
                 # Try request with current headers
+                record_http_call("credex")
                 response = requests.request(
                     method,
                     url,
@@ -210,6 +216,12 @@ def make_api_request(
                     json=payload,
                     timeout=TIMEOUT
                 )
+                CREDEX_API_LATENCY.labels(endpoint=endpoint, status=response.status_code).observe(
+                    time.perf_counter() - started
+                )
+                recorder = get_recorder()
+                if recorder is not None:
+                    recorder.credex(endpoint, response.status_code, response.content)
 
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.debug(f"API Response Status: {response.status_code}")
@@ -268,6 +280,9 @@ def make_api_request(
                 return response
 
             except RequestException as e:
+                CREDEX_API_LATENCY.labels(endpoint=endpoint, status="error").observe(
+                    time.perf_counter() - started
+                )
                 logger.error(f"Request failed: {str(e)}")
                 retries += 1
                 if retries < MAX_RETRIES:
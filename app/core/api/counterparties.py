@@ -0,0 +1,111 @@
+"""Recent counterparties
+
+Each member's most recent offer recipients, kept in Redis so the next offer
+can pick one from a list instead of typing the handle:
+- Fed by CreateCredexApiCall with the recipient details of each
+  CREDEX_CREATED offer
+- Most recent first, at most RECENT_COUNTERPARTIES_LIMIT accounts, with the
+  list expiring RECENT_COUNTERPARTIES_TTL seconds after the last offer
+- Picking one stores its details as the ACCOUNT_FOUND action, so the offer
+  goes to confirmation without getAccountByHandle
+
+Store failures are logged and treated as an empty list; the member then types
+the handle as before. Without Redis (STATE_BACKEND memory or sqlite) members
+always type it.
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from core.monitoring.metrics import RECENT_COUNTERPARTY_PICKS
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+RECENT_COUNTERPARTIES_ENABLED = config("RECENT_COUNTERPARTIES_ENABLED", default=True, cast=bool)
+RECENT_COUNTERPARTIES_LIMIT = config("RECENT_COUNTERPARTIES_LIMIT", default=5, cast=int)
+RECENT_COUNTERPARTIES_TTL = config("RECENT_COUNTERPARTIES_TTL", default=90 * 24 * 3600, cast=int)
+
+KEY_PREFIX = "counterparties"
+FIELDS = ("accountID", "accountName", "accountHandle")
+
+_store: Optional["RecentCounterparties"] = None
+
+
+def counterparties_key(member_id: str) -> str:
+    """Redis key of a member's recent counterparties"""
+    return f"{KEY_PREFIX}:{member_id}"
+
+
+class RecentCounterparties:
+    """Per-member most recently used counterparty accounts"""
+
+    def __init__(self, redis_client, limit: int = RECENT_COUNTERPARTIES_LIMIT):
+        """Initialize with Redis client"""
+        self.redis = redis_client
+        self.limit = limit
+
+    def recent(self, member_id: str) -> List[Dict[str, Any]]:
+        """A member's recent counterparties, most recent first"""
+        try:
+            stored = self.redis.get(counterparties_key(member_id))
+            return json.loads(stored) if stored else []
+        except Exception as e:
+            logger.warning("Recent counterparties lookup failed: %s", e)
+            return []
+
+    def pick(self, member_id: str, account_id: str) -> Optional[Dict[str, Any]]:
+        """A member's recent counterparty picked from the list, by account ID"""
+        entry = next(
+            (entry for entry in self.recent(member_id) if entry.get("accountID") == account_id),
+            None
+        )
+        if entry is not None:
+            RECENT_COUNTERPARTY_PICKS.inc()
+        return entry
+
+    def record(self, member_id: str, details: Dict[str, Any]) -> None:
+        """Move an account to the front of a member's recent counterparties
+
+        Args:
+            member_id: Member who made the offer
+            details: Recipient account details from the ACCOUNT_FOUND action
+        """
+        entry = {name: details.get(name) for name in FIELDS}
+        if not entry["accountID"] or not entry["accountHandle"]:
+            return
+
+        entries = [entry] + [
+            existing for existing in self.recent(member_id)
+            if existing.get("accountID") != entry["accountID"]
+        ]
+        try:
+            self.redis.set(
+                counterparties_key(member_id),
+                json.dumps(entries[:self.limit]),
+                ex=RECENT_COUNTERPARTIES_TTL
+            )
+        except Exception as e:
+            logger.warning("Recent counterparties store failed: %s", e)
+
+
+def get_recent_counterparties() -> Optional[RecentCounterparties]:
+    """This process's counterparty store (shares the state client), or None when disabled"""
+    global _store
+    from core.state.persistence.client import get_redis_client, uses_redis
+
+    if not RECENT_COUNTERPARTIES_ENABLED or not uses_redis():
+        return None
+    if _store is None:
+        _store = RecentCounterparties(get_redis_client())
+    return _store
+
+
+def _reset_after_fork() -> None:
+    """Workers use their own connections"""
+    global _store
+    _store = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
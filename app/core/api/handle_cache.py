@@ -0,0 +1,114 @@
+"""Account handle lookup cache
+
+getAccountByHandle results are shared by all workers through Redis, so a
+handle validated for one member is not looked up again for the next:
+- Found accounts keep their details for HANDLE_CACHE_TTL seconds
+- Handles that don't exist are remembered for HANDLE_CACHE_NEGATIVE_TTL
+  seconds, long enough to absorb retries of a mistyped handle but short
+  enough that a newly created account is soon found
+- Credex core invalidates handles whose accounts change through
+  POST /bot/accounts/invalidate
+
+Cache failures are logged and treated as misses; validation then goes to
+the API as before. The cache is off when state is not kept in Redis
+(STATE_BACKEND memory or sqlite).
+"""
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+
+from core.monitoring.metrics import HANDLE_CACHE_LOOKUPS
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+HANDLE_CACHE_ENABLED = config("HANDLE_CACHE_ENABLED", default=True, cast=bool)
+HANDLE_CACHE_TTL = config("HANDLE_CACHE_TTL", default=600, cast=int)
+HANDLE_CACHE_NEGATIVE_TTL = config("HANDLE_CACHE_NEGATIVE_TTL", default=30, cast=int)
+
+KEY_PREFIX = "handles"
+
+_cache: Optional["HandleCache"] = None
+
+
+def handle_key(handle: str) -> str:
+    """Redis key of a handle's cached lookup"""
+    return f"{KEY_PREFIX}:{handle}"
+
+
+class HandleCache:
+    """Shared handle to account details cache"""
+
+    def __init__(self, redis_client):
+        """Initialize with Redis client"""
+        self.redis = redis_client
+
+    def lookup(self, handle: str) -> Optional[Dict[str, Any]]:
+        """Cached lookup of a handle
+
+        Returns:
+            {"found": True, "details": {...}} for a known account,
+            {"found": False} for a handle known not to exist, or None when
+            the handle must be looked up
+        """
+        try:
+            cached = self.redis.get(handle_key(handle))
+            entry = json.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning("Handle cache lookup failed: %s", e)
+            HANDLE_CACHE_LOOKUPS.labels(result="error").inc()
+            return None
+
+        if entry is None:
+            HANDLE_CACHE_LOOKUPS.labels(result="miss").inc()
+        else:
+            HANDLE_CACHE_LOOKUPS.labels(result="hit" if entry.get("found") else "negative_hit").inc()
+        return entry
+
+    def _store(self, handle: str, entry: Dict[str, Any], ttl: int) -> None:
+        try:
+            self.redis.set(handle_key(handle), json.dumps(entry), ex=ttl)
+        except Exception as e:
+            logger.warning("Handle cache store failed: %s", e)
+
+    def store_found(self, handle: str, details: Dict[str, Any]) -> None:
+        """Remember the account details of a handle"""
+        self._store(handle, {"found": True, "details": details}, HANDLE_CACHE_TTL)
+
+    def store_not_found(self, handle: str) -> None:
+        """Remember that a handle has no account"""
+        self._store(handle, {"found": False}, HANDLE_CACHE_NEGATIVE_TTL)
+
+    def invalidate(self, handles: Iterable[str]) -> int:
+        """Drop cached lookups of handles
+
+        Returns:
+            Number of cached lookups removed
+
+        Raises:
+            redis.RedisError: If Redis is unavailable
+        """
+        keys = [handle_key(handle) for handle in handles]
+        return self.redis.delete(*keys) if keys else 0
+
+
+def get_handle_cache() -> Optional[HandleCache]:
+    """This process's handle cache (shares the state client), or None when disabled"""
+    global _cache
+    from core.state.persistence.client import get_redis_client, uses_redis
+
+    if not HANDLE_CACHE_ENABLED or not uses_redis():
+        return None
+    if _cache is None:
+        _cache = HandleCache(get_redis_client())
+    return _cache
+
+
+def _reset_after_fork() -> None:
+    """Workers use their own connections"""
+    global _cache
+    _cache = None
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
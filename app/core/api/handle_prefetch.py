@@ -0,0 +1,207 @@
+"""Speculative account handle lookups
+
+getAccountByHandle is started as soon as a message carrying a handle
+arrives, on a small thread pool, so the credex round trip overlaps all the
+state writes, component work and flow transitions that come before
+ValidateAccountApiCall:
+- start_inbound_lookup() is called by the webhook before any state is
+  written. A handle is taken from text sent to a HandleInput awaiting input,
+  or from an offer command sent to AmountInput or AccountDashboard
+- The handle cache is read here, once; a cached lookup is handed on as is
+  and nothing is fetched
+- The request runs with a snapshot of the member's channel and auth token and
+  never touches live state; without a token nothing is started, so the login
+  redirect still happens on the flow thread. Calls it makes are counted in
+  the webhook's call budget
+- take_handle_lookup() hands the response (or cached lookup) to
+  ValidateAccountApiCall, which processes it as if it had made the call;
+  401s, failures and lookups for another handle are dropped and validation
+  reads the cache and calls the API itself
+
+Lookups are kept per conversation in this process and expire after
+HANDLE_PREFETCH_MAX_AGE seconds if no validation takes them.
+"""
+import contextvars
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from core.components.input.offer_command import (MAX_HANDLE_LENGTH,
+                                                 parse_offer_command)
+from core.flow.constants import GREETING_COMMANDS
+from core.messaging.types import InboundEvent, MessageType
+from core.monitoring.metrics import HANDLE_PREFETCHES
+from core.state.interface import StateManagerInterface
+from decouple import config
+
+from .base import TIMEOUT, get_headers, make_api_request
+from .handle_cache import get_handle_cache
+
+logger = logging.getLogger(__name__)
+
+HANDLE_PREFETCH_ENABLED = config("HANDLE_PREFETCH_ENABLED", default=True, cast=bool)
+HANDLE_PREFETCH_THREADS = config("HANDLE_PREFETCH_THREADS", default=8, cast=int)
+HANDLE_PREFETCH_MAX_AGE = config("HANDLE_PREFETCH_MAX_AGE", default=60, cast=int)
+
+URL = "getAccountByHandle"
+
+# Components that take a bare handle, and those that take offer commands
+HANDLE_COMPONENTS = {"HandleInput"}
+OFFER_COMMAND_COMPONENTS = {"AmountInput", "AccountDashboard"}
+
+# A getAccountByHandle response, or a cached lookup (see HandleCache.lookup)
+Lookup = Union[requests.Response, Dict[str, Any]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+# Conversation -> (handle, lookup, started)
+_pending: Dict[str, Tuple[str, Future, float]] = {}
+
+
+class _StateSnapshot:
+    """Read-only copy of the state a request needs"""
+
+    def __init__(self, values: Dict[str, Any]):
+        self.values = values
+
+    def get_state_value(self, key: str, default: Any = None) -> Any:
+        value = self.values.get(key)
+        return value if value is not None else default
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=HANDLE_PREFETCH_THREADS, thread_name_prefix="prefetch")
+    return _executor
+
+
+def _channel_id(state_manager: StateManagerInterface) -> Optional[str]:
+    return (state_manager.get_state_value("channel", {}) or {}).get("identifier")
+
+
+def inbound_handle(state_manager: StateManagerInterface, event: InboundEvent) -> Optional[str]:
+    """Handle carried by a message for the conversation's current step, if any"""
+    if event.kind != MessageType.TEXT or not event.text or event.text.lower().strip() in GREETING_COMMANDS:
+        return None
+    component = state_manager.get_component()
+    if component in HANDLE_COMPONENTS and state_manager.is_awaiting_input():
+        handle = event.text.strip()
+        return handle if len(handle) <= MAX_HANDLE_LENGTH else None
+    if component in OFFER_COMMAND_COMPONENTS:
+        command = parse_offer_command(event.text)
+        return command.value["handle"] if command is not None and command.valid else None
+    return None
+
+
+def start_inbound_lookup(state_manager: StateManagerInterface, event: InboundEvent) -> None:
+    """Start looking up the handle an arriving message carries
+
+    Args:
+        state_manager: Member's state manager, before the message is stored
+        event: Arriving message
+    """
+    if HANDLE_PREFETCH_ENABLED:
+        handle = inbound_handle(state_manager, event)
+        if handle:
+            start_handle_lookup(state_manager, handle)
+
+
+def start_handle_lookup(state_manager: StateManagerInterface, handle: str) -> None:
+    """Start looking up a handle
+
+    Args:
+        state_manager: Member's state manager
+        handle: Handle to look up
+    """
+    if not HANDLE_PREFETCH_ENABLED or not handle:
+        return
+    channel_id = _channel_id(state_manager)
+    if not channel_id:
+        return
+
+    handle_cache = get_handle_cache()
+    cached = handle_cache.lookup(handle) if handle_cache else None
+    if cached is not None:
+        lookup = Future()
+        lookup.set_result(cached)
+    else:
+        snapshot = _StateSnapshot({
+            "channel": state_manager.get_state_value("channel"),
+            "auth": state_manager.get_state_value("auth")
+        })
+        if "Authorization" not in get_headers(snapshot, URL):
+            return
+
+        # Budgets and traffic recording follow the request into the pool
+        context = contextvars.copy_context()
+        lookup = _get_executor().submit(
+            context.run, make_api_request, url=URL, payload={"accountHandle": handle},
+            retry_auth=False, state_manager=snapshot
+        )
+
+    now = time.monotonic()
+    with _lock:
+        for key, (_, _, started) in list(_pending.items()):
+            if now - started > HANDLE_PREFETCH_MAX_AGE:
+                del _pending[key]
+                HANDLE_PREFETCHES.labels(outcome="expired").inc()
+        _pending[channel_id] = (handle, lookup, now)
+    HANDLE_PREFETCHES.labels(outcome="cached" if cached is not None else "started").inc()
+
+
+def take_handle_lookup(state_manager: StateManagerInterface, handle: str) -> Optional[Lookup]:
+    """Result of the conversation's speculative lookup of a handle
+
+    Waits for the lookup if it is still running.
+
+    Returns:
+        The getAccountByHandle response, the cached lookup if the handle
+        cache answered, or None when validation must look the handle up
+    """
+    channel_id = _channel_id(state_manager)
+    if not channel_id:
+        return None
+    with _lock:
+        entry = _pending.pop(channel_id, None)
+    if entry is None:
+        return None
+
+    expected, lookup, started = entry
+    if expected != handle or time.monotonic() - started > HANDLE_PREFETCH_MAX_AGE:
+        HANDLE_PREFETCHES.labels(outcome="discarded").inc()
+        return None
+
+    try:
+        response = lookup.result(timeout=TIMEOUT)
+    except Exception as e:
+        logger.warning("Speculative handle lookup failed: %s", e)
+        HANDLE_PREFETCHES.labels(outcome="failed").inc()
+        return None
+
+    if isinstance(response, dict):
+        return response
+    if not isinstance(response, requests.Response) or response.status_code == 401:
+        HANDLE_PREFETCHES.labels(outcome="failed").inc()
+        return None
+
+    HANDLE_PREFETCHES.labels(outcome="used").inc()
+    return response
+
+
+def _reset_after_fork() -> None:
+    """Workers start their own pool"""
+    global _executor, _lock
+    _executor = None
+    _lock = threading.Lock()
+    _pending.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
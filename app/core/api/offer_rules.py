@@ -0,0 +1,143 @@
+"""Local offer rules
+
+Checks a secured offer against the dashboard already in state before
+createCredex is called, so offers the backend would certainly reject are
+turned back at once with a specific message:
+- Denomination must be one credex supports
+- Amount must be positive
+- Amount must not exceed the active account's secured balance in the
+  denomination
+- USD offers of members below TIER_LIMITED_BELOW must not exceed the
+  remaining daily tier limit (other denominations need exchange rates we
+  don't have, so they are left to the backend)
+
+Passing these rules doesn't make an offer valid: credex core stays the
+authority and its checks still run. Rules whose data is missing or can't be
+parsed are skipped.
+"""
+import logging
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from core.error.types import ValidationResult
+from core.monitoring.metrics import OFFER_RULE_REJECTIONS
+from core.state.interface import StateManagerInterface
+from core.utils.utils import format_denomination
+
+logger = logging.getLogger(__name__)
+
+# Valid denominations
+VALID_DENOMS: Set[str] = {"CXX", "XAU", "USD", "CAD", "ZWG"}
+
+# Member tiers with a daily limit (as shown on the dashboard)
+TIER_LIMITED_BELOW = 3
+
+
+def _parse_balance(balance: str) -> Optional[Tuple[float, str]]:
+    """Split "1,234.50 USD" into (1234.5, "USD")"""
+    try:
+        value, denom = balance.split()
+        return float(value.replace(",", "")), denom.upper()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _denomination(amount: float, denom: str, member: Dict, account: Dict) -> Optional[ValidationResult]:
+    if denom not in VALID_DENOMS:
+        return ValidationResult.failure(
+            message=f"Invalid denomination. Valid options are: {', '.join(sorted(VALID_DENOMS))}",
+            field="denomination",
+            details={"denom": denom}
+        )
+    return None
+
+
+def _positive_amount(amount: float, denom: str, member: Dict, account: Dict) -> Optional[ValidationResult]:
+    if amount <= 0:
+        return ValidationResult.failure(
+            message="Amount must be positive",
+            field="amount",
+            details={"amount": amount}
+        )
+    return None
+
+
+def _secured_balance(amount: float, denom: str, member: Dict, account: Dict) -> Optional[ValidationResult]:
+    balances = account.get("balanceData", {}).get("securedNetBalancesByDenom")
+    if balances is None:
+        return None
+
+    available = 0.0
+    for balance in balances:
+        parsed = _parse_balance(balance)
+        if parsed is None:
+            logger.debug("Skipping secured balance check, unparseable balance %r", balance)
+            return None
+        if parsed[1] == denom:
+            available = parsed[0]
+
+    if amount > available:
+        return ValidationResult.failure(
+            message=f"Insufficient secured balance. You have {format_denomination(max(available, 0.0), denom)} available",
+            field="amount",
+            details={"amount": amount, "available": available, "denom": denom}
+        )
+    return None
+
+
+def _tier_limit(amount: float, denom: str, member: Dict, account: Dict) -> Optional[ValidationResult]:
+    if denom != "USD" or member.get("memberTier", TIER_LIMITED_BELOW) >= TIER_LIMITED_BELOW:
+        return None
+    try:
+        remaining = float(member["remainingAvailableUSD"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if amount > remaining:
+        return ValidationResult.failure(
+            message=f"Over your daily member tier limit. You can offer {format_denomination(max(remaining, 0.0), 'USD')} more today",
+            field="amount",
+            details={"amount": amount, "remaining": remaining, "denom": denom}
+        )
+    return None
+
+
+# Checked in order; the first rejection is returned
+RULES: Tuple[Tuple[str, Callable[[float, str, Dict, Dict], Optional[ValidationResult]]], ...] = (
+    ("denomination", _denomination),
+    ("amount", _positive_amount),
+    ("secured_balance", _secured_balance),
+    ("tier_limit", _tier_limit),
+)
+
+
+def check_offer(state_manager: StateManagerInterface, amount: Any, denom: str) -> ValidationResult:
+    """Check an offer from the active account against the rules
+
+    Args:
+        state_manager: Member's state manager (dashboard and active account)
+        amount: Offer amount
+        denom: Offer denomination
+
+    Returns:
+        ValidationResult failure of the first rule broken, otherwise success
+    """
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        return ValidationResult.failure(
+            message="Invalid amount format",
+            field="amount",
+            details={"amount": amount}
+        )
+    denom = (denom or "").upper()
+
+    dashboard = state_manager.get_state_value("dashboard", {}) or {}
+    account = state_manager.get_dashboard_index().account(state_manager.get_state_value("active_account_id")) or {}
+    member = dashboard.get("member", {})
+
+    for name, rule in RULES:
+        result = rule(amount, denom, member, account)
+        if result is not None:
+            OFFER_RULE_REJECTIONS.labels(rule=name).inc()
+            return result
+    return ValidationResult.success({"amount": amount, "denom": denom})
@@ -1,28 +1,23 @@
 """Cloud API webhook views"""
 import logging
-import sys
-from core.messaging.service import MessagingService
+
 from core.messaging.types import Message as DomainMessage
-from core.messaging.types import MessageRecipient, TemplateContent
-from core.state.manager import StateManager
+from core.messaging.types import MessageRecipient
+from core.monitoring.metrics import render_metrics
+from core.state.persistence.client import (STATE_BACKEND, get_state_storage,
+                                           uses_redis)
 from decouple import config
 from django.core.cache import cache
 from django.http import HttpResponse, JsonResponse
 from rest_framework import status
 from rest_framework.parsers import JSONParser
 from rest_framework.views import APIView
-from services.whatsapp.flow_processor import WhatsAppFlowProcessor
+from services.whatsapp import notifications
+from services.whatsapp.inbound import SIGNATURE_HEADER
 from services.whatsapp.service import WhatsAppMessagingService
-from services.whatsapp.state_manager import \
-    StateManager as WhatsAppStateManager
 
-# Configure logging with a standardized format
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='[%(asctime)s] {"asctime": "%(asctime)s", "levelname": "%(levelname)s", "name": "%(name)s", "message": "%(message)s", "taskName": null}',
-    datefmt='%Y-%m-%d %H:%M:%S',
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+from .handle_cache import get_handle_cache
+from .webhook import handle_webhook
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +30,16 @@ class HealthCheck(APIView):
     @staticmethod
     def get(request):
         try:
+            # Without Redis, check the state backend answers instead
+            if not uses_redis():
+                success, _, error = get_state_storage().execute_atomic("health_check", "get")
+                if not success:
+                    raise Exception(error)
+                return JsonResponse({
+                    "status": "healthy",
+                    "state_backend": STATE_BACKEND
+                }, status=status.HTTP_200_OK)
+
             # Check Redis connectivity using Django's cache framework
             cache.set('health_check', 'ok', 1)  # Set with 1 second timeout
             result = cache.get('health_check')
@@ -54,165 +59,38 @@ class HealthCheck(APIView):
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
 
 
-def get_messaging_service(state_manager, channel_type: str):
-    """Get properly initialized messaging service with state and channel
-
-    Args:
-        state_manager: State manager instance
-        channel_type: Type of messaging channel ("whatsapp", "sms")
-
-    Returns:
-        MessagingService: Initialized messaging service
-    """
-    # Create channel-specific service based on type
-    if channel_type == "whatsapp":
-        channel_service = WhatsAppMessagingService()
-    elif channel_type == "sms":
-        # TODO: Implement SMS service
-        raise NotImplementedError("SMS channel not yet implemented")
-    else:
-        raise ValueError(f"Unsupported channel type: {channel_type}")
-
-    # Create core messaging service with channel service and state
-    messaging_service = MessagingService(
-        channel_service=channel_service,
-        state_manager=state_manager
-    )
-
-    return messaging_service
-
-
-class CredexCloudApiWebhook(APIView):
-    """Cloud Api Webhook"""
-
+class Metrics(APIView):
+    """Prometheus metrics aggregated across all worker processes"""
     permission_classes = []
-    parser_classes = (JSONParser,)
-    throttle_classes = []  # Disable throttling for webhook endpoint
-
-    @staticmethod
-    def _extract_whatsapp_info(value: dict, is_mock_testing: bool) -> tuple[str, str] | None:
-        """Extract WhatsApp channel info from payload"""
-        # Validate WhatsApp value
-        if not is_mock_testing:
-            metadata = value.get("metadata", {})
-            if not metadata or metadata.get("phone_number_id") != config("WHATSAPP_PHONE_NUMBER_ID"):
-                return None
-
-        # Skip status updates
-        if value.get("statuses"):
-            return None
-
-        # Get contact info
-        contacts = value.get("contacts", [])
-        if not contacts:
-            return None
-
-        contact = contacts[0]
-        if not isinstance(contact, dict):
-            return None
-
-        channel_id = contact.get("wa_id")
-        if not channel_id:
-            return None
-
-        return "whatsapp", channel_id
-
-    @staticmethod
-    def _extract_channel_info(value: dict, is_mock_testing: bool) -> tuple[str, str] | None:
-        """Extract channel info from payload"""
-        if "messaging_product" in value and value["messaging_product"] == "whatsapp":
-            return CredexCloudApiWebhook._extract_whatsapp_info(value, is_mock_testing)
-        return None
+    throttle_classes = []
 
     @staticmethod
-    def post(request):
-        try:
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Processing webhook request")
-
-            # Validate basic webhook structure
-            if not isinstance(request.data, dict):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            entries = request.data.get("entry", [])
-            if not entries or not isinstance(entries, list):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            changes = entries[0].get("changes", [])
-            if not changes or not isinstance(changes, list):
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            # Get mock testing flag from header
-            is_mock_testing = request.headers.get('X-Mock-Testing') == 'true'
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Mock testing: {is_mock_testing}")
-
-            # Get and validate the raw payload value
-            value = changes[0].get("value", {})
-            if not value or not isinstance(value, dict):
-                logger.debug("Invalid or empty value object")
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            # Add mock testing flag to value metadata if header present
-            if is_mock_testing:
-                value.setdefault("metadata", {})["mock_testing"] = True
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(f"Updated value metadata: {value.get('metadata')}")
-
-            # Extract channel info from payload
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Extracting channel info from value: {value}")
-            channel_info = CredexCloudApiWebhook._extract_channel_info(value, is_mock_testing)
-            if not channel_info:
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
-
-            channel_type, channel_id = channel_info
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Extracted channel info - type: {channel_type}, id: {channel_id}")
-
-            # Initialize state managers
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug("Initializing state managers")
-            core_state_manager = StateManager(f"channel:{channel_id}")
-            state_manager = (
-                WhatsAppStateManager(core_state_manager)
-                if channel_type == "whatsapp"
-                else core_state_manager
-            )
-
-            # Initialize channel state with proper enum type
-            state_manager.initialize_channel(
-                channel_type=channel_type,
-                channel_id=channel_id,
-                mock_testing=is_mock_testing
-            )
+    def get(request):
+        body, content_type = render_metrics()
+        return HttpResponse(body, content_type=content_type)
 
-            try:
-                # Get messaging service for channel
-                service = get_messaging_service(state_manager, channel_type)
 
-                # Create flow processor for channel type
-                if channel_type == "whatsapp":
-                    flow_processor = WhatsAppFlowProcessor(service, state_manager)
-                else:
-                    raise ValueError(f"Unsupported channel type: {channel_type}")
+class CredexCloudApiWebhook(APIView):
+    """Cloud Api Webhook
 
-                # Process message - component handles its own messaging
-                flow_processor.process_message(request.data)
-                return JsonResponse({"message": "received"}, status=status.HTTP_200_OK)
+    POSTs are answered by core.api.webhook.handle_webhook before DRF request
+    handling; in deployments serving config.wsgi they never reach this view.
+    """
 
-            except Exception as e:
-                logger.error(f"Message processing error: {str(e)}")
-                return JsonResponse(
-                    {"error": str(e)},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
+    permission_classes = []
+    parser_classes = ()
+    throttle_classes = []  # Disable throttling for webhook endpoint
 
-        except Exception as e:
-            logger.error(f"Webhook error: {str(e)}")
-            return JsonResponse(
-                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    def dispatch(self, request, *args, **kwargs):
+        """Hand webhook POSTs the raw body, skipping DRF request handling"""
+        if request.method == "POST":
+            status_code, body = handle_webhook(
+                request.body,
+                mock_testing=request.headers.get("X-Mock-Testing") == "true",
+                signature=request.headers.get(SIGNATURE_HEADER)
             )
+            return HttpResponse(body, status=status_code, content_type="application/json")
+        return super().dispatch(request, *args, **kwargs)
 
     def get(self, request, *args, **kwargs):
         if logger.isEnabledFor(logging.DEBUG):
@@ -277,23 +155,7 @@ class CredexSendMessageWebhook(APIView):
             # Create template message
             message = DomainMessage(
                 recipient=recipient,
-                content=TemplateContent(
-                    name="incoming_notification",
-                    language={"code": "en_US"},
-                    components=[{
-                        "type": "body",
-                        "parameters": [
-                            {
-                                "type": "text",
-                                "text": request.data["memberName"]
-                            },
-                            {
-                                "type": "text",
-                                "text": request.data["message"]
-                            }
-                        ]
-                    }]
-                )
+                content=notifications.notification_content(request.data["memberName"], request.data["message"])
             )
 
             # Get mock testing flag from header
@@ -325,3 +187,95 @@ class CredexSendMessageWebhook(APIView):
                 {"status": "error", "message": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class CredexBulkSendMessageWebhook(APIView):
+    """Notify many members with one request"""
+
+    parser_classes = (JSONParser,)
+    throttle_classes = []  # Disable throttling for webhook endpoint
+
+    @staticmethod
+    def post(request):
+        # Validate API key
+        if request.headers.get("apiKey", "").lower() != config("CLIENT_API_KEY").lower():
+            return JsonResponse(
+                {"status": "error", "message": "Invalid API key"},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        channel_type = str(request.data.get("channel", "")).lower()
+        if channel_type != "whatsapp":
+            return JsonResponse(
+                {"status": "error", "message": f"Unsupported channel: {request.data.get('channel')}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        recipients = request.data.get("recipients")
+        if not recipients or not isinstance(recipients, list):
+            return JsonResponse(
+                {"status": "error", "message": "Missing recipients"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(recipients) > notifications.MAX_RECIPIENTS:
+            return JsonResponse(
+                {"status": "error", "message": f"At most {notifications.MAX_RECIPIENTS} recipients per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            results = notifications.send_bulk(
+                recipients,
+                mock_testing=request.headers.get('X-Mock-Testing') == 'true'
+            )
+        except Exception as e:
+            logger.error("Bulk notification error: %s", e)
+            return JsonResponse(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        summary = {}
+        for result in results:
+            summary[result["status"]] = summary.get(result["status"], 0) + 1
+        return JsonResponse(
+            {"status": "success", "summary": summary, "results": results},
+            status=status.HTTP_200_OK
+        )
+
+
+class InvalidateAccountHandles(APIView):
+    """Drop cached handle lookups of accounts that changed in credex core"""
+
+    parser_classes = (JSONParser,)
+    throttle_classes = []  # Disable throttling for webhook endpoint
+
+    @staticmethod
+    def post(request):
+        # Validate API key
+        if request.headers.get("apiKey", "").lower() != config("CLIENT_API_KEY").lower():
+            return JsonResponse(
+                {"status": "error", "message": "Invalid API key"},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        handles = request.data.get("handles")
+        if not handles or not isinstance(handles, list) or not all(isinstance(h, str) for h in handles):
+            return JsonResponse(
+                {"status": "error", "message": "Missing handles"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        handle_cache = get_handle_cache()
+        if handle_cache is None:
+            return JsonResponse({"status": "success", "invalidated": 0}, status=status.HTTP_200_OK)
+
+        try:
+            invalidated = handle_cache.invalidate(handles)
+        except Exception as e:
+            logger.error("Handle cache invalidation error: %s", e)
+            return JsonResponse(
+                {"status": "error", "message": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        return JsonResponse({"status": "success", "invalidated": invalidated}, status=status.HTTP_200_OK)
@@ -0,0 +1,319 @@
+"""Lean Cloud API webhook handling
+
+Webhook POSTs need none of DRF's dispatch, content negotiation, parsers or
+renderers, nor the CORS and Common middleware. This module handles them on
+their own:
+- handle_webhook() takes the raw body and its X-Hub-Signature-256 header
+  and returns a status code and a pre-encoded response body; bodies not
+  signed with the app secret get 401, status callbacks are ingested, user
+  messages are parsed once into an InboundEvent and run through the flow
+- handle_webhook_async() does the same from an event loop, running status
+  ingestion and flow work on flow threads (see core.flow.async_runner)
+- WebhookApplication (WSGI) and AsyncWebhookApplication (ASGI) wrap the
+  Django application and answer `POST /bot/webhook` directly, with call
+  budget tracking and the X-Call-Budget header as in CallBudgetMiddleware;
+  every other request goes to Django unchanged
+
+CredexCloudApiWebhook uses the same handler, so both paths behave the same.
+With TRAFFIC_RECORD_PATH set, processed user messages are also recorded for
+replay (see core.monitoring.traffic).
+"""
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.api.handle_prefetch import start_inbound_lookup
+from core.flow.async_runner import conversation_lock, run_sync
+from core.messaging.service import MessagingService
+from core.messaging.types import InboundEvent
+from core.monitoring.call_budget import track_calls
+from core.monitoring.metrics import WEBHOOK_LATENCY
+from core.monitoring.traffic import get_recorder, reset_channel, set_channel
+from core.state.manager import StateManager
+from decouple import config
+from django.conf import settings
+from services.whatsapp.flow_processor import WhatsAppFlowProcessor
+from services.whatsapp.inbound import (CHANNEL_TYPE, parse_webhook,
+                                       verify_signature)
+from services.whatsapp.service import WhatsAppMessagingService
+from services.whatsapp.statuses import extract_statuses, get_ingestor
+from services.whatsapp.state_manager import \
+    StateManager as WhatsAppStateManager
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_PATH = "/bot/webhook"
+
+# Meta only checks the status code; every handled callback gets this body
+RECEIVED = b'{"message": "received"}'
+INVALID_SIGNATURE = b'{"error": "invalid signature"}'
+
+_STATUS_LINES = {
+    200: "200 OK",
+    400: "400 Bad Request",
+    401: "401 Unauthorized",
+    500: "500 Internal Server Error"
+}
+_JSON_HEADER = ("Content-Type", "application/json")
+
+
+def _error_body(error: Exception) -> bytes:
+    return json.dumps({"error": str(error)}).encode()
+
+
+def _phone_number_id(mock_testing: bool):
+    """Business number to accept; the mock server may use any"""
+    return None if mock_testing else config("WHATSAPP_PHONE_NUMBER_ID")
+
+
+def get_messaging_service(state_manager, channel_type: str) -> Optional[MessagingService]:
+    """Get properly initialized messaging service with state and channel
+
+    Args:
+        state_manager: State manager instance
+        channel_type: Type of messaging channel
+
+    Returns:
+        MessagingService: Initialized messaging service, or None for a
+        channel without one
+    """
+    if channel_type != CHANNEL_TYPE:
+        return None
+
+    # Create core messaging service with channel service and state
+    return MessagingService(
+        channel_service=WhatsAppMessagingService(),
+        state_manager=state_manager
+    )
+
+
+def _ingest_statuses(statuses) -> Tuple[int, bytes]:
+    ingestor = get_ingestor()
+    if ingestor is None:
+        return 200, RECEIVED
+    try:
+        ingestor.ingest(statuses)
+    except Exception as e:
+        logger.error("Status ingestion error: %s", e)
+    return 200, RECEIVED
+
+
+def _process_event(event: InboundEvent, mock_testing: bool, started: float, body: bytes) -> Tuple[int, bytes]:
+    """Run an inbound message through the flow"""
+    recorder = get_recorder()
+    if recorder is None:
+        return _run_flow(event, mock_testing, started)
+
+    # Record the message with what it cost (see core.monitoring.traffic)
+    arrived = time.time() - (time.perf_counter() - started)
+    channel = set_channel(event.channel_id)
+    try:
+        state_before = StateManager(f"channel:{event.channel_id}").serialized_state()
+        result = _run_flow(event, mock_testing, started)
+        elapsed = time.perf_counter() - started
+        state_after = StateManager(f"channel:{event.channel_id}").serialized_state()
+        recorder.webhook(body, event.channel_id, arrived, elapsed, state_before, state_after)
+        return result
+    finally:
+        reset_channel(channel)
+
+
+def _run_flow(event: InboundEvent, mock_testing: bool, started: float) -> Tuple[int, bytes]:
+    try:
+        core_state_manager = StateManager(f"channel:{event.channel_id}")
+        state_manager = WhatsAppStateManager(core_state_manager)
+
+        # Look up a handle the message carries before anything is written
+        start_inbound_lookup(state_manager, event)
+
+        state_manager.initialize_channel(
+            channel_type=event.channel_type,
+            channel_id=event.channel_id,
+            mock_testing=mock_testing
+        )
+
+        # Label latency with the step that receives this message
+        path = state_manager.get_path() or "none"
+        component = state_manager.get_component() or "none"
+
+        service = get_messaging_service(state_manager, event.channel_type)
+        if service is None:
+            logger.error("Unsupported channel type: %s", event.channel_type)
+            return 400, _error_body(ValueError(f"Unsupported channel type: {event.channel_type}"))
+
+        try:
+            WhatsAppFlowProcessor(service, state_manager).process_message(event)
+        except Exception as e:
+            logger.error("Message processing error: %s", e)
+            return 500, _error_body(e)
+
+        WEBHOOK_LATENCY.labels(path=path, component=component).observe(time.perf_counter() - started)
+        return 200, RECEIVED
+
+    except Exception as e:
+        logger.error("Webhook error: %s", e)
+        return 500, _error_body(e)
+
+
+def _parse(body: bytes, mock_testing: bool) -> Optional[InboundEvent]:
+    # Parse the raw body once; everything downstream uses the event
+    event = parse_webhook(body, phone_number_id=_phone_number_id(mock_testing), mock_testing=mock_testing)
+    if event and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Inbound event: %s", event)
+    return event
+
+
+def handle_webhook(body: bytes, mock_testing: bool = False, signature: Optional[str] = None) -> Tuple[int, bytes]:
+    """Handle a Cloud API webhook POST
+
+    Args:
+        body: Raw request body
+        mock_testing: Whether the request came from the mock server
+        signature: X-Hub-Signature-256 header, None if missing
+
+    Returns:
+        Tuple of (HTTP status code, response body)
+    """
+    started = time.perf_counter()
+
+    if not verify_signature(body, signature):
+        logger.warning("Rejected webhook with invalid signature")
+        return 401, INVALID_SIGNATURE
+
+    statuses = extract_statuses(body, phone_number_id=_phone_number_id(mock_testing))
+    if statuses is not None:
+        return _ingest_statuses(statuses)
+
+    event = _parse(body, mock_testing)
+    if not event:
+        return 200, RECEIVED
+    return _process_event(event, mock_testing, started, body)
+
+
+async def handle_webhook_async(body: bytes, mock_testing: bool = False, signature: Optional[str] = None) -> Tuple[int, bytes]:
+    """Handle a Cloud API webhook POST from the event loop
+
+    Parsing happens on the loop; status ingestion and flow work run on flow
+    threads, one message per conversation at a time.
+
+    Args:
+        body: Raw request body
+        mock_testing: Whether the request came from the mock server
+        signature: X-Hub-Signature-256 header, None if missing
+
+    Returns:
+        Tuple of (HTTP status code, response body)
+    """
+    started = time.perf_counter()
+
+    if not verify_signature(body, signature):
+        logger.warning("Rejected webhook with invalid signature")
+        return 401, INVALID_SIGNATURE
+
+    statuses = extract_statuses(body, phone_number_id=_phone_number_id(mock_testing))
+    if statuses is not None:
+        return await run_sync(_ingest_statuses, statuses)
+
+    event = _parse(body, mock_testing)
+    if not event:
+        return 200, RECEIVED
+    async with conversation_lock(event.channel_id):
+        return await run_sync(_process_event, event, mock_testing, started, body)
+
+
+def _response_headers(budget, status_code: int, response_body: bytes, path: str, send_budget: bool) -> List[Tuple[str, str]]:
+    """Response headers, with the call budget logged as in CallBudgetMiddleware"""
+    headers = [_JSON_HEADER, ("Content-Length", str(len(response_body)))]
+    if send_budget:
+        headers.append(("X-Call-Budget", budget.header_value()))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Call budget %s: %s",
+            path,
+            budget.header_value(),
+            extra={"path": path, "status": status_code, "call_budget": budget.to_dict()}
+        )
+    return headers
+
+
+class WebhookApplication:
+    """WSGI application serving webhook POSTs without Django's request cycle"""
+
+    def __init__(self, django_application: Callable, path: str = WEBHOOK_PATH):
+        """Wrap the Django WSGI application
+
+        Args:
+            django_application: Application for every other request
+            path: Webhook path answered directly
+        """
+        self.django_application = django_application
+        self.path = path
+        self.header_enabled = getattr(settings, "CALL_BUDGET_HEADER", settings.DEBUG)
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        if environ.get("REQUEST_METHOD") != "POST" or environ.get("PATH_INFO") != self.path:
+            return self.django_application(environ, start_response)
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            length = 0
+        body = environ["wsgi.input"].read(length) if length > 0 else b""
+        mock_testing = environ.get("HTTP_X_MOCK_TESTING") == "true"
+        signature = environ.get("HTTP_X_HUB_SIGNATURE_256")
+
+        with track_calls() as budget:
+            status_code, response_body = handle_webhook(body, mock_testing, signature)
+
+        start_response(_STATUS_LINES[status_code], _response_headers(
+            budget, status_code, response_body, self.path, self.header_enabled
+        ))
+        return [response_body]
+
+
+class AsyncWebhookApplication:
+    """ASGI application serving webhook POSTs without Django's request cycle"""
+
+    def __init__(self, django_application: Callable, path: str = WEBHOOK_PATH):
+        """Wrap the Django ASGI application
+
+        Args:
+            django_application: Application for every other request
+            path: Webhook path answered directly
+        """
+        self.django_application = django_application
+        self.path = path
+        self.header_enabled = getattr(settings, "CALL_BUDGET_HEADER", settings.DEBUG)
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != self.path:
+            return await self.django_application(scope, receive, send)
+
+        chunks = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body = b"".join(chunks)
+        request_headers = dict(scope["headers"])
+        mock_testing = request_headers.get(b"x-mock-testing") == b"true"
+        signature = request_headers.get(b"x-hub-signature-256")
+
+        with track_calls() as budget:
+            status_code, response_body = await handle_webhook_async(
+                body, mock_testing, signature.decode("latin-1") if signature else None
+            )
+
+        headers = _response_headers(
+            budget, status_code, response_body, self.path, self.header_enabled
+        )
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers]
+        })
+        await send({"type": "http.response.body", "body": response_body})
@@ -6,37 +6,17 @@ This package provides the component system with:
 - Input components
 - API components
 - Confirm components
+
+Concrete components are imported lazily by name, so importing this package
+only loads the base interfaces.
 """
 
 # Base interfaces
 from .base import Component, InputComponent, DisplayComponent, ApiComponent
 from .confirm import ConfirmBase
 
-# Display components
-from .display.greeting import Greeting
-
-# Input components
-from .input.welcome import Welcome
-from .input.account_dashboard import AccountDashboard
-from .input.offer_list_display import OfferListDisplay
-from .input.view_ledger import ViewLedger
-from .input.amount_input import AmountInput
-from .input.first_name_input import FirstNameInput
-from .input.handle_input import HandleInput
-from .input.last_name_input import LastNameInput
-
-# API components
-from .api.process_offer_api_call import ProcessOfferApiCall
-from .api.create_credex_api_call import CreateCredexApiCall
-from .api.get_ledger_api_call import GetLedgerApiCall
-from .api.login_api_call import LoginApiCall
-from .api.onboard_member_api_call import OnBoardMemberApiCall
-from .api.upgrade_membertier_api_call import UpgradeMembertierApiCall
-from .api.validate_account_api_call import ValidateAccountApiCall
-
-# Confirm components
-from .confirm.confirm_offer_secured import ConfirmOfferSecured
-from .confirm.confirm_upgrade import ConfirmUpgrade
+# Concrete components load on first access (see registry.py)
+from .registry import COMPONENTS, get_component_class
 
 __all__ = [
     # Base interfaces
@@ -72,3 +52,10 @@ __all__ = [
     "ConfirmOfferSecured",
     "ConfirmUpgrade"
 ]
+
+
+def __getattr__(name: str):
+    """Load a concrete component on first access"""
+    if name in COMPONENTS:
+        return get_component_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
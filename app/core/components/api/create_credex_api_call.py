@@ -2,13 +2,17 @@
 
 Handles creating a new Credex offer through the API:
 - Gets offer data from component_data.data (unvalidated)
+- Turns back offers that break the local offer rules without calling the API
 - Creates new Credex offer via API
 - Updates state with schema-validated dashboard data
+- Records the recipient in the member's recent counterparties
 """
 
 from typing import Any, Dict
 
 from core.api.base import handle_api_response, make_api_request
+from core.api.counterparties import get_recent_counterparties
+from core.api.offer_rules import check_offer
 from core.error.types import ValidationResult
 
 from ..base import ApiComponent
@@ -95,6 +99,14 @@ class CreateCredexApiCall(ApiComponent):
                 details={"component": self.type}
             )
 
+        # Check against the dashboard before the backend
+        rules = check_offer(self.state_manager, amount, denom)
+        if not rules.valid:
+            self.state_manager.messaging.send_text(f"❌ {rules.error['message']}")
+            self.update_data({})
+            self.set_result("show_dashboard")
+            return ValidationResult.success({"status": "error", "action": {}})
+
         # Make API call
         url = "createCredex"
         payload = {
@@ -134,6 +146,9 @@ class CreateCredexApiCall(ApiComponent):
         # Send notification based on action type
         if action.get("type") == "CREDEX_CREATED":
             self.state_manager.messaging.send_text("✅ Secured credex offered")
+            counterparties = get_recent_counterparties()
+            if counterparties:
+                counterparties.record(member_id, recipient_account)
         else:
             self.state_manager.messaging.send_text("❌ Failed to offer secured credex")
 
@@ -125,13 +125,8 @@ class GetLedgerApiCall(ApiComponent):
         """Process API response and update state"""
         try:
             # Get account details for display
-            dashboard = self.state_manager.get_state_value("dashboard", {})
             active_account_id = self.state_manager.get_state_value("active_account_id")
-            account = next(
-                (acc for acc in dashboard.get("accounts", [])
-                 if acc.get("accountID") == active_account_id),
-                None
-            )
+            account = self.state_manager.get_dashboard_index().account(active_account_id)
             if not account:
                 return ValidationResult.failure(
                     message="Active account not found",
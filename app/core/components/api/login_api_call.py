@@ -67,12 +67,7 @@ class LoginApiCall(ApiComponent):
 
             # For existing members, set active account
             try:
-                dashboard = self.state_manager.get_state_value("dashboard", {})
-                accounts = dashboard.get("accounts", [])
-                personal_account = next(
-                    (acc for acc in accounts if acc.get("accountType") == "PERSONAL"),
-                    None
-                )
+                personal_account = self.state_manager.get_dashboard_index().personal_account
                 if not personal_account:
                     return ValidationResult.failure(
                         message="Login failed: No personal account found",
@@ -80,7 +80,7 @@ class ProcessOfferApiCall(ApiComponent):
             return self._process_response(result.value, config)
 
         except Exception as e:
-            logger.error(f"Error in offer API call: {str(e)}")
+            logger.error("Error in offer API call: %s", e)
             return ValidationResult.failure(
                 message=f"Failed to process offer: {str(e)}",
                 field="api_call",
@@ -104,7 +104,7 @@ class ProcessOfferApiCall(ApiComponent):
             return member_id, account_id, credex_id
 
         except Exception as e:
-            logger.error(f"Error getting required data: {str(e)}")
+            logger.error("Error getting required data: %s", e)
             return None, None, None
 
     def _make_api_call(
@@ -130,7 +130,7 @@ class ProcessOfferApiCall(ApiComponent):
                 state_manager=self.state_manager
             )
             if error:
-                logger.error(f"Failed to {config['error_prefix']} offer: {error}")
+                logger.error("Failed to %s offer: %s", config['error_prefix'], error)
                 return ValidationResult.failure(
                     message=f"Failed to {config['error_prefix']} offer: {error}",
                     field="api_call",
@@ -140,7 +140,7 @@ class ProcessOfferApiCall(ApiComponent):
             return ValidationResult.success(result)
 
         except Exception as e:
-            logger.error(f"Error making API call: {str(e)}")
+            logger.error("Error making API call: %s", e)
             return ValidationResult.failure(
                 message=f"Failed to {config['error_prefix']} offer: {str(e)}",
                 field="api_call",
@@ -158,42 +158,37 @@ class ProcessOfferApiCall(ApiComponent):
             action_type = action.get("type")
 
             if action_type == config["success_action"]:
-                logger.info(f"Offer {config['error_prefix']}ed successfully")
+                logger.info("Offer %sed successfully", config['error_prefix'])
 
                 # Send success notification
                 self.state_manager.messaging.send_text(f"{config['emoji']} Credex offer {config['error_prefix']}ed")
 
                 # Check for more pending offers
-                dashboard = self.state_manager.get_state_value("dashboard", {})
                 active_account_id = self.state_manager.get_state_value("active_account_id")
-                active_account = next(
-                    (acc for acc in dashboard.get("accounts", []) if acc.get("accountID") == active_account_id),
-                    None
-                )
+                pending_in, pending_out = self.state_manager.get_dashboard_index().counts(active_account_id)
 
                 # Get context to check correct offer list
                 context = self.state_manager.get_path()
-                offer_list = []
-                if active_account:
-                    if context in {"accept_offer", "decline_offer"}:
-                        offer_list = active_account.get("pendingInData", [])
-                    elif context == "cancel_offer":
-                        offer_list = active_account.get("pendingOutData", [])
+                remaining = 0
+                if context in {"accept_offer", "decline_offer"}:
+                    remaining = pending_in
+                elif context == "cancel_offer":
+                    remaining = pending_out
 
                 # Log offer list status
-                logger.info(f"Remaining offers for {context}: {len(offer_list)}")
+                logger.info("Remaining offers for %s: %s", context, remaining)
 
                 # Return to list if more offers, otherwise to dashboard
-                if offer_list and len(offer_list) > 0:
+                if remaining > 0:
                     # Tell headquarters to return to list
                     self.set_result("return_to_list")
-                    logger.info(f"Returning to list with {len(offer_list)} remaining offers")
+                    logger.info("Returning to list with %s remaining offers", remaining)
                 else:
                     # Tell headquarters to show dashboard
                     self.set_result("send_dashboard")
                     logger.info("No more offers, returning to dashboard")
             else:
-                logger.warning(f"Unexpected action type: {action_type}")
+                logger.warning("Unexpected action type: %s", action_type)
                 # Tell headquarters to show error
                 self.set_result("show_error")
 
@@ -203,7 +198,7 @@ class ProcessOfferApiCall(ApiComponent):
             })
 
         except Exception as e:
-            logger.error(f"Error processing response: {str(e)}")
+            logger.error("Error processing response: %s", e)
             return ValidationResult.failure(
                 message=f"Failed to process response: {str(e)}",
                 field="response",
@@ -1,14 +1,20 @@
 """Validate account API call component
 
 Validates account exists and gets account details:
-- Validates account via API
+- Uses the speculative lookup started when the handle arrived (its
+  response, or the cached lookup it read)
+- Else serves handles from the shared handle cache when fresh
+- Otherwise validates account via API and caches the result
 - handle_api_response stores details in state.action
 - Returns success/failure based on action type
 """
 import logging
 from typing import Any, Dict
 
+from core.api.api_response import store_account_found
 from core.api.base import handle_api_response, make_api_request
+from core.api.handle_cache import get_handle_cache
+from core.api.handle_prefetch import take_handle_lookup
 from core.error.types import ValidationResult
 
 from ..base import ApiComponent
@@ -29,7 +35,8 @@ class ValidateAccountApiCall(ApiComponent):
         """Validate account exists and get details
 
         Makes API call to validate account and stores details in state:
-        1. Calls getAccountByHandle endpoint
+        1. Uses the speculative lookup's response or cached lookup, else the
+           cached lookup if fresh, else calls getAccountByHandle
         2. handle_api_response stores account details in state.action
         3. Verifies ACCOUNT_FOUND action type
         4. Returns success/failure with appropriate error details
@@ -59,19 +66,29 @@ class ValidateAccountApiCall(ApiComponent):
 
         logger.info(f"Validating account handle: {handle}")
 
-        # Make API call
-        logger.debug("Making API call to getAccountByHandle")
-        url = "getAccountByHandle"
-        payload = {
-            "accountHandle": handle
-        }
-
-        # Make request and let handle_api_response store action in state
-        response = make_api_request(
-            url=url,
-            payload=payload,
-            state_manager=self.state_manager
-        )
+        handle_cache = get_handle_cache()
+        response = take_handle_lookup(self.state_manager, handle)
+        if response is None or isinstance(response, dict):
+            # Cached lookup, read by the prefetch or here
+            cached = response if response is not None else (handle_cache.lookup(handle) if handle_cache else None)
+            if cached is not None:
+                if not cached.get("found"):
+                    return self._account_not_found()
+                return self._cached_account_found(cached["details"])
+
+            # Make API call
+            logger.debug("Making API call to getAccountByHandle")
+            url = "getAccountByHandle"
+            payload = {
+                "accountHandle": handle
+            }
+
+            # Make request and let handle_api_response store action in state
+            response = make_api_request(
+                url=url,
+                payload=payload,
+                state_manager=self.state_manager
+            )
 
         # Let handle_api_response store action in state
         logger.debug("Processing API response")
@@ -107,20 +124,9 @@ class ValidateAccountApiCall(ApiComponent):
 
         # Check for not found error
         if action_type == "ERROR_NOT_FOUND":
-            # Send friendly error message
-            self.state_manager.messaging.send_text(
-                text="❌ Oops, that 💳accountHandle doesn't exist. Please try again."
-            )
-            # Return to handle input
-            self.update_component_data(
-                data={"handle": None},  # Clear invalid handle but preserve other data like amount
-                awaiting_input=False
-            )
-            return ValidationResult.failure(
-                message="Account not found",
-                field="handle",
-                details={"error": "ACCOUNT_NOT_FOUND", "retry": True}
-            )
+            if handle_cache:
+                handle_cache.store_not_found(handle)
+            return self._account_not_found()
 
         # Check for success
         if action_type != "ACCOUNT_FOUND":
@@ -130,9 +136,35 @@ class ValidateAccountApiCall(ApiComponent):
                 details={"action_type": action_type}
             )
 
+        details = action.get("details") or {}
+        if handle_cache and details.get("accountID"):
+            handle_cache.store_found(handle, details)
+
         # Success - account details are in state.action.details
         return ValidationResult.success(None)
 
+    def _account_not_found(self) -> ValidationResult:
+        """Tell the member and return to handle input"""
+        # Send friendly error message
+        self.state_manager.messaging.send_text(
+            text="❌ Oops, that 💳accountHandle doesn't exist. Please try again."
+        )
+        # Return to handle input
+        self.update_component_data(
+            data={"handle": None},  # Clear invalid handle but preserve other data like amount
+            awaiting_input=False
+        )
+        return ValidationResult.failure(
+            message="Account not found",
+            field="handle",
+            details={"error": "ACCOUNT_NOT_FOUND", "retry": True}
+        )
+
+    def _cached_account_found(self, details: Dict[str, Any]) -> ValidationResult:
+        """Store cached account details in state.action as the API response would"""
+        store_account_found(self.state_manager, details)
+        return ValidationResult.success(None)
+
     def to_verified_data(self, value: Any) -> Dict:
         """Convert API response to verified data
 
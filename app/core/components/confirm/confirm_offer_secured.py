@@ -113,11 +113,7 @@ class ConfirmOfferSecured(ConfirmBase):
                 value=str(dashboard)
             )
 
-        active_account = next(
-            (acc for acc in dashboard.get("accounts", [])
-             if acc.get("accountID") == active_account_id),
-            None
-        )
+        active_account = self.state_manager.get_dashboard_index().account(active_account_id)
         if not active_account or not active_account.get("accountName"):
             raise ComponentException(
                 message="Missing active account details",
@@ -1,16 +1,22 @@
 """Account dashboard component
 
 This component handles displaying the account dashboard with proper validation.
-Also handles initial state setup after login.
+Also handles initial state setup after login, and one-shot offer commands
+("50 USD to @alice") typed instead of a menu selection.
 """
 
 import logging
 from typing import Any
 
+from core.api.offer_rules import check_offer
 from core.components.base import InputComponent
 from core.error.exceptions import ComponentException
 from core.error.types import ValidationResult
-from core.messaging.types import InteractiveType, MessageType, Section
+from core.messaging.skeletons import register_skeleton, slot
+from core.messaging.types import (InteractiveContent, InteractiveType,
+                                  MessageType, Section)
+
+from .offer_command import parse_offer_command
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,43 @@ ACCOUNT_DASHBOARD = """*💳 {account}*
 *📊 {net_assets}{tier_limit_display}*"""
 
 
+@register_skeleton("account_dashboard.menu")
+def dashboard_menu(has_pending_in: bool, has_pending_out: bool, can_upgrade: bool) -> InteractiveContent:
+    """Dashboard menu with the account info as body and pending counts as slots"""
+    sections = []
+
+    # Credex Actions section
+    credex_options = []
+    credex_options.append({"id": "offer_secured", "title": "💸 Offer Secured Credex 💸", "description": "Send a credex backed by currency or gold from your Secured Balances"})
+    if has_pending_in:
+        credex_options.append({"id": "accept_offer", "title": "✅ Accept Offers ✅", "description": f"You have {slot('pending_in')} offers waiting"})
+        credex_options.append({"id": "decline_offer", "title": "❌ Decline Offers ❌", "description": f"You have {slot('pending_in')} offers waiting"})
+    if has_pending_out:
+        credex_options.append({"id": "cancel_offer", "title": "🚫 Cancel Offers 🚫", "description": f"You have {slot('pending_out')} offers pending"})
+
+    sections.append(Section(
+        title="Credex Actions",
+        rows=credex_options
+    ))
+
+    # Account Actions section - commented out for now
+    # {"id": "view_ledger", "title": "📊 View account ledger", "description": "View account ledger"}
+
+    # Member Actions section - only show if there are member actions
+    if can_upgrade:
+        sections.append(Section(
+            title="Member Actions",
+            rows=[{"id": "upgrade_membertier", "title": "⭐ Upgrade Member Tier", "description": "Upgrade to the Hustler tier for $1"}]
+        ))
+
+    return InteractiveContent(
+        interactive_type=InteractiveType.LIST,
+        body=slot("account_info"),
+        sections=sections,
+        button_text="Actions 🪄"
+    )
+
+
 class AccountDashboard(InputComponent):
     """Handles account dashboard display and initial state"""
 
@@ -63,11 +106,8 @@ class AccountDashboard(InputComponent):
                     )
 
                 # Find active account
-                accounts = dashboard.get("accounts", [])
-                active_account = next(
-                    (acc for acc in accounts if acc.get("accountID") == active_account_id),
-                    None
-                )
+                dashboard_index = self.state_manager.get_dashboard_index()
+                active_account = dashboard_index.account(active_account_id)
                 if not active_account:
                     return ValidationResult.failure(
                         message="Active account not found",
@@ -122,61 +162,24 @@ class AccountDashboard(InputComponent):
                 account_info = ACCOUNT_DASHBOARD.format(**formatted_data)
 
                 # Get pending counts from active account
-                pending_in = len(active_account.get("pendingInData", []))
-                pending_out = len(active_account.get("pendingOutData", []))
-
-                logger.info(f"Active account pendingOutData in dashboard: {active_account.get('pendingOutData')}")
-                logger.info(f"Pending out count: {pending_out}")
-
-                # Define sections for menu options
-                sections = []
-
-                # Credex Actions section
-                credex_options = []
-                credex_options.append({"id": "offer_secured", "title": "💸 Offer Secured Credex 💸", "description": "Send a credex backed by currency or gold from your Secured Balances"})
-                if pending_in > 0:
-                    credex_options.append({"id": "accept_offer", "title": "✅ Accept Offers ✅", "description": f"You have {pending_in} offers waiting"})
-                    credex_options.append({"id": "decline_offer", "title": "❌ Decline Offers ❌", "description": f"You have {pending_in} offers waiting"})
-                if pending_out > 0:
-                    credex_options.append({"id": "cancel_offer", "title": "🚫 Cancel Offers 🚫", "description": f"You have {pending_out} offers pending"})
-
-                if credex_options:
-                    sections.append(Section(
-                        title="Credex Actions",
-                        rows=credex_options
-                    ))
-
-                # Account Actions section
-                account_options = []
-                # Commented out for now
-                # account_options.append({"id": "view_ledger", "title": "📊 View account ledger", "description": "View account ledger"})
-
-                if account_options:
-                    sections.append(Section(
-                        title="Account Actions",
-                        rows=account_options
-                    ))
-
-                # Member Actions section - only show if there are member actions
-                member_options = []
-                if member.get("memberTier") == 1:
-                    member_options.append({"id": "upgrade_membertier", "title": "⭐ Upgrade Member Tier", "description": "Upgrade to the Hustler tier for $1"})
-
-                if member_options:
-                    sections.append(Section(
-                        title="Member Actions",
-                        rows=member_options
-                    ))
+                pending_in, pending_out = dashboard_index.counts(active_account_id)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Pending in/out counts: %d/%d", pending_in, pending_out)
 
                 try:
                     # Set component to await input before sending menu
                     self.set_awaiting_input(True)
 
-                    # Pass properly structured menu data to messaging service
-                    self.state_manager.messaging.send_interactive(
-                        body=account_info,
-                        sections=sections,
-                        button_text="Actions 🪄"
+                    # Menu rows depend only on which actions are available
+                    self.state_manager.messaging.send_skeleton(
+                        "account_dashboard.menu",
+                        values={
+                            "account_info": account_info,
+                            "pending_in": pending_in,
+                            "pending_out": pending_out
+                        },
+                        shape=(pending_in > 0, pending_out > 0, member.get("memberTier") == 1)
                     )
 
                     return ValidationResult.success(formatted_data)
@@ -193,6 +196,25 @@ class AccountDashboard(InputComponent):
             component_data = self.state_manager.get_state_value("component_data", {})
             incoming_message = component_data.get("incoming_message", {})
 
+            # One-shot offer command - go straight to account validation
+            if incoming_message.get("type") == MessageType.TEXT.value:
+                command = parse_offer_command(incoming_message.get("text", {}).get("body", ""))
+                if command is not None:
+                    if not command.valid:
+                        return command
+                    rules = check_offer(self.state_manager, command.value["amount"], command.value["denom"])
+                    if not rules.valid:
+                        self.state_manager.messaging.send_text(f"❌ {rules.error['message']}")
+                        return rules
+                    self.update_data({
+                        "amount": str(command.value["amount"]),
+                        "denom": command.value["denom"],
+                        "handle": command.value["handle"]
+                    })
+                    self.set_result("offer_command")
+                    self.set_awaiting_input(False)
+                    return ValidationResult.success(True)
+
             # For interactive messages, extract selection ID
             if incoming_message.get("type") == MessageType.INTERACTIVE.value:
                 text = incoming_message.get("text", {})
@@ -1,16 +1,18 @@
 """Amount input component
 
-This component handles amount input with proper validation.
+This component handles amount input with proper validation. A full offer
+command ("50 USD to @alice") is accepted here too, skipping the handle prompt.
 """
 
-from typing import Any, Dict, Set
+from typing import Any, Dict
 
+from core.api.offer_rules import VALID_DENOMS, check_offer
 from core.error.types import ValidationResult
+from core.messaging.skeletons import register_skeleton
+from core.messaging.types import TextContent
 
 from ..base import InputComponent
-
-# Valid denominations
-VALID_DENOMS: Set[str] = {"CXX", "XAU", "USD", "CAD", "ZWG"}
+from .offer_command import parse_offer_command
 
 # Amount prompt template
 AMOUNT_PROMPT = """💸 *Offer how much❓*
@@ -19,7 +21,14 @@ AMOUNT_PROMPT = """💸 *Offer how much❓*
 ✨ Denom placement:
 *99 ZWG* || *ZWG 99*
 ✨ Denominations:
-*CXX* || *XAU* || *USD* || *CAD* || *ZWG*"""
+*CXX* || *XAU* || *USD* || *CAD* || *ZWG*
+✨ Amount and recipient at once:
+*99 ZWG to @handle*"""
+
+
+@register_skeleton("amount_input.prompt")
+def amount_prompt() -> TextContent:
+    return TextContent(body=AMOUNT_PROMPT)
 
 
 class AmountInput(InputComponent):
@@ -44,9 +53,7 @@ class AmountInput(InputComponent):
 
         # Initial activation - send prompt
         if not current_data.get("awaiting_input"):
-            self.state_manager.messaging.send_text(
-                text=AMOUNT_PROMPT
-            )
+            self.state_manager.messaging.send_skeleton("amount_input.prompt")
             self.set_awaiting_input(True)
             return ValidationResult.success(None)
 
@@ -70,6 +77,23 @@ class AmountInput(InputComponent):
                 details={"message": incoming_message}
             )
 
+        # Full offer command - amount and handle together
+        command = parse_offer_command(text)
+        if command is not None:
+            if not command.valid:
+                return command
+            rules = check_offer(self.state_manager, command.value["amount"], command.value["denom"])
+            if not rules.valid:
+                return self._rejected(rules)
+            self.update_data({
+                "amount": str(command.value["amount"]),
+                "denom": command.value["denom"],
+                "handle": command.value["handle"]
+            })
+            self.set_result("offer_command")
+            self.set_awaiting_input(False)
+            return ValidationResult.success({"amount": command.value["amount"], "denom": command.value["denom"]})
+
         try:
             # Split input into parts
             parts = text.strip().split()
@@ -112,6 +136,11 @@ class AmountInput(InputComponent):
                     details={"amount": amount}
                 )
 
+            # Turn back offers the backend would reject
+            rules = check_offer(self.state_manager, amount, denom)
+            if not rules.valid:
+                return self._rejected(rules)
+
             # Store validated amount and denom
             self.update_data({
                 "amount": str(amount),
@@ -129,6 +158,11 @@ class AmountInput(InputComponent):
                 details={"text": text}
             )
 
+    def _rejected(self, result: ValidationResult) -> ValidationResult:
+        """Tell the member why the offer can't be made and wait for another amount"""
+        self.state_manager.messaging.send_text(f"❌ {result.error['message']}")
+        return result
+
     def to_verified_data(self, value: Any) -> Dict:
         """Convert to verified amount and denomination"""
         if isinstance(value, dict):
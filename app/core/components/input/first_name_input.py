@@ -7,6 +7,18 @@ from typing import Any, Dict
 
 from core.components.base import InputComponent
 from core.error.types import ValidationResult
+from core.messaging.skeletons import register_skeleton
+from core.messaging.types import TextContent
+
+# First name prompt template
+FIRSTNAME_PROMPT = """🔥 Excellent, let's get you signed up.
+
+🌞 What's your first name?"""
+
+
+@register_skeleton("firstname_input.prompt")
+def firstname_prompt() -> TextContent:
+    return TextContent(body=FIRSTNAME_PROMPT)
 
 
 class FirstNameInput(InputComponent):
@@ -23,11 +35,7 @@ class FirstNameInput(InputComponent):
 
         # Initial activation - send prompt
         if not current_data.get("awaiting_input"):
-            self.state_manager.messaging.send_text(
-                text="""🔥 Excellent, let's get you signed up.
-
-🌞 What's your first name?"""
-            )
+            self.state_manager.messaging.send_skeleton("firstname_input.prompt")
             self.set_awaiting_input(True)
             return ValidationResult.success(None)
 
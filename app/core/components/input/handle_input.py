@@ -1,16 +1,31 @@
 """Handle input component
 
 This component handles Credex handle input with proper validation.
+Members with recent counterparties get them as a list to pick from; a pick
+reuses the stored account details instead of validating a typed handle.
 """
 
-from typing import Any
+from typing import Any, Dict, List
 
+from core.api.api_response import store_account_found
+from core.api.counterparties import get_recent_counterparties
 from core.error.types import ValidationResult
+from core.messaging.skeletons import register_skeleton
+from core.messaging.types import Section, TextContent
 
 from ..base import InputComponent
 
 # Handle prompt template
 HANDLE_PROMPT = "*💳 What's the account handle❓*"
+RECENT_PROMPT = "Pick a recent account or type a handle."
+
+# List row ids of recent counterparties
+COUNTERPARTY_PREFIX = "counterparty:"
+
+
+@register_skeleton("handle_input.prompt")
+def handle_prompt() -> TextContent:
+    return TextContent(body=HANDLE_PROMPT)
 
 
 class HandleInput(InputComponent):
@@ -33,11 +48,13 @@ class HandleInput(InputComponent):
         current_data = self.state_manager.get_state_value("component_data", {})
         incoming_message = current_data.get("incoming_message")
 
-        # Initial activation - send prompt
+        # Initial activation - send recent counterparties or prompt
         if not current_data.get("awaiting_input"):
-            self.state_manager.messaging.send_text(
-                text=HANDLE_PROMPT
-            )
+            recent = self._recent_counterparties()
+            if recent:
+                self._send_recent(recent)
+            else:
+                self.state_manager.messaging.send_skeleton("handle_input.prompt")
             self.set_awaiting_input(True)
             return ValidationResult.success(None)
 
@@ -45,6 +62,10 @@ class HandleInput(InputComponent):
         if not incoming_message:
             return ValidationResult.success(None)
 
+        # Recent counterparty picked from the list
+        if isinstance(incoming_message, dict) and incoming_message.get("type") == "interactive":
+            return self._pick_recent(incoming_message.get("text", {}))
+
         # Get text from message
         if not isinstance(incoming_message, dict):
             return ValidationResult.failure(
@@ -82,3 +103,56 @@ class HandleInput(InputComponent):
         # Release input wait
         self.set_awaiting_input(False)
         return ValidationResult.success(None)  # Signal to move to ConfirmOfferSecured
+
+    def _member_id(self) -> str:
+        dashboard = self.state_manager.get_state_value("dashboard", {}) or {}
+        return dashboard.get("member", {}).get("memberID", "")
+
+    def _recent_counterparties(self) -> List[Dict[str, Any]]:
+        """Member's recent counterparties, if enabled and known"""
+        counterparties = get_recent_counterparties()
+        member_id = self._member_id()
+        if not counterparties or not member_id:
+            return []
+        return counterparties.recent(member_id)
+
+    def _send_recent(self, recent: List[Dict[str, Any]]) -> None:
+        """Offer recent counterparties as a list (titles 24, descriptions 72 chars)"""
+        rows = [
+            {
+                "id": f"{COUNTERPARTY_PREFIX}{entry['accountID']}",
+                "title": (entry.get("accountName") or entry["accountHandle"])[:24],
+                "description": f"@{entry['accountHandle']}"[:72]
+            }
+            for entry in recent
+        ]
+        self.state_manager.messaging.send_interactive(
+            body=f"{HANDLE_PROMPT}\n{RECENT_PROMPT}",
+            sections=[Section(title="Recent Accounts 💳", rows=rows)],
+            button_text="Recent Accounts"
+        )
+
+    def _pick_recent(self, text: Dict[str, Any]) -> ValidationResult:
+        """Use the account details of a picked recent counterparty"""
+        selection = text.get("list_reply", {}).get("id", "") if text.get("interactive_type") == "list" else ""
+        counterparties = get_recent_counterparties()
+        entry = None
+        if selection.startswith(COUNTERPARTY_PREFIX) and counterparties:
+            entry = counterparties.pick(self._member_id(), selection[len(COUNTERPARTY_PREFIX):])
+        if not entry:
+            return ValidationResult.failure(
+                message="Please pick an account from the list or type a handle",
+                field="list_reply",
+                details={"text": text}
+            )
+
+        # Store handle and account details as ValidateAccountApiCall would
+        self.update_data({"handle": entry["accountHandle"]})
+        store_account_found(self.state_manager, entry)
+
+        # Tell headquarters the account is already validated
+        self.set_result("recent_counterparty")
+
+        # Release input wait
+        self.set_awaiting_input(False)
+        return ValidationResult.success(None)
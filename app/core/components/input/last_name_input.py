@@ -6,9 +6,19 @@ This component handles last name input with proper validation.
 from typing import Any, Dict
 
 from core.error.types import ValidationResult
+from core.messaging.skeletons import register_skeleton
+from core.messaging.types import TextContent
 
 from core.components.base import InputComponent
 
+# Last name prompt template
+LASTNAME_PROMPT = "👍🏿 And your last name?"
+
+
+@register_skeleton("lastname_input.prompt")
+def lastname_prompt() -> TextContent:
+    return TextContent(body=LASTNAME_PROMPT)
+
 
 class LastNameInput(InputComponent):
     """Last name input with validation"""
@@ -24,9 +34,7 @@ class LastNameInput(InputComponent):
 
         # Initial activation - send prompt
         if not current_data.get("awaiting_input"):
-            self.state_manager.messaging.send_text(
-                text="👍🏿 And your last name?"
-            )
+            self.state_manager.messaging.send_skeleton("lastname_input.prompt")
             self.set_awaiting_input(True)
             return ValidationResult.success(None)
 
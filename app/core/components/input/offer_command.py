@@ -0,0 +1,84 @@
+"""One-shot offer commands
+
+Parses a whole secured offer from one text message, so a member can skip the
+amount and handle prompts:
+- "50 USD to @alice", "USD 50 to alice", "50 to @alice" (defaults to USD)
+- "@alice 50 ZWG", "send 50 to alice", "pay alice 50 CAD"
+
+Text that isn't an offer expression is left to the component that received
+it. A handle must be marked with "@", "to" or a leading verb, so a plain
+amount or "ZWG 99" is never mistaken for an offer, and a denomination is
+only taken as a handle with "@" ("send 50 usd" is not an offer).
+"""
+
+import re
+from typing import Optional
+
+from core.api.offer_rules import VALID_DENOMS
+from core.error.types import ValidationResult
+
+MAX_HANDLE_LENGTH = 30
+
+_VERB = r"(?:(?P<verb>send|offer|pay)\s+)?"
+_DENOMS = {denom.lower() for denom in VALID_DENOMS}
+_DENOM = "|".join(sorted(_DENOMS))
+_AMOUNT = (
+    rf"(?:(?P<denom_before>{_DENOM})\s*)?"
+    r"(?P<amount>\d+(?:\.\d+)?)"
+    rf"(?:\s*(?P<denom_after>{_DENOM}))?"
+)
+_HANDLE = r"(?P<at>@)?(?P<handle>[^\s@]+)"
+
+# Amount first ("50 usd to @alice"), then handle first ("@alice 50 usd")
+_PATTERNS = (
+    re.compile(rf"^{_VERB}{_AMOUNT}\s+(?:(?P<to>to)\s+)?{_HANDLE}$", re.IGNORECASE),
+    re.compile(rf"^{_VERB}{_HANDLE}\s+{_AMOUNT}$", re.IGNORECASE),
+)
+
+
+def parse_offer_command(text: str) -> Optional[ValidationResult]:
+    """Parse a one-shot offer expression
+
+    Args:
+        text: Message text
+
+    Returns:
+        None if the text is not an offer expression, otherwise a
+        ValidationResult whose value is {"amount", "denom", "handle"} or
+        whose error explains what is wrong with the offer
+    """
+    normalized = " ".join(text.split())
+    for pattern in _PATTERNS:
+        match = pattern.match(normalized)
+        if not match or not (match.group("verb") or match.group("at") or match.groupdict().get("to")):
+            continue
+        if match.group("at") or match.group("handle").lower() not in _DENOMS:
+            break
+    else:
+        return None
+
+    if match.group("denom_before") and match.group("denom_after"):
+        return ValidationResult.failure(
+            message="Give the denomination once, before or after the amount",
+            field="denomination",
+            details={"text": text}
+        )
+
+    amount = float(match.group("amount"))
+    if amount <= 0:
+        return ValidationResult.failure(
+            message="Amount must be positive",
+            field="amount",
+            details={"amount": amount}
+        )
+
+    handle = match.group("handle")
+    if len(handle) > MAX_HANDLE_LENGTH:
+        return ValidationResult.failure(
+            message=f"Handle too long (max {MAX_HANDLE_LENGTH} chars)",
+            field="handle",
+            details={"length": len(handle)}
+        )
+
+    denom = (match.group("denom_before") or match.group("denom_after") or "usd").upper()
+    return ValidationResult.success({"amount": amount, "denom": denom, "handle": handle})
@@ -19,6 +19,13 @@ TITLES = {
     "cancel_offer": "*Cancel An Offer*"
 }
 
+# Pending offer direction listed in each context
+DIRECTIONS = {
+    "accept_offer": "in",
+    "decline_offer": "in",
+    "cancel_offer": "out"
+}
+
 
 class OfferListDisplay(InputComponent):
     """Handles displaying a list of Credex offers and processing selection"""
@@ -115,7 +122,6 @@ class OfferListDisplay(InputComponent):
         try:
             # Get dashboard data
             dashboard = self.state_manager.get_state_value("dashboard")
-            logger.info(f"Dashboard state: {dashboard}")
             if not dashboard:
                 return ValidationResult.failure(
                     message="No dashboard data found",
@@ -125,8 +131,9 @@ class OfferListDisplay(InputComponent):
 
             # Get context and offers
             context = self.state_manager.get_path()
-            offers = self._get_offers_for_context(context, dashboard)
-            logger.info(f"Got offers in _display_offers: {offers}")
+            offers = self._get_offers_for_context(context)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Got %d offers for %s", len(offers), context)
 
             # Display offers if available
             if offers and len(offers) > 0:  # Explicitly check length
@@ -201,50 +208,35 @@ class OfferListDisplay(InputComponent):
                 }
             )
 
-    def _get_offers_for_context(self, context: str, dashboard: Dict) -> List[Dict]:
+    def _get_offers_for_context(self, context: str) -> List[Dict]:
         """Get relevant offers based on context"""
         # Get active account
         active_account_id = self.state_manager.get_state_value("active_account_id")
         if not active_account_id:
-            logger.info("No active_account_id found in state")
+            logger.warning("No active_account_id found in state")
             return []
 
         # Find active account
-        accounts = dashboard.get("accounts", [])
-        active_account = next(
-            (acc for acc in accounts if acc.get("accountID") == active_account_id),
-            None
-        )
-        if not active_account:
-            logger.info(f"Active account {active_account_id} not found in dashboard accounts")
+        dashboard_index = self.state_manager.get_dashboard_index()
+        if not dashboard_index.account(active_account_id):
+            logger.warning("Active account %s not found in dashboard accounts", active_account_id)
             return []
 
-        # Get offers based on context
-        logger.info(f"Context: {context}")
-        logger.info(f"Active account pendingOutData: {active_account.get('pendingOutData')}")
-
         # Get relevant offers list
-        offers = []
-        if context in {"accept_offer", "decline_offer"}:
-            offers = active_account.get("pendingInData", [])
-        elif context == "cancel_offer":
-            offers = active_account.get("pendingOutData", [])
-
-        logger.info(f"Returning offers for {context}: {offers}")
-        return offers
+        direction = DIRECTIONS.get(context)
+        return dashboard_index.offers(active_account_id, direction) if direction else []
 
     def _is_valid_offer(self, credex_id: str) -> bool:
         """Check if credex_id exists in available offers"""
         try:
-            # Get dashboard and context
-            dashboard = self.state_manager.get_state_value("dashboard", {})
-            context = self.state_manager.get_path()
-
-            # Get relevant offers
-            offers = self._get_offers_for_context(context, dashboard)
+            # Get context and active account
+            direction = DIRECTIONS.get(self.state_manager.get_path())
+            active_account_id = self.state_manager.get_state_value("active_account_id")
+            if not direction or not active_account_id:
+                return False
 
             # Check if credex_id exists
-            return any(str(offer.get("credexID")) == credex_id for offer in offers)
+            return self.state_manager.get_dashboard_index().offer(active_account_id, direction, credex_id) is not None
 
         except Exception as e:
             logger.error(f"Error validating offer: {str(e)}")
@@ -92,7 +92,6 @@ class ViewLedger(InputComponent):
         """Display ledger entries with navigation"""
         try:
             # Get account details
-            dashboard = self.state_manager.get_state_value("dashboard", {})
             active_account_id = self.state_manager.get_state_value("active_account_id")
             if not active_account_id:
                 return ValidationResult.failure(
@@ -101,11 +100,7 @@ class ViewLedger(InputComponent):
                     details={"component": self.type}
                 )
 
-            account = next(
-                (acc for acc in dashboard.get("accounts", [])
-                 if acc.get("accountID") == active_account_id),
-                None
-            )
+            account = self.state_manager.get_dashboard_index().account(active_account_id)
             if not account:
                 return ValidationResult.failure(
                     message="Active account not found",
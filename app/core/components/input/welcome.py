@@ -6,7 +6,8 @@ This component handles the registration welcome screen.
 from typing import Any
 
 from core.error.types import ValidationResult
-from core.messaging.types import Button
+from core.messaging.skeletons import register_skeleton
+from core.messaging.types import Button, InteractiveContent, InteractiveType
 
 from core.components.base import InputComponent
 
@@ -18,6 +19,15 @@ We're your portal 🚪to the credex ecosystem 🌱
 Become a member 🌐 and open a free account 💳 to get started 📈"""
 
 
+@register_skeleton("welcome.register")
+def register_prompt() -> InteractiveContent:
+    return InteractiveContent(
+        interactive_type=InteractiveType.BUTTON,
+        body=REGISTER,
+        buttons=[Button(id="become_member", title="Become a Member")]
+    )
+
+
 class Welcome(InputComponent):
     """Handles registration welcome screen"""
 
@@ -37,13 +47,7 @@ class Welcome(InputComponent):
 
             # Initial activation - send welcome message
             if not current_data.get("awaiting_input"):
-                self.state_manager.messaging.send_interactive(
-                    body=REGISTER,
-                    buttons=[Button(
-                        id="become_member",
-                        title="Become a Member"
-                    )]
-                )
+                self.state_manager.messaging.send_skeleton("welcome.register")
                 self.set_awaiting_input(True)
                 return ValidationResult.success(None)
 
@@ -0,0 +1,71 @@
+"""Lazy component registry
+
+Components are looked up by the names stored in state and imported on first
+use instead of all at package import:
+- COMPONENTS maps each component name to the module defining it
+- get_component_class() imports that module once and keeps the class
+- load_all() imports every component, for worker warm-up
+"""
+import importlib
+from typing import Dict, List
+
+COMPONENTS: Dict[str, str] = {
+    # Display components
+    "Greeting": "core.components.display.greeting",
+
+    # Input components
+    "AccountDashboard": "core.components.input.account_dashboard",
+    "OfferListDisplay": "core.components.input.offer_list_display",
+    "ViewLedger": "core.components.input.view_ledger",
+    "Welcome": "core.components.input.welcome",
+    "AmountInput": "core.components.input.amount_input",
+    "FirstNameInput": "core.components.input.first_name_input",
+    "HandleInput": "core.components.input.handle_input",
+    "LastNameInput": "core.components.input.last_name_input",
+
+    # API components
+    "ProcessOfferApiCall": "core.components.api.process_offer_api_call",
+    "CreateCredexApiCall": "core.components.api.create_credex_api_call",
+    "GetLedgerApiCall": "core.components.api.get_ledger_api_call",
+    "LoginApiCall": "core.components.api.login_api_call",
+    "OnBoardMemberApiCall": "core.components.api.onboard_member_api_call",
+    "UpgradeMembertierApiCall": "core.components.api.upgrade_membertier_api_call",
+    "ValidateAccountApiCall": "core.components.api.validate_account_api_call",
+
+    # Confirm components
+    "ConfirmOfferSecured": "core.components.confirm.confirm_offer_secured",
+    "ConfirmUpgrade": "core.components.confirm.confirm_upgrade",
+}
+
+_classes: Dict[str, type] = {}
+
+
+def get_component_class(name: str) -> type:
+    """Component class registered under name, imported on first use
+
+    Raises:
+        KeyError: If no component is registered under name
+    """
+    component_class = _classes.get(name)
+    if component_class is None:
+        # The import system serializes concurrent first imports of a module
+        module = importlib.import_module(COMPONENTS[name])
+        component_class = _classes[name] = getattr(module, name)
+    return component_class
+
+
+def loaded() -> List[str]:
+    """Names of components imported so far"""
+    return list(_classes)
+
+
+def load_all() -> int:
+    """Import every registered component
+
+    Returns:
+        Number of components loaded by this call
+    """
+    missing = [name for name in COMPONENTS if name not in _classes]
+    for name in missing:
+        get_component_class(name)
+    return len(missing)
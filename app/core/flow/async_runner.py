@@ -0,0 +1,76 @@
+"""Running the synchronous flow from async code
+
+In the ASGI execution mode the event loop accepts and parses webhooks while
+flow work runs on a bounded thread pool:
+- Components, state managers and the credex and Graph API clients stay
+  synchronous; run_sync() is the adapter that runs them on a worker thread,
+  so every existing component works unchanged
+- Blocking Redis and HTTP calls release the GIL, so one process serves as
+  many concurrent conversations as it has flow threads
+- Messages of one conversation take conversation_lock() and run one at a
+  time in arrival order, instead of racing on the conversation's state
+- Worker threads run in a copy of the caller's context, so call budgets
+  count their Redis and HTTP calls
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from decouple import config
+
+T = TypeVar("T")
+
+# Conversations processed at once per process; Redis and HTTP connection pools
+# (REDIS_MAX_CONNECTIONS, WHATSAPP_POOL_SIZE) should allow as many connections
+FLOW_THREADS = config("ASYNC_FLOW_THREADS", default=100, cast=int)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Locks of conversations with a message in flight; idle ones are dropped
+_conversation_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Flow thread pool of this process, created on first use"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=FLOW_THREADS, thread_name_prefix="flow")
+    return _executor
+
+
+async def run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous callable on a flow thread and await its result"""
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        get_executor(), functools.partial(context.run, func, *args, **kwargs)
+    )
+
+
+def conversation_lock(channel_id: str) -> asyncio.Lock:
+    """Lock serializing the messages of one conversation
+
+    Must be called from the event loop thread.
+    """
+    lock = _conversation_locks.get(channel_id)
+    if lock is None:
+        lock = _conversation_locks[channel_id] = asyncio.Lock()
+    return lock
+
+
+def _reset_after_fork() -> None:
+    """Forked workers start their own pool"""
+    global _executor, _executor_lock
+    _executor = None
+    _executor_lock = threading.Lock()
+    _conversation_locks.clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -3,28 +3,31 @@
 This module handles the component activation and processing logic used by headquarters.py.
 It provides functionality for creating, retrieving, and activating components, as well as managing
 the component processing lifecycle.
+
+Component instances are created per activation and never shared between
+requests, so concurrent threads or greenlets cannot see each other's state
+manager or validation tracking. Everything a component needs between
+messages lives in component_data.
 """
 
 import logging
 from typing import Optional, Tuple
 
-from core import components
+from core.components.registry import COMPONENTS, get_component_class
 from core.error.exceptions import ComponentException
 from core.error.types import ValidationResult
 from core.state.interface import StateManagerInterface
 
-logger = logging.getLogger(__name__)
-
+from .headquarters import get_next_component
 
-# Cache for active component instances
-_active_components = {}
+logger = logging.getLogger(__name__)
 
 
 def activate_component(component_type: str, state_manager: StateManagerInterface) -> ValidationResult:
     """Create or retrieve and activate a component for the current path step.
 
     Handles component processing:
-    1. Creates new component instance or retrieves existing one if awaiting input
+    1. Creates a component instance for this activation
     2. Configures state management
     3. Returns component result
 
@@ -38,31 +41,28 @@ def activate_component(component_type: str, state_manager: StateManagerInterface
     Raises:
         ComponentException: If component creation or activation fails
     """
-    # Get channel identifier for component cache key
-    channel_id = state_manager.get_channel_id()
-    cache_key = f"{channel_id}:{component_type}"
+    if component_type not in COMPONENTS:
+        logger.error("Component not found: %s", component_type)
+        logger.error("Available components: %s", sorted(COMPONENTS))
+        raise ComponentException(
+            message=f"Component not found: {component_type}",
+            component=component_type,
+            field="type",
+            value=str(component_type)
+        )
 
     try:
-        # Check if we have an active instance awaiting input
-        if state_manager.is_awaiting_input() and cache_key in _active_components:
-            component = _active_components[cache_key]
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Retrieved active component instance: {component.type}")
-        else:
-            # Create new component instance
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Creating component for step: {component_type}")
-
-            component_class = getattr(components, component_type)
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Found component class: {component_class.__name__}")
-
-            component = component_class()
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(f"Created component instance: {component.type}")
-
-            # Cache the new instance
-            _active_components[cache_key] = component
+        # Create component instance
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating component for step: %s", component_type)
+
+        component_class = get_component_class(component_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Found component class: %s", component_class.__name__)
+
+        component = component_class()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created component instance: %s", component.type)
 
         # Ensure state manager is set
         component.set_state_manager(state_manager)
@@ -74,25 +74,12 @@ def activate_component(component_type: str, state_manager: StateManagerInterface
             logger.debug("Activating component")
         result = component.validate(None)
         if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(f"Activation result: {result}")
-
-        # Clear from cache if no longer awaiting input
-        if not state_manager.is_awaiting_input():
-            _active_components.pop(cache_key, None)
+            logger.debug("Activation result: %s", result)
 
         return result
 
-    except AttributeError as e:
-        logger.error(f"Component not found: {component_type}")
-        logger.error(f"Available components: {dir(components)}")
-        raise ComponentException(
-            message=f"Component not found: {component_type}",
-            component=component_type,
-            field="type",
-            value=str(e)
-        )
     except Exception as e:
-        logger.error(f"Failed to activate component: {str(e)}")
+        logger.error("Failed to activate component: %s", e)
         raise ComponentException(
             message=f"Component activation failed: {str(e)}",
             component=component_type,
@@ -117,21 +104,24 @@ def process_component(path: str, component: str, state_manager: StateManagerInte
     Returns:
         Optional[Tuple[str, str]]: Next step (path, component) in the current path, or None if activation failed
     """
-    logger.info(f"Processing component: {path}.{component} (depth: {depth})")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Processing component: %s.%s (depth: %s)", path, component, depth)
     if depth > 10:  # Arbitrary limit to catch potential issues
-        logger.error(f"Maximum component processing depth exceeded: {path}.{component}")
+        logger.error("Maximum component processing depth exceeded: %s.%s", path, component)
         return None
-    logger.info(f"Current awaiting_input: {state_manager.is_awaiting_input()}")
+    if debug:
+        logger.debug("Current awaiting_input: %s", state_manager.is_awaiting_input())
 
     # Activate component for current step
-    logger.info("Activating component...")
     result = activate_component(component, state_manager)
-    logger.info(f"Activation result: {result}")
-    logger.info(f"Awaiting input after activation: {state_manager.is_awaiting_input()}")
+    if debug:
+        logger.debug("Activation result: %s", result)
+        logger.debug("Awaiting input after activation: %s", state_manager.is_awaiting_input())
 
     # Handle validation failures
     if not result.valid:
-        logger.error(f"Component activation failed: {result.error}")
+        logger.error("Component activation failed: %s", result.error)
 
         # Check if we should retry handle input
         if (path == "offer_secured" and
@@ -144,16 +134,14 @@ def process_component(path: str, component: str, state_manager: StateManagerInte
 
     # Check if still awaiting input after activation
     if state_manager.is_awaiting_input():
-        logger.info("Still awaiting input after activation")
+        if debug:
+            logger.debug("Still awaiting input after activation")
         return path, component
 
-    # Import get_next_component here to avoid circular imports
-    from .headquarters import get_next_component
-
     # Determine next step in path
-    logger.info("Getting next component...")
     next_step = get_next_component(path, component, state_manager)
-    logger.info(f"Next step: {next_step}")
-    logger.info(f"Final awaiting_input: {state_manager.is_awaiting_input()}")
+    if debug:
+        logger.debug("Next step: %s", next_step)
+        logger.debug("Final awaiting_input: %s", state_manager.is_awaiting_input())
 
     return next_step
@@ -58,6 +58,8 @@ def get_next_component(
         case ("account", "AccountDashboard"):
             if component_result == "offer_secured":
                 return "offer_secured", "AmountInput"  # Start collecting offer details with amount/denom
+            if component_result == "offer_command":
+                return "offer_secured", "ValidateAccountApiCall"  # Amount and handle given in one message
             if component_result == "accept_offer":
                 return "accept_offer", "OfferListDisplay"  # List pending offers to accept
             if component_result == "decline_offer":
@@ -71,8 +73,12 @@ def get_next_component(
 
         # Offer secured credex path
         case ("offer_secured", "AmountInput"):
+            if component_result == "offer_command":
+                return "offer_secured", "ValidateAccountApiCall"  # Handle given with the amount
             return "offer_secured", "HandleInput"  # Get recipient handle from member and account details from credex-core
         case ("offer_secured", "HandleInput"):
+            if component_result == "recent_counterparty":
+                return "offer_secured", "ConfirmOfferSecured"  # Account details already known from a previous offer
             return "offer_secured", "ValidateAccountApiCall"  # Validate account exists and get details
         case ("offer_secured", "ValidateAccountApiCall"):
             return "offer_secured", "ConfirmOfferSecured"  # Confirm amount, denom, issuer and recipient accounts
@@ -1,7 +1,7 @@
 """Flow processor for handling message flows through components.
 
 This module handles the complete flow processing lifecycle:
-1. Takes channel input and prepares for flow
+1. Takes a parsed InboundEvent and prepares for flow
 2. Manages state through schema validation
 3. Processes through components (which can store unvalidated data)
 4. Converts results to messages
@@ -13,13 +13,12 @@ freedom to store their own data.
 """
 
 import logging
-from typing import Any, Dict
 
 from core.error.exceptions import ComponentException
 from core.error.handler import ErrorHandler
 from core.error.types import INVALID_ACTION_MESSAGE, ValidationResult
 from core.messaging.service import MessagingService
-from core.messaging.types import Message, MessageType, TextContent
+from core.messaging.types import InboundEvent, Message, MessageType, TextContent
 from core.messaging.utils import get_recipient
 from core.state.interface import StateManagerInterface
 
@@ -45,38 +44,29 @@ class FlowProcessor:
         if not hasattr(state_manager, 'messaging') or state_manager.messaging is None:
             state_manager.messaging = messaging_service
 
-    def process_message(self, payload: Dict[str, Any]) -> Message:
+    def process_message(self, event: InboundEvent) -> Message:
         """Process message through flow framework
 
         Args:
-            payload: Raw message payload
+            event: Inbound event parsed from the channel's webhook
 
         Returns:
             Message: Response message
         """
         try:
-            # Extract message data using channel-specific implementation
-            extracted_data = self._extract_message_data(payload)
-            if not extracted_data:
+            if not event:
                 logger.debug("No valid message data extracted")
                 return None
 
             # Initialize channel state
-            channel_info = extracted_data.get("channel")
-            if channel_info:
-                self.state_manager.initialize_channel(
-                    channel_type=channel_info["type"],
-                    channel_id=channel_info["identifier"],
-                    mock_testing=channel_info.get("mock_testing", False)
-                )
+            self.state_manager.initialize_channel(
+                channel_type=event.channel_type,
+                channel_id=event.channel_id,
+                mock_testing=event.mock_testing
+            )
 
             # Set message in state
-            message = extracted_data.get("message")
-            if message:
-                self.state_manager.set_incoming_message(message)
-            else:
-                logger.debug("No valid message content")
-                return None
+            self.state_manager.set_incoming_message(event.to_incoming_message())
 
             # Create message recipient for error handling
             recipient = get_recipient(self.state_manager)
@@ -84,16 +74,14 @@ class FlowProcessor:
             # Get existing state before processing any message
             current_state = self.state_manager.get_state_value("component_data")
 
-            # Get message type
-            message_type = message.get("type", "")
-
             # Process based on message type
-            if message_type == MessageType.TEXT.value:
-                message_text = message.get("text", {}).get("body", "").lower().strip()
+            message_type = event.kind
+            if message_type == MessageType.TEXT:
+                message_text = event.text.lower().strip()
                 if not message_text:
                     logger.debug("No valid message text to process")
                     return None
-            elif message_type == MessageType.INTERACTIVE.value:
+            elif message_type == MessageType.INTERACTIVE:
                 # Interactive messages (like button clicks) are always valid
                 message_text = "interactive"  # Placeholder for flow control
             else:
@@ -101,7 +89,7 @@ class FlowProcessor:
                 return None
 
             # For greetings, always start fresh
-            if message_type == MessageType.TEXT.value and message_text in GREETING_COMMANDS:
+            if message_type == MessageType.TEXT and message_text in GREETING_COMMANDS:
                 try:
                     # Preserve channel and message info
                     channel_type = self.state_manager.get_channel_type()
@@ -150,21 +138,23 @@ class FlowProcessor:
 
             # Process components until awaiting input or failure
             while True:
-                logger.info(f"Processing component: {context}.{component}")
-                logger.info(f"Current state: {current_state}")
-                logger.info(f"Awaiting input: {self.state_manager.is_awaiting_input()}")
+                logger.info("Processing component: %s.%s", context, component)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Current state: %s", current_state)
+                    logger.debug("Awaiting input: %s", self.state_manager.is_awaiting_input())
 
                 # Process current component
                 next_step = process_component(context, component, self.state_manager, depth=0)
                 result = self.state_manager.get_component_result()
 
-                logger.info(f"Component processing complete. Next step: {next_step}")
-                logger.info(f"Component result: {result}")
-                logger.info(f"Awaiting input: {self.state_manager.is_awaiting_input()}")
+                logger.info("Component processing complete. Next step: %s", next_step)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Component result: %s", result)
+                    logger.debug("Awaiting input: %s", self.state_manager.is_awaiting_input())
 
                 # Handle component failure
                 if next_step is None:
-                    logger.error(f"Component failed: {context}.{component}")
+                    logger.error("Component failed: %s.%s", context, component)
                     return None
 
                 # Handle validation error
@@ -176,12 +166,12 @@ class FlowProcessor:
                 next_context, next_component = next_step
                 if next_context != context or next_component != component:
                     # Log state transition
-                    logger.info(f"Flow transition: {context}.{component} -> {next_context}.{next_component}")
+                    logger.info("Flow transition: %s.%s -> %s.%s", context, component, next_context, next_component)
 
                     # Get current component data
                     component_data = self.state_manager.get_state_value("component_data", {})
                     if logger.isEnabledFor(logging.DEBUG):
-                        logger.debug(f"Current flow state: {component_data}")
+                        logger.debug("Current flow state: %s", component_data)
 
                     # Transition to next component
                     self.state_manager.transition_flow(
@@ -222,24 +212,3 @@ class FlowProcessor:
             recipient = get_recipient(self.state_manager)
             content = TextContent(body=error_response["error"]["message"])
             return Message(content=content)
-
-    def _extract_message_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract message data from payload
-
-        This method should be overridden by channel-specific processors
-        to handle channel-specific payload formats.
-
-        Args:
-            payload: Raw message payload
-
-        Returns:
-            Dict[str, Any]: Extracted message data including:
-                - type: Message type
-                - text: Message text data
-                - channel_type: Channel type string ("whatsapp" or "sms")
-                - channel_id: Channel identifier string (e.g. phone number)
-
-        Raises:
-            ComponentException: If payload is invalid
-        """
-        raise NotImplementedError("Channel-specific processors must implement _extract_message_data")
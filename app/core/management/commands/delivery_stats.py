@@ -0,0 +1,22 @@
+"""WhatsApp delivery status counters
+
+Usage:
+    python manage.py delivery_stats              # last 60 minutes
+    python manage.py delivery_stats --minutes 5
+"""
+import json
+
+from django.core.management.base import BaseCommand
+from services.whatsapp.outbox import dispatcher_redis_client
+from services.whatsapp.statuses import delivery_stats
+
+
+class Command(BaseCommand):
+    help = "Show per-minute WhatsApp delivery status counts and latencies"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--minutes", type=int, default=60, help="Number of recent minutes to show")
+
+    def handle(self, *args, **options):
+        stats = delivery_stats(dispatcher_redis_client(), minutes=options["minutes"])
+        self.stdout.write(json.dumps(stats, indent=2))
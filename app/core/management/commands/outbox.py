@@ -0,0 +1,44 @@
+"""Outbound WhatsApp outbox operations
+
+Usage:
+    python manage.py outbox run      # dispatch in this process until interrupted
+    python manage.py outbox drain    # move failed entries back for another round
+    python manage.py outbox stats    # pending entries and parked recipients per partition, failed count
+"""
+import json
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from services.whatsapp.outbox import (Outbox, build_dispatcher,
+                                      dispatcher_redis_client)
+
+
+class Command(BaseCommand):
+    help = "Run, drain or inspect the outbound WhatsApp outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument("action", choices=["run", "drain", "stats"])
+        parser.add_argument("--limit", type=int, default=None, help="Maximum failed entries to drain")
+
+    def handle(self, *args, **options):
+        action = options["action"]
+
+        if action == "stats":
+            self.stdout.write(json.dumps(Outbox(dispatcher_redis_client()).stats(), indent=2))
+            return
+
+        if action == "drain":
+            moved = Outbox(dispatcher_redis_client()).drain_failed(limit=options["limit"])
+            self.stdout.write(f"Moved {moved} failed entries back to the outbox")
+            return
+
+        dispatcher = build_dispatcher()
+        stopped = threading.Event()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, lambda *_: stopped.set())
+
+        dispatcher.start()
+        self.stdout.write(f"Outbox dispatcher {dispatcher.owner} running")
+        stopped.wait()
+        dispatcher.stop()
@@ -5,10 +5,10 @@ and enforces the messaging service interface.
 """
 
 from abc import abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from .interface import MessagingServiceInterface
-from .types import Button, Message
+from .types import Button, InboundEvent, Message, MessageRecipient
 
 
 class BaseMessagingService(MessagingServiceInterface):
@@ -97,6 +97,26 @@ class BaseMessagingService(MessagingServiceInterface):
         """
         pass
 
+    def send_skeleton(
+        self,
+        recipient: MessageRecipient,
+        template_id: str,
+        values: Optional[Dict[str, Any]] = None,
+        shape: Tuple[Hashable, ...] = ()
+    ) -> Message:
+        """Send a registered message skeleton (see core.messaging.skeletons)
+
+        Args:
+            recipient: Message recipient
+            template_id: Registered skeleton ID
+            values: Slot values
+            shape: Builder arguments selecting the skeleton variant
+
+        Returns:
+            Sent message with delivery details
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support message skeletons")
+
     def validate_message(self, message: Message) -> bool:
         """Validate a message before sending
 
@@ -111,19 +131,16 @@ class BaseMessagingService(MessagingServiceInterface):
             return False
         return True
 
-    def handle_incoming_message(self, payload: Dict[str, Any]) -> None:
+    def handle_incoming_message(self, event: InboundEvent) -> None:
         """Handle incoming message from channel
 
-        This method:
-        1. Calls extract_message_data() which channel services must implement
-        2. Validates the extracted message
-        3. Stores in state_manager.incoming_message
+        Stores the event's message in state_manager.incoming_message. Channel
+        services parse their payloads into the event before this point.
 
         Args:
-            payload: Raw message payload from channel
+            event: Parsed inbound event
 
         Raises:
-            MessageValidationError: If message validation fails
             MessageHandlerError: If message handling fails
         """
         from .exceptions import MessageHandlerError
@@ -131,25 +148,4 @@ class BaseMessagingService(MessagingServiceInterface):
         if not self.state_manager:
             raise MessageHandlerError("State manager not initialized")
 
-        # Extract message data using channel-specific implementation
-        message_data = self.extract_message_data(payload)
-
-        # Store in state manager
-        self.state_manager.set_incoming_message(message_data)
-
-    @abstractmethod
-    def extract_message_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract message data from channel-specific payload
-
-        Channel services must implement this to handle their specific formats.
-
-        Args:
-            payload: Raw message payload from channel
-
-        Returns:
-            Dict[str, Any]: Extracted message data in standard format
-
-        Raises:
-            MessageValidationError: If payload format is invalid
-        """
-        pass
+        self.state_manager.set_incoming_message(event.to_incoming_message())
@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from .exceptions import (MessageDeliveryError, MessageHandlerError,
                          MessageTemplateError, MessageValidationError)
-from .types import Button, Message, MessageRecipient
+from .types import Button, InboundEvent, Message, MessageRecipient
 
 __all__ = [
     'MessagingServiceInterface',
@@ -137,16 +137,14 @@ class MessagingServiceInterface(ABC):
         pass
 
     @abstractmethod
-    def handle_incoming_message(self, payload: Dict[str, Any]) -> None:
+    def handle_incoming_message(self, event: InboundEvent) -> None:
         """Handle incoming message from channel
 
-        This method is responsible for:
-        1. Extracting message data from channel-specific payload
-        2. Converting to standard Message format
-        3. Storing in state_manager.incoming_message
+        This method is responsible for storing the message of an event parsed
+        by the channel's webhook parser in state_manager.incoming_message
 
         Args:
-            payload: Raw message payload from channel
+            event: Parsed inbound event
 
         Raises:
             MessageValidationError: If message validation fails
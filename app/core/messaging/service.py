@@ -6,12 +6,12 @@ This service maintains the layered architecture:
 3. MessagingService orchestrates which implementation to use
 """
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from core.messaging.base import BaseMessagingService
 from core.messaging.types import (
-    Button, InteractiveContent, InteractiveType, Message, MessageRecipient,
-    TemplateContent, TextContent
+    Button, InboundEvent, InteractiveContent, InteractiveType, Message,
+    MessageRecipient, TemplateContent, TextContent
 )
 
 logger = logging.getLogger(__name__)
@@ -164,6 +164,26 @@ class MessagingService:
         message = self._inject_recipient(message)
         return self.channel_service.send_message(message)
 
-    def handle_incoming_message(self, payload: Dict[str, Any]) -> None:
+    def send_skeleton(
+        self,
+        template_id: str,
+        values: Optional[Dict[str, Any]] = None,
+        shape: Tuple[Hashable, ...] = ()
+    ) -> Message:
+        """Send a registered message skeleton through appropriate channel service
+
+        Gets recipient from state automatically.
+
+        Args:
+            template_id: Skeleton registered with core.messaging.skeletons
+            values: Slot values
+            shape: Builder arguments selecting the skeleton variant
+
+        Returns:
+            Message: Sent message with delivery details
+        """
+        return self.channel_service.send_skeleton(self._get_recipient(), template_id, values, shape)
+
+    def handle_incoming_message(self, event: InboundEvent) -> None:
         """Handle incoming message through appropriate channel service"""
-        return self.channel_service.handle_incoming_message(payload)
+        return self.channel_service.handle_incoming_message(event)
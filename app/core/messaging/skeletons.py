@@ -0,0 +1,63 @@
+"""Registry of reusable message skeletons
+
+Prompts and menus that look the same on every activation are declared once
+as skeletons instead of being rebuilt per message:
+- A builder returns the message content, with slot() markers where values
+  differ per send (member names, counts, dashboard text)
+- Builders taking arguments describe a shape (e.g. which menu rows exist);
+  each shape becomes its own skeleton
+- Channel services compile each (template ID, shape) once into their wire
+  format and only fill in the recipient and slots at send time
+
+Components send skeletons with messaging.send_skeleton(template_id, values, shape).
+"""
+import inspect
+from itertools import product
+from typing import Callable, Dict, Hashable, Iterator, Tuple
+
+from .types import MessageContent
+
+# Delimits slot names inside skeleton strings; never appears in real text
+SLOT_MARK = "\x1f"
+
+_builders: Dict[str, Callable[..., MessageContent]] = {}
+
+
+def slot(name: str) -> str:
+    """Marker filled with values[name] when a skeleton is sent"""
+    return f"{SLOT_MARK}{name}{SLOT_MARK}"
+
+
+def register_skeleton(template_id: str) -> Callable:
+    """Register a content builder under template_id
+
+    The builder's positional arguments form the skeleton shape.
+    """
+    def decorator(builder: Callable[..., MessageContent]) -> Callable[..., MessageContent]:
+        _builders[template_id] = builder
+        return builder
+    return decorator
+
+
+def build_skeleton(template_id: str, shape: Tuple[Hashable, ...] = ()) -> MessageContent:
+    """Build the content of a registered skeleton for a shape
+
+    Raises:
+        KeyError: If no builder is registered for template_id
+    """
+    return _builders[template_id](*shape)
+
+
+def registered_shapes() -> Iterator[Tuple[str, Tuple[Hashable, ...]]]:
+    """Every (template ID, shape) of the registered skeletons
+
+    Builders without arguments have the empty shape, builders taking only
+    flags have one shape per combination; others are skipped since their
+    shapes are not enumerable.
+    """
+    for template_id, builder in list(_builders.items()):
+        parameters = inspect.signature(builder).parameters.values()
+        if any(parameter.annotation not in (bool, "bool") for parameter in parameters):
+            continue
+        for shape in product((False, True), repeat=len(parameters)):
+            yield template_id, shape
@@ -4,10 +4,9 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 
 from core.error.exceptions import ComponentException
-from core.messaging.exceptions import MessageValidationError
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageRecipient:
     """Message recipient info passed from state to channel services
 
@@ -50,7 +49,7 @@ class InteractiveType(Enum):
     PRODUCT_LIST = "product_list"
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageContent:
     """Base interface for message content"""
     type: MessageType = field(init=False)
@@ -60,17 +59,13 @@ class MessageContent:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class TextContent(MessageContent):
     """Text message content"""
     body: str
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.TEXT)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -82,7 +77,7 @@ class TextContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Interactive message section"""
     title: str
@@ -96,7 +91,7 @@ class Section:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Button:
     """Interactive button"""
     id: str
@@ -114,23 +109,13 @@ class Button:
         }
 
 
-# WhatsApp Cloud API limits
-WHATSAPP_LIMITS = {
-    "text_body": 4096,      # Maximum text message length
-    "header": 60,           # Maximum header text length
-    "footer": 60,           # Maximum footer text length
-    "button_text": 20,      # Maximum button text length
-    "list_title": 24,       # Maximum list item title length
-    "list_description": 72,  # Maximum list item description length
-    "buttons_count": 3,     # Maximum number of buttons
-    "sections_count": 10,   # Maximum number of sections
-    "rows_per_section": 10  # Maximum rows per section
-}
-
-
-@dataclass
+@dataclass(slots=True)
 class InteractiveContent(MessageContent):
-    """Interactive message content following WhatsApp Cloud API format"""
+    """Interactive message content following WhatsApp Cloud API format
+
+    Channel services check and truncate against their limits when building
+    the outgoing message (see services/whatsapp/builder.py).
+    """
     interactive_type: InteractiveType
     body: str
     header: Optional[str] = None
@@ -141,185 +126,6 @@ class InteractiveContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.INTERACTIVE)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation and validate WhatsApp limits"""
-        super().__init__()
-
-        # Validate body text
-        if not self.body:
-            raise MessageValidationError(
-                message="Message body is required",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "missing_required_field",
-                    "field": "body"
-                }
-            )
-        if len(self.body) > WHATSAPP_LIMITS["text_body"]:
-            raise MessageValidationError(
-                message=f"Body text exceeds {WHATSAPP_LIMITS['text_body']} characters",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "text_too_long",
-                    "field": "body",
-                    "length": len(self.body),
-                    "max_length": WHATSAPP_LIMITS["text_body"]
-                }
-            )
-
-        # Validate header/footer length
-        if self.header and len(self.header) > WHATSAPP_LIMITS["header"]:
-            raise MessageValidationError(
-                message=f"Header text exceeds {WHATSAPP_LIMITS['header']} characters",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "text_too_long",
-                    "field": "header",
-                    "length": len(self.header),
-                    "max_length": WHATSAPP_LIMITS["header"]
-                }
-            )
-
-        if self.footer and len(self.footer) > WHATSAPP_LIMITS["footer"]:
-            raise MessageValidationError(
-                message=f"Footer text exceeds {WHATSAPP_LIMITS['footer']} characters",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "text_too_long",
-                    "field": "footer",
-                    "length": len(self.footer),
-                    "max_length": WHATSAPP_LIMITS["footer"]
-                }
-            )
-
-        # Validate button text for list messages
-        if self.button_text and len(self.button_text) > WHATSAPP_LIMITS["button_text"]:
-            raise MessageValidationError(
-                message=f"Button text exceeds {WHATSAPP_LIMITS['button_text']} characters",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "text_too_long",
-                    "field": "button_text",
-                    "length": len(self.button_text),
-                    "max_length": WHATSAPP_LIMITS["button_text"]
-                }
-            )
-
-        # Validate buttons
-        if len(self.buttons) > WHATSAPP_LIMITS["buttons_count"]:
-            raise MessageValidationError(
-                message=f"Too many buttons (max {WHATSAPP_LIMITS['buttons_count']})",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "too_many_buttons",
-                    "count": len(self.buttons),
-                    "max_count": WHATSAPP_LIMITS["buttons_count"]
-                }
-            )
-
-        # Validate sections
-        if len(self.sections) > WHATSAPP_LIMITS["sections_count"]:
-            raise MessageValidationError(
-                message=f"Too many sections (max {WHATSAPP_LIMITS['sections_count']})",
-                service="messaging",
-                action="create_message",
-                validation_details={
-                    "error": "too_many_sections",
-                    "count": len(self.sections),
-                    "max_count": WHATSAPP_LIMITS["sections_count"]
-                }
-            )
-
-        # Validate each section
-        for section in self.sections:
-            if not section.title:
-                raise MessageValidationError(
-                    message="Section title is required",
-                    service="messaging",
-                    action="create_message",
-                    validation_details={
-                        "error": "missing_required_field",
-                        "field": "section_title"
-                    }
-                )
-
-            if len(section.title) > WHATSAPP_LIMITS["list_title"]:
-                raise MessageValidationError(
-                    message=f"Section title exceeds {WHATSAPP_LIMITS['list_title']} characters",
-                    service="messaging",
-                    action="create_message",
-                    validation_details={
-                        "error": "text_too_long",
-                        "field": "section_title",
-                        "section": section.title,
-                        "length": len(section.title),
-                        "max_length": WHATSAPP_LIMITS["list_title"]
-                    }
-                )
-
-            if len(section.rows) > WHATSAPP_LIMITS["rows_per_section"]:
-                raise MessageValidationError(
-                    message=f"Too many rows in section (max {WHATSAPP_LIMITS['rows_per_section']})",
-                    service="messaging",
-                    action="create_message",
-                    validation_details={
-                        "error": "too_many_rows",
-                        "section": section.title,
-                        "count": len(section.rows),
-                        "max_count": WHATSAPP_LIMITS["rows_per_section"]
-                    }
-                )
-
-            # Validate each row
-            for row in section.rows:
-                if "id" not in row or "title" not in row:
-                    raise MessageValidationError(
-                        message="Row missing required fields (id and title)",
-                        service="messaging",
-                        action="create_message",
-                        validation_details={
-                            "error": "missing_required_fields",
-                            "section": section.title,
-                            "row": row
-                        }
-                    )
-
-                if len(row["title"]) > WHATSAPP_LIMITS["list_title"]:
-                    raise MessageValidationError(
-                        message=f"Row title exceeds {WHATSAPP_LIMITS['list_title']} characters",
-                        service="messaging",
-                        action="create_message",
-                        validation_details={
-                            "error": "text_too_long",
-                            "field": "row_title",
-                            "section": section.title,
-                            "row_title": row["title"],
-                            "length": len(row["title"]),
-                            "max_length": WHATSAPP_LIMITS["list_title"]
-                        }
-                    )
-
-                if "description" in row and len(row["description"]) > WHATSAPP_LIMITS["list_description"]:
-                    raise MessageValidationError(
-                        message=f"Row description exceeds {WHATSAPP_LIMITS['list_description']} characters",
-                        service="messaging",
-                        action="create_message",
-                        validation_details={
-                            "error": "text_too_long",
-                            "field": "row_description",
-                            "section": section.title,
-                            "row_title": row["title"],
-                            "length": len(row["description"]),
-                            "max_length": WHATSAPP_LIMITS["list_description"]
-                        }
-                    )
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -359,7 +165,7 @@ class InteractiveContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateContent(MessageContent):
     """Template message content"""
     name: str
@@ -368,10 +174,6 @@ class TemplateContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.TEMPLATE)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -388,7 +190,7 @@ class TemplateContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageContent(MessageContent):
     """Image message content"""
     url: str
@@ -397,10 +199,6 @@ class ImageContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.IMAGE)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -416,7 +214,7 @@ class ImageContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentContent(MessageContent):
     """Document message content"""
     url: str
@@ -425,10 +223,6 @@ class DocumentContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.DOCUMENT)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -444,7 +238,7 @@ class DocumentContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioContent(MessageContent):
     """Audio message content"""
     url: str
@@ -453,10 +247,6 @@ class AudioContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.AUDIO)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -472,7 +262,7 @@ class AudioContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoContent(MessageContent):
     """Video message content"""
     url: str
@@ -481,10 +271,6 @@ class VideoContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.VIDEO)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -500,7 +286,7 @@ class VideoContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class LocationContent(MessageContent):
     """Location message content"""
     latitude: float
@@ -510,10 +296,6 @@ class LocationContent(MessageContent):
     preview_url: bool = False
     type: MessageType = field(init=False, default=MessageType.LOCATION)
 
-    def __post_init__(self):
-        """Initialize after dataclass creation"""
-        super().__init__()
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict for JSON serialization"""
         result = {
@@ -532,7 +314,7 @@ class LocationContent(MessageContent):
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Message content with optional recipient"""
     content: Union[
@@ -560,3 +342,42 @@ class Message:
     def __str__(self) -> str:
         """String representation for logging"""
         return str(self.to_dict())
+
+
+@dataclass(slots=True)
+class InboundEvent:
+    """User message received from a channel, parsed once per webhook
+
+    Produced by the channel's webhook parser and passed to the flow processor
+    and messaging service, so neither needs the raw payload.
+    """
+    channel_type: str                 # Channel type (e.g. "whatsapp")
+    channel_id: str                   # Sender's channel ID (e.g. phone number)
+    message_id: Optional[str]         # Channel message ID
+    kind: MessageType                 # TEXT or INTERACTIVE
+    text: str = ""                    # Body of text messages
+    interactive_type: Optional[InteractiveType] = None  # BUTTON or LIST for replies
+    reply_id: Optional[str] = None    # Selected button or list row ID
+    reply_title: Optional[str] = None
+    reply_description: Optional[str] = None
+    mock_testing: bool = False
+
+    def to_incoming_message(self) -> Dict[str, Any]:
+        """Incoming message in the format components read from state"""
+        if self.kind == MessageType.TEXT:
+            return {"type": MessageType.TEXT.value, "text": {"body": self.text}}
+        if self.interactive_type == InteractiveType.BUTTON:
+            reply = {
+                "interactive_type": InteractiveType.BUTTON.value,
+                "button": {"id": self.reply_id, "title": self.reply_title, "type": "reply"}
+            }
+        else:
+            reply = {
+                "interactive_type": InteractiveType.LIST.value,
+                "list_reply": {
+                    "id": self.reply_id,
+                    "title": self.reply_title,
+                    "description": self.reply_description
+                }
+            }
+        return {"type": MessageType.INTERACTIVE.value, "text": reply}
@@ -1,10 +1,15 @@
 """Core messaging utilities"""
+from typing import TYPE_CHECKING
 
-from core.state.interface import StateManagerInterface
 from core.messaging.types import MessageRecipient
 
+if TYPE_CHECKING:
+    # core.state.interface imports this package; importing it here at runtime
+    # fails whenever core.state is imported first
+    from core.state.interface import StateManagerInterface
 
-def get_recipient(state_manager: StateManagerInterface) -> MessageRecipient:
+
+def get_recipient(state_manager: "StateManagerInterface") -> MessageRecipient:
     """Get message recipient from state
 
     Args:
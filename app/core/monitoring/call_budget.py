@@ -0,0 +1,232 @@
+"""Per-request call budget tracking
+
+This module counts the external calls made while processing a request:
+- Redis commands, round trips and payload bytes (counted on the connection)
+- Outbound HTTP calls per service (credex, whatsapp)
+
+Counting only happens inside track_calls(), so the cost outside a tracked
+request is a single context variable lookup per call. Work a request hands
+to other threads in a copy of its context counts into the same budget, so
+counters are updated under the budget's lock.
+"""
+import contextvars
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+import redis
+
+_current_budget: contextvars.ContextVar[Optional["CallBudget"]] = contextvars.ContextVar(
+    "call_budget", default=None
+)
+
+# Limits accepted by CallBudget.violations() and assert_call_budget()
+LIMIT_FIELDS = {
+    "max_redis_commands": "redis_commands",
+    "max_redis_round_trips": "redis_round_trips",
+    "max_redis_bytes_sent": "redis_bytes_sent",
+    "max_redis_bytes_received": "redis_bytes_received",
+    "max_http_calls": "http_total",
+}
+
+
+@dataclass
+class CallBudget:
+    """Counters for calls made while a budget is active
+
+    Attributes:
+        redis_commands: Redis commands sent (GET, SETEX, HSET, ...)
+        redis_round_trips: Writes to the socket that wait for a reply
+        redis_bytes_sent: Encoded command bytes written
+        redis_bytes_received: Approximate reply payload bytes read
+        http_calls: Outbound HTTP calls by service name
+        parent: Enclosing budget that also receives every count
+    """
+    redis_commands: int = 0
+    redis_round_trips: int = 0
+    redis_bytes_sent: int = 0
+    redis_bytes_received: int = 0
+    http_calls: Dict[str, int] = field(default_factory=dict)
+    parent: Optional["CallBudget"] = field(default=None, repr=False, compare=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def http_total(self) -> int:
+        """Total outbound HTTP calls across services"""
+        return sum(self.http_calls.values())
+
+    def add_redis(self, commands: int, round_trips: int, bytes_sent: int, bytes_received: int) -> None:
+        """Add Redis activity"""
+        with self._lock:
+            self.redis_commands += commands
+            self.redis_round_trips += round_trips
+            self.redis_bytes_sent += bytes_sent
+            self.redis_bytes_received += bytes_received
+
+    def add_http_call(self, service: str) -> None:
+        """Add one outbound HTTP call for service"""
+        with self._lock:
+            self.http_calls[service] = self.http_calls.get(service, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters as a flat dict for structured logs and reports"""
+        return {
+            "redis_commands": self.redis_commands,
+            "redis_round_trips": self.redis_round_trips,
+            "redis_bytes_sent": self.redis_bytes_sent,
+            "redis_bytes_received": self.redis_bytes_received,
+            "http_calls": dict(self.http_calls),
+            "http_total": self.http_total,
+        }
+
+    def header_value(self) -> str:
+        """Compact form for the X-Call-Budget response header"""
+        http = ",".join(f"{service}:{count}" for service, count in sorted(self.http_calls.items()))
+        return (
+            f"redis_rtt={self.redis_round_trips};redis_cmds={self.redis_commands};"
+            f"redis_tx={self.redis_bytes_sent};redis_rx={self.redis_bytes_received};"
+            f"http={self.http_total}" + (f"({http})" if http else "")
+        )
+
+    def violations(self, **limits: int) -> List[str]:
+        """Describe every counter that exceeds its limit
+
+        Args:
+            **limits: Limits named as in LIMIT_FIELDS, e.g. max_redis_round_trips=2
+
+        Returns:
+            List of human readable violations, empty when within budget
+
+        Raises:
+            ValueError: If a limit name is unknown
+        """
+        result = []
+        for name, limit in limits.items():
+            if limit is None:
+                continue
+            if name not in LIMIT_FIELDS:
+                raise ValueError(f"Unknown call budget limit: {name}")
+            actual = getattr(self, LIMIT_FIELDS[name])
+            if actual > limit:
+                result.append(f"{LIMIT_FIELDS[name]}={actual} exceeds {limit}")
+        return result
+
+
+def current_budget() -> Optional[CallBudget]:
+    """Get the innermost active budget, if any"""
+    return _current_budget.get()
+
+
+@contextmanager
+def track_calls() -> Iterator[CallBudget]:
+    """Count calls made inside the block
+
+    Budgets nest: counts recorded inside an inner block are also added to
+    every enclosing budget.
+    """
+    budget = CallBudget(parent=_current_budget.get())
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+@contextmanager
+def assert_call_budget(label: str = "block", **limits: int) -> Iterator[CallBudget]:
+    """Fail if the block exceeds the given call limits
+
+    Example:
+        with assert_call_budget("AmountInput input", max_redis_round_trips=2):
+            flow_processor.process_message(payload)
+
+    Args:
+        label: Name used in the failure message
+        **limits: Limits named as in LIMIT_FIELDS
+
+    Raises:
+        AssertionError: If any counter exceeds its limit
+    """
+    with track_calls() as budget:
+        yield budget
+    problems = budget.violations(**limits)
+    if problems:
+        raise AssertionError(f"{label} over call budget: {'; '.join(problems)} ({budget.header_value()})")
+
+
+def record_redis(
+    commands: int = 0,
+    round_trips: int = 0,
+    bytes_sent: int = 0,
+    bytes_received: int = 0
+) -> None:
+    """Add Redis activity to the active budgets"""
+    budget = _current_budget.get()
+    while budget is not None:
+        budget.add_redis(commands, round_trips, bytes_sent, bytes_received)
+        budget = budget.parent
+
+
+def record_http_call(service: str) -> None:
+    """Add one outbound HTTP call for service to the active budgets"""
+    budget = _current_budget.get()
+    while budget is not None:
+        budget.add_http_call(service)
+        budget = budget.parent
+
+
+def payload_size(value: Any) -> int:
+    """Approximate payload size of a Redis reply"""
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(item) for item in value)
+    return 0
+
+
+class CountingConnectionMixin:
+    """Connection mixin that reports wire activity to the active budget"""
+
+    def pack_command(self, *args):
+        if _current_budget.get() is not None:
+            record_redis(commands=1)
+        return super().pack_command(*args)
+
+    def pack_commands(self, commands):
+        if _current_budget.get() is not None:
+            commands = list(commands)
+            record_redis(commands=len(commands))
+        return super().pack_commands(commands)
+
+    def send_packed_command(self, command, check_health=True):
+        if _current_budget.get() is not None:
+            chunks = [command] if isinstance(command, (bytes, str)) else command
+            record_redis(round_trips=1, bytes_sent=sum(len(chunk) for chunk in chunks))
+        return super().send_packed_command(command, check_health)
+
+    def read_response(self, *args, **kwargs):
+        response = super().read_response(*args, **kwargs)
+        if _current_budget.get() is not None:
+            record_redis(bytes_received=payload_size(response))
+        return response
+
+
+@lru_cache(maxsize=None)
+def counting_connection_class(connection_class: type) -> type:
+    """Build (once) a counting subclass of a redis-py connection class"""
+    if issubclass(connection_class, CountingConnectionMixin):
+        return connection_class
+    return type(f"Counting{connection_class.__name__}", (CountingConnectionMixin, connection_class), {})
+
+
+class CountingConnectionPool(redis.ConnectionPool):
+    """Connection pool whose connections report to the active call budget
+
+    Used as CONNECTION_POOL_CLASS for the django-redis cache so state
+    operations are counted without touching the persistence layer.
+    """
+
+    def __init__(self, connection_class=redis.Connection, **kwargs):
+        super().__init__(connection_class=counting_connection_class(connection_class), **kwargs)
@@ -0,0 +1,134 @@
+"""Prometheus metrics
+
+This module defines the application metrics and their exposition:
+- Webhook latency by flow path and component
+- Credex API latency by endpoint and status
+- WhatsApp send latency and status codes
+- Redis operation latency and failures
+- Outbox queue delay, delivery attempts and dead letters
+- WhatsApp delivery statuses reported back through the webhook
+- Account handle cache lookups by result
+
+Under gunicorn every worker is its own process. When PROMETHEUS_MULTIPROC_DIR
+is set (see config/gunicorn.py) values are kept in mmap-backed files in that
+directory and render_metrics() aggregates them across all workers.
+"""
+import os
+from typing import Tuple
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry,
+                               Counter, Histogram, generate_latest)
+from prometheus_client import multiprocess
+
+# Request handling latencies span from cache hits to slow upstream calls
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Redis operations are expected to stay in the low milliseconds
+REDIS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+WEBHOOK_LATENCY = Histogram(
+    "vimbiso_webhook_duration_seconds",
+    "Time to process an incoming webhook message",
+    ["path", "component"],
+    buckets=LATENCY_BUCKETS
+)
+
+CREDEX_API_LATENCY = Histogram(
+    "vimbiso_credex_api_duration_seconds",
+    "Credex core API request latency",
+    ["endpoint", "status"],
+    buckets=LATENCY_BUCKETS
+)
+
+WHATSAPP_SEND_LATENCY = Histogram(
+    "vimbiso_whatsapp_send_duration_seconds",
+    "WhatsApp message send latency",
+    ["mode"],
+    buckets=LATENCY_BUCKETS
+)
+
+WHATSAPP_SEND_RESPONSES = Counter(
+    "vimbiso_whatsapp_send_responses",
+    "WhatsApp message send responses by status code",
+    ["mode", "status_code"]
+)
+
+REDIS_OP_LATENCY = Histogram(
+    "vimbiso_redis_operation_duration_seconds",
+    "Atomic Redis state operation latency",
+    ["operation"],
+    buckets=REDIS_BUCKETS
+)
+
+REDIS_OP_ERRORS = Counter(
+    "vimbiso_redis_operation_errors",
+    "Atomic Redis state operations that failed",
+    ["operation"]
+)
+
+
+OUTBOX_ENQUEUED = Counter(
+    "vimbiso_outbox_enqueued",
+    "Outbound messages added to the outbox",
+    ["mode"]
+)
+
+OUTBOX_DELIVERIES = Counter(
+    "vimbiso_outbox_deliveries",
+    "Outbox delivery attempts by outcome (sent, retry, dead)",
+    ["mode", "outcome"]
+)
+
+OUTBOX_QUEUE_DELAY = Histogram(
+    "vimbiso_outbox_queue_delay_seconds",
+    "Time from enqueue to successful send",
+    ["mode"],
+    buckets=LATENCY_BUCKETS
+)
+
+WHATSAPP_STATUSES = Counter(
+    "vimbiso_whatsapp_statuses",
+    "WhatsApp delivery status callbacks (sent, delivered, read, failed)",
+    ["status"]
+)
+
+HANDLE_CACHE_LOOKUPS = Counter(
+    "vimbiso_handle_cache_lookups",
+    "Account handle cache lookups by result (hit, negative_hit, miss, error)",
+    ["result"]
+)
+
+HANDLE_PREFETCHES = Counter(
+    "vimbiso_handle_prefetches",
+    "Speculative handle lookups by outcome (started, cached, used, discarded, failed, expired)",
+    ["outcome"]
+)
+
+OFFER_RULE_REJECTIONS = Counter(
+    "vimbiso_offer_rule_rejections",
+    "Offers turned back by local offer rules before createCredex, by rule",
+    ["rule"]
+)
+
+RECENT_COUNTERPARTY_PICKS = Counter(
+    "vimbiso_recent_counterparty_picks",
+    "Offers addressed to a recent counterparty picked from the list"
+)
+
+
+def endpoint_label(url: str) -> str:
+    """Reduce a credex API URL to its endpoint name for labelling"""
+    return url.rstrip("/").split("/")[-1] or "root"
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render metrics in Prometheus text format
+
+    Returns:
+        Tuple of (body, content type)
+    """
+    registry = REGISTRY
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,38 @@
+"""Request monitoring middleware"""
+import logging
+
+from django.conf import settings
+
+from .call_budget import track_calls
+
+logger = logging.getLogger(__name__)
+
+
+class CallBudgetMiddleware:
+    """Count Redis and HTTP calls made while handling each request
+
+    POST requests (webhooks, notifications) get a structured log line with
+    the counters. The X-Call-Budget header is added only when
+    CALL_BUDGET_HEADER is enabled (defaults to DEBUG).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header_enabled = getattr(settings, "CALL_BUDGET_HEADER", settings.DEBUG)
+
+    def __call__(self, request):
+        with track_calls() as budget:
+            response = self.get_response(request)
+
+        if self.header_enabled:
+            response["X-Call-Budget"] = budget.header_value()
+
+        if request.method == "POST" and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Call budget %s: %s",
+                request.path,
+                budget.header_value(),
+                extra={"path": request.path, "status": response.status_code, "call_budget": budget.to_dict()}
+            )
+
+        return response
@@ -0,0 +1,142 @@
+"""Non-blocking, sampled and redacted log output
+
+This module provides the pieces wired up in settings.LOGGING:
+- SamplingFilter: keeps a configurable share of sub-WARNING records per logger
+- QueueingStreamHandler: hands records to a QueueListener thread that formats,
+  redacts and writes them, so request threads never block on stdout
+- redact(): masks tokens, API keys, phone numbers and member names
+
+Records dropped by level or sampling are never formatted. Log calls on hot
+paths should pass arguments (logger.info("x %s", value)) rather than
+f-strings so that holds.
+"""
+import atexit
+import copy
+import logging
+import os
+import queue
+import random
+import re
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Union
+
+REDACTED = "[REDACTED]"
+
+# Keys whose values are masked wherever they appear as key/value pairs
+SENSITIVE_KEYS = (
+    "token", "access_token", "refresh_token", "jwt", "password", "secret",
+    "authorization", "apikey", "x-client-api-key", "firstname", "lastname",
+    "membername", "wa_id"
+)
+
+_JWT = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+_BEARER = re.compile(r"(Bearer\s+)[^\s'\",}]+", re.IGNORECASE)
+_KEY_VALUE = re.compile(
+    r"(?P<key>['\"]?(?:" + "|".join(re.escape(key) for key in SENSITIVE_KEYS) + r")['\"]?\s*[:=]\s*)"
+    r"(?P<value>'[^']*'|\"[^\"]*\"|[^\s,}\]'\"\\]+)",
+    re.IGNORECASE
+)
+# Phone numbers (E.164 length); shorter runs like epoch seconds are left alone
+_PHONE = re.compile(r"(?<![\w.-])\+?\d{7,11}(\d{4})(?![\w.-])")
+
+
+def _mask_value(match: re.Match) -> str:
+    value = match.group("value")
+    quote = value[0] if value[:1] in ("'", '"') else ""
+    return f"{match.group('key')}{quote}{REDACTED}{quote}"
+
+
+def redact(text: str) -> str:
+    """Mask tokens, credentials, phone numbers and names in a log line"""
+    text = _JWT.sub(REDACTED, text)
+    text = _BEARER.sub(r"\1" + REDACTED, text)
+    text = _KEY_VALUE.sub(_mask_value, text)
+    return _PHONE.sub(r"****\1", text)
+
+
+def parse_sample_rates(spec: Union[str, Dict[str, float], None]) -> Dict[str, float]:
+    """Parse "core.flow=0.1,core.components=0.5" into a rate per logger prefix"""
+    if not spec:
+        return {}
+    if isinstance(spec, dict):
+        return {name: float(rate) for name, rate in spec.items()}
+    rates = {}
+    for item in spec.split(","):
+        if "=" in item:
+            name, rate = item.split("=", 1)
+            rates[name.strip()] = float(rate)
+    return rates
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a share of DEBUG/INFO records per logger name prefix
+
+    WARNING and above always pass. The longest matching prefix wins, loggers
+    without a matching prefix are not sampled.
+    """
+
+    def __init__(self, rates: Union[str, Dict[str, float], None] = None):
+        super().__init__()
+        self.rates = parse_sample_rates(rates)
+        self._prefixes = sorted(self.rates, key=len, reverse=True)
+        self._cache: Dict[str, float] = {}
+
+    def _rate_for(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = 1.0
+            for prefix in self._prefixes:
+                if name == prefix or name.startswith(prefix + "."):
+                    rate = self.rates[prefix]
+                    break
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not self._prefixes:
+            return True
+        rate = self._rate_for(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class QueueingStreamHandler(QueueHandler):
+    """Stream handler that writes from a background QueueListener thread
+
+    The calling thread only merges the message with its arguments (they may
+    change once the call returns) and enqueues the record. Formatting with
+    this handler's formatter, redaction and the write happen on the listener.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.target = logging.StreamHandler(stream or sys.stdout)
+        self.target.format = self._format_for_output
+        self.listener: Optional[QueueListener] = None
+        self._start_listener()
+        atexit.register(self._stop_listener)
+        # Threads don't survive fork: gunicorn workers need their own listener
+        os.register_at_fork(after_in_child=self._restart_in_child)
+
+    def _start_listener(self) -> None:
+        self.listener = QueueListener(self.queue, self.target)
+        self.listener.start()
+
+    def _stop_listener(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def _restart_in_child(self) -> None:
+        self.queue = queue.SimpleQueue()
+        self._start_listener()
+
+    def _format_for_output(self, record: logging.LogRecord) -> str:
+        formatter = self.formatter or logging.Formatter()
+        return redact(formatter.format(record))
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
@@ -0,0 +1,260 @@
+"""Webhook traffic recording for replay
+
+With TRAFFIC_RECORD_PATH set, every worker appends what it handles to that
+file as compact newline-delimited JSON (see benchmarks/replay.py):
+- webhook: a user message body, with its processing time, the conversation's
+  state size afterwards and, the first time the process sees the
+  conversation, its state beforehand
+- send: an outbound WhatsApp payload
+- credex: a credex core API response, by endpoint and conversation
+
+Each entry carries its epoch time ("t") and conversation ("channel").
+Lines are written with one O_APPEND write each, so workers can share a file.
+
+Nothing identifying is written:
+- Phone numbers become stable pseudonyms (keyed HMAC, so a member maps to
+  the same number in every entry and worker)
+- Words in names, handles and free text become stable pseudonym words;
+  amounts, commands and IDs are kept so flows replay the same way
+- Tokens and credentials are replaced with TOKEN_PLACEHOLDER
+"""
+import contextvars
+import hashlib
+import hmac
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from core.flow.constants import GREETING_COMMANDS
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+TRAFFIC_RECORD_PATH = config("TRAFFIC_RECORD_PATH", default="")
+
+TOKEN_PLACEHOLDER = "<token>"
+
+# Conversations whose first state was written, per process
+MAX_SEEN_CHANNELS = 100_000
+
+_TOKEN_KEYS = frozenset({
+    "token", "jwt", "access_token", "refresh_token", "authorization", "password", "secret",
+    "apikey", "x-client-api-key"
+})
+# Business identifiers, message IDs and times are not personal and must survive
+_KEEP_KEYS = frozenset({"phone_number_id", "display_phone_number", "id", "timestamp", "messaging_product", "type"})
+_TEXT_KEYS = frozenset({"body", "text", "title", "description", "header", "footer"})
+# Replies that steer the flow are kept so the replay takes the same path
+_COMMANDS = frozenset(GREETING_COMMANDS | {"yes", "no", "true", "false"})
+
+_PHONE = re.compile(r"(?<!\d)\+?\d{7,15}(?!\d)")
+_WORD = re.compile(r"[^\W\d_]+")
+# Amounts as typed ("50", "50.25 USD", "$ 10", "USD 10") are replayed as they are
+_AMOUNT = re.compile(r"^\s*(?:[A-Za-z$]{1,4}\s*)?\d[\d,.]*\s*(?:[A-Za-z]{1,4})?\s*$")
+
+_channel: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("traffic_channel", default=None)
+
+
+class Scrubber:
+    """Replaces personal data in payloads with stable pseudonyms"""
+
+    def __init__(self, key: bytes):
+        """Initialize scrubber
+
+        Args:
+            key: HMAC key; the same key gives the same pseudonyms
+        """
+        self.key = key
+
+    def _digest(self, value: str) -> str:
+        return hmac.new(self.key, value.encode(), hashlib.sha256).hexdigest()
+
+    def number(self, value: str) -> str:
+        """Pseudonym phone number of the same shape for value"""
+        digits = str(int(self._digest(value.lstrip("+"))[:12], 16))[-8:].rjust(8, "0")
+        return f"{'+' if value.startswith('+') else ''}2639{digits}"
+
+    def word(self, value: str) -> str:
+        """Pseudonym word for value"""
+        return f"w{self._digest(value)[:8]}"
+
+    def numbers(self, text: str) -> str:
+        """Text with phone numbers replaced"""
+        return _PHONE.sub(lambda match: self.number(match.group()), text)
+
+    def words(self, text: str) -> str:
+        """Text with every word and phone number replaced"""
+        return _WORD.sub(lambda match: self.word(match.group()), self.numbers(text))
+
+    def text(self, text: str) -> str:
+        """Free text: amounts and commands kept, anything else pseudonymized word by word"""
+        if _AMOUNT.match(text) or text.strip().lower() in _COMMANDS:
+            return self.numbers(text)
+        return self.words(text)
+
+    def scrub(self, value: Any, key: str = "") -> Any:
+        """Copy of a decoded JSON value with personal data replaced"""
+        if isinstance(value, dict):
+            return {k: self.scrub(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.scrub(item, key) for item in value]
+        if not isinstance(value, str):
+            return value
+
+        lowered = key.lower()
+        if lowered in _TOKEN_KEYS:
+            return TOKEN_PLACEHOLDER
+        if lowered in _KEEP_KEYS:
+            return value
+        if "name" in lowered or "handle" in lowered:
+            return self.words(value)
+        if lowered in _TEXT_KEYS:
+            return self.text(value)
+        return self.numbers(value)
+
+
+class TrafficRecorder:
+    """Appends scrubbed traffic entries to a shared file"""
+
+    def __init__(self, path: str, key: bytes):
+        """Open the recording for appending
+
+        Args:
+            path: File to append to (created if missing)
+            key: Pseudonym key shared by all writers of the recording
+        """
+        self.path = path
+        self.scrubber = Scrubber(key)
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        self._seen = set()
+        self._seen_lock = threading.Lock()
+
+    def _write(self, kind: str, entry: Dict[str, Any], at: Optional[float] = None) -> None:
+        line = json.dumps(
+            {"t": round(at if at is not None else time.time(), 3), "kind": kind, **entry},
+            separators=(",", ":")
+        )
+        try:
+            os.write(self._fd, (line + "\n").encode())
+        except OSError as e:
+            logger.warning("Traffic recording failed: %s", e)
+
+    def _first_time(self, channel_id: str) -> bool:
+        with self._seen_lock:
+            if channel_id in self._seen or len(self._seen) >= MAX_SEEN_CHANNELS:
+                return False
+            self._seen.add(channel_id)
+            return True
+
+    def webhook(
+        self,
+        body: bytes,
+        channel_id: str,
+        arrived: float,
+        elapsed: float,
+        state_before: str,
+        state_after: str
+    ) -> None:
+        """Record a processed user message
+
+        Args:
+            body: Raw webhook body
+            channel_id: Conversation the message belongs to
+            arrived: Epoch time the webhook arrived
+            elapsed: Processing seconds
+            state_before: Stored state (JSON) before processing
+            state_after: Stored state (JSON) after processing
+        """
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return
+        entry = {
+            "channel": self.scrubber.number(channel_id),
+            "ms": round(elapsed * 1000, 3),
+            "state_bytes": len(state_after),
+            "body": self.scrubber.scrub(payload)
+        }
+        if self._first_time(channel_id):
+            entry["state"] = self.scrubber.scrub(json.loads(state_before or "{}"))
+        self._write("webhook", entry, at=arrived)
+
+    def send(self, payload: Dict[str, Any]) -> None:
+        """Record an outbound WhatsApp payload"""
+        to = payload.get("to")
+        self._write("send", {
+            "channel": self.scrubber.number(to) if to else None,
+            "payload": self.scrubber.scrub(payload)
+        })
+
+    def credex(self, endpoint: str, status_code: int, body: bytes) -> None:
+        """Record a credex core API response"""
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None
+        self._write("credex", {
+            "channel": _channel.get(),
+            "endpoint": endpoint,
+            "status": status_code,
+            "response": self.scrubber.scrub(data)
+        })
+
+    def close(self) -> None:
+        """Close the recording"""
+        os.close(self._fd)
+
+
+_recorder: Optional[TrafficRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_recorder() -> Optional[TrafficRecorder]:
+    """This process's recorder, or None when recording is off"""
+    global _recorder
+    if not TRAFFIC_RECORD_PATH:
+        return None
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                from django.conf import settings
+
+                key = config("TRAFFIC_RECORD_KEY", default=settings.SECRET_KEY)
+                _recorder = TrafficRecorder(TRAFFIC_RECORD_PATH, key.encode())
+    return _recorder
+
+
+def _reset_after_fork() -> None:
+    """Workers record conversations they see themselves, with their own descriptor"""
+    global _recorder, _recorder_lock
+    if _recorder is not None:
+        _recorder.close()
+    _recorder = None
+    _recorder_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def set_channel(channel_id: Optional[str]) -> contextvars.Token:
+    """Attribute credex entries recorded from here on to a conversation
+
+    Returns:
+        Token for reset_channel()
+    """
+    recorder = get_recorder()
+    return _channel.set(recorder.scrubber.number(channel_id) if recorder and channel_id else channel_id)
+
+
+def reset_channel(token: contextvars.Token) -> None:
+    """Undo set_channel()"""
+    _channel.reset(token)
+
+
+def current_channel() -> Optional[str]:
+    """Conversation entries are attributed to in this context"""
+    return _channel.get()
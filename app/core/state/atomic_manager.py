@@ -1,65 +1,45 @@
 """Atomic persistence operations with operation tracking
 
 This module provides atomic operations for persisting schema-validated state.
-It tracks operation attempts, timestamps, and errors in memory only - this is
-separate from the schema validation that happens at the state manager level.
+Each operation's latency and failures are reported to the
+Prometheus metrics - this is separate from the schema validation that happens
+at the state manager level.
 """
 import logging
-from datetime import datetime
+import time
 from typing import Any, Dict, Optional
 
 from core.error.exceptions import SystemException
-from core.state.persistence.redis_operations import RedisAtomic
+from core.monitoring.metrics import REDIS_OP_ERRORS, REDIS_OP_LATENCY
+from core.state.persistence.interface import StateStorage
 
 logger = logging.getLogger(__name__)
 
 
 class AtomicStateManager:
-    """Atomic persistence operations with in-memory operation tracking"""
-
-    def __init__(self, redis_client):
-        """Initialize with Redis client"""
-        self.storage = RedisAtomic(redis_client)
-        self._validation_state = {
-            "attempts": {},      # Track attempts per key
-            "last_attempts": {},  # Track last attempt timestamps
-            "errors": {}        # Track errors per key
-        }
-
-    def _track_attempt(self, key: str, operation: str, error: Optional[str] = None) -> Dict[str, Any]:
-        """Track operation attempt in memory"""
-        # Initialize tracking for key if needed
-        if key not in self._validation_state["attempts"]:
-            self._validation_state["attempts"][key] = {}
-            self._validation_state["last_attempts"][key] = {}
-            self._validation_state["errors"][key] = {}
-
-        # Update attempt count
-        self._validation_state["attempts"][key][operation] = \
-            self._validation_state["attempts"][key].get(operation, 0) + 1
-
-        # Update last attempt
-        self._validation_state["last_attempts"][key][operation] = datetime.utcnow().isoformat()
-
-        # Update error if present
+    """Atomic persistence operations with operation metrics"""
+
+    def __init__(self, storage: StateStorage):
+        """Initialize with state storage backend"""
+        self.storage = storage
+
+    def _track_attempt(self, operation: str, started: float, error: Optional[str] = None) -> None:
+        """Report operation latency and failure to metrics
+
+        Args:
+            operation: Operation name (get, set, update, delete)
+            started: perf_counter() value taken before the operation
+            error: Error message if the operation failed
+        """
+        REDIS_OP_LATENCY.labels(operation=operation).observe(time.perf_counter() - started)
         if error:
-            self._validation_state["errors"][key][operation] = error
-        else:
-            self._validation_state["errors"][key][operation] = None
-
-        # Return current validation state
-        return {
-            "in_progress": False,
-            "attempts": self._validation_state["attempts"][key][operation],
-            "last_attempt": self._validation_state["last_attempts"][key][operation],
-            "error": self._validation_state["errors"][key][operation]
-        }
+            REDIS_OP_ERRORS.labels(operation=operation).inc()
 
     def atomic_get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get schema-validated state with operation tracking"""
+        started = time.perf_counter()
         success, data, error = self.storage.execute_atomic(key, 'get')
-        # Track attempt in memory only
-        self._track_attempt(key, "get", error)
+        self._track_attempt("get", started, error)
 
         if not success:
             raise SystemException(
@@ -73,18 +53,16 @@ class AtomicStateManager:
 
     def atomic_set(self, key: str, value: Dict[str, Any], ttl: int = 300) -> None:
         """Set schema-validated state with operation tracking"""
-        # Track attempt in memory only
-        self._track_attempt(key, "set")
-
+        started = time.perf_counter()
         success, _, error = self.storage.execute_atomic(
             key=key,
             operation='set',
             value=value,
             ttl=ttl
         )
+        self._track_attempt("set", started, error)
 
         if not success:
-            self._track_attempt(key, "set", error)
             raise SystemException(
                 message=f"Failed to set state: {error}",
                 code="STATE_SET_ERROR",
@@ -94,19 +72,17 @@ class AtomicStateManager:
 
     def atomic_update(self, key: str, value: Dict[str, Any], ttl: int = 300) -> None:
         """Update schema-validated state with operation tracking"""
-        # Track attempt in memory only
-        self._track_attempt(key, "update")
-
+        started = time.perf_counter()
         success, _, error = self.storage.execute_atomic(
             key=key,
             operation='set',
             value=value,
             ttl=ttl
         )
+        self._track_attempt("update", started, error)
 
         if not success:
             logger.error(f"Atomic update failed: {error}")
-            self._track_attempt(key, "update", error)
             raise SystemException(
                 message=f"Failed to update state: {error}",
                 code="STATE_UPDATE_ERROR",
@@ -116,10 +92,11 @@ class AtomicStateManager:
 
     def atomic_delete(self, key: str) -> None:
         """Delete schema-validated state with operation tracking"""
+        started = time.perf_counter()
         success, _, error = self.storage.execute_atomic(key, 'delete')
+        self._track_attempt("delete", started, error)
 
         if not success:
-            self._track_attempt(key, "delete", error)
             raise SystemException(
                 message=f"Failed to delete state: {error}",
                 code="STATE_DELETE_ERROR",
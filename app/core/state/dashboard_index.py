@@ -0,0 +1,77 @@
+"""Dashboard lookup index
+
+Components look up the active account, the personal account and pending
+offers on almost every step. DashboardIndex maps them once per dashboard so
+these lookups are dict reads instead of scans of the accounts and offer
+lists:
+- Accounts by accountID, and the PERSONAL account
+- Pending offer counts per account
+- Pending offers by credexID, per account and direction ("in", "out"),
+  mapped on the first lookup of that list since most steps never need it
+
+The index holds references into the dashboard it was built from and is
+never stored; StateManager.get_dashboard_index() builds it on first use and
+again whenever the dashboard in state is replaced.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Pending offer lists of an account by direction
+OFFER_LISTS = {"in": "pendingInData", "out": "pendingOutData"}
+
+
+@dataclass(frozen=True, slots=True)
+class DashboardIndex:
+    """O(1) lookups into one dashboard"""
+    accounts_by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    personal_account: Optional[Dict[str, Any]] = None
+    # accountID -> (pending in, pending out)
+    pending_counts: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # (accountID, direction) -> credexID -> offer
+    offers_by_id: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, dashboard: Optional[Dict[str, Any]]) -> "DashboardIndex":
+        """Index a dashboard (an empty index for a missing one)"""
+        accounts_by_id = {}
+        personal_account = None
+        pending_counts = {}
+
+        for account in (dashboard or {}).get("accounts") or []:
+            account_id = account.get("accountID")
+            if account_id is None:
+                continue
+            accounts_by_id[account_id] = account
+            if personal_account is None and account.get("accountType") == "PERSONAL":
+                personal_account = account
+            pending_counts[account_id] = (
+                len(account.get("pendingInData") or []),
+                len(account.get("pendingOutData") or [])
+            )
+
+        return cls(accounts_by_id, personal_account, pending_counts)
+
+    def account(self, account_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Account by ID"""
+        return self.accounts_by_id.get(account_id) if account_id else None
+
+    def offers(self, account_id: Optional[str], direction: str) -> List[Dict[str, Any]]:
+        """Pending offers of an account in one direction, in dashboard order"""
+        account = self.account(account_id)
+        return (account.get(OFFER_LISTS[direction]) or []) if account else []
+
+    def offer(self, account_id: Optional[str], direction: str, credex_id: str) -> Optional[Dict[str, Any]]:
+        """Pending offer of an account by credexID"""
+        offers = self.offers_by_id.get((account_id, direction))
+        if offers is None:
+            offers = {
+                str(offer["credexID"]): offer
+                for offer in self.offers(account_id, direction)
+                if offer.get("credexID") is not None
+            }
+            self.offers_by_id[(account_id, direction)] = offers
+        return offers.get(credex_id)
+
+    def counts(self, account_id: Optional[str]) -> Tuple[int, int]:
+        """Pending (in, out) offer counts of an account"""
+        return self.pending_counts.get(account_id, (0, 0))
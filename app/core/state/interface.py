@@ -6,10 +6,13 @@ while avoiding circular dependencies.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from core.messaging.interface import MessagingServiceInterface
 
+if TYPE_CHECKING:
+    from .dashboard_index import DashboardIndex
+
 
 class StateManagerInterface(ABC):
     """Interface defining core state management operations"""
@@ -51,6 +54,15 @@ class StateManagerInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_dashboard_index(self) -> "DashboardIndex":
+        """Get lookup index of the dashboard in state
+
+        Returns:
+            DashboardIndex: Accounts and pending offers by ID
+        """
+        pass
+
     @abstractmethod
     def update_state(self, updates: Dict[str, Any]) -> None:
         """Update state with validation
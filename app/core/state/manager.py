@@ -7,6 +7,7 @@ This module implements the StateManagerInterface with:
 - Minimal nesting
 """
 
+import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -15,9 +16,12 @@ from core.error.exceptions import ComponentException
 from core.error.handler import ErrorHandler
 from core.error.types import ErrorContext
 from core.messaging.interface import MessagingServiceInterface
-from core.state.persistence.client import get_redis_client
+from core.state.persistence.client import get_state_storage
+from decouple import config
+from jwt import InvalidTokenError, decode
 
 from .atomic_manager import AtomicStateManager
+from .dashboard_index import DashboardIndex
 from .interface import StateManagerInterface
 from .validator import StateValidator
 
@@ -38,10 +42,11 @@ class StateManager(StateManagerInterface):
             )
 
         self.key_prefix = key_prefix
-        redis_client = get_redis_client()
-        self.atomic_state = AtomicStateManager(redis_client)
+        self.atomic_state = AtomicStateManager(get_state_storage())
         self._state = self._initialize_state()
         self._messaging = None  # Will be set by MessagingService
+        self._dashboard_index: Optional[DashboardIndex] = None
+        self._indexed_dashboard: Optional[Dict[str, Any]] = None
 
     @property
     def messaging(self) -> MessagingServiceInterface:
@@ -482,6 +487,18 @@ class StateManager(StateManagerInterface):
                 error=e
             )
 
+    def get_dashboard_index(self) -> DashboardIndex:
+        """Get lookup index of the dashboard in state
+
+        Built on first use and again whenever the dashboard is replaced
+        (dashboards are replaced whole, never edited in place).
+        """
+        dashboard = self._state.get("dashboard")
+        if self._dashboard_index is None or dashboard is not self._indexed_dashboard:
+            self._dashboard_index = DashboardIndex.build(dashboard)
+            self._indexed_dashboard = dashboard
+        return self._dashboard_index
+
     def get_channel_id(self) -> str:
         """Get channel identifier"""
         channel = self.get_state_value("channel", {})
@@ -515,8 +532,6 @@ class StateManager(StateManagerInterface):
             if not dashboard.get("member_id") or not jwt_token:
                 return False
 
-            from decouple import config
-            from jwt import InvalidTokenError, decode
             try:
                 decode(jwt_token, config("JWT_SECRET"), algorithms=["HS256"])
                 return True
@@ -534,6 +549,10 @@ class StateManager(StateManagerInterface):
         dashboard = self.get_state_value("dashboard", {})
         return dashboard.get("member_id")
 
+    def serialized_state(self) -> str:
+        """State as stored, for size accounting and snapshots"""
+        return json.dumps({key: value for key, value in self._state.items() if key != "_validation"})
+
     def is_mock_testing(self) -> bool:
         """Check if mock testing mode is enabled for this request"""
         return bool(self.get_state_value("mock_testing"))
@@ -1,9 +1,38 @@
-"""Redis client factory"""
+"""State storage and Redis client factories
+
+STATE_BACKEND selects where member state is kept:
+- redis (default): django-redis, shared by every worker and node
+- memory: this process only, for tests, benchmarks and single-node dev
+- sqlite: a WAL-mode SQLite file (STATE_SQLITE_PATH), shared by the workers
+  of one host, for small deployments
+
+Only the redis backend connects to Redis. With the others, features kept in
+Redis (handle cache, recent counterparties, outbox, delivery statuses) are
+off and Django's cache is in-process, so the app runs without Redis.
+"""
+import os
+import threading
 import warnings
+from typing import Optional
 
+from decouple import config
 from django.core.cache import CacheKeyWarning, cache
 from django_redis.client.default import DefaultClient
 
+from .interface import StateStorage
+from .redis_operations import RedisAtomic
+
+STATE_BACKEND = config("STATE_BACKEND", default="redis")
+STATE_SQLITE_PATH = config("STATE_SQLITE_PATH", default="/tmp/vimbiso-state.sqlite3")
+
+_storage: Optional[StateStorage] = None
+_storage_lock = threading.Lock()
+
+
+def uses_redis() -> bool:
+    """Whether the configured backend keeps state (and Redis-only features) in Redis"""
+    return STATE_BACKEND == "redis"
+
 
 def get_redis_client():
     """Get Redis client using Django's cache framework
@@ -23,6 +52,9 @@ def get_redis_client():
         Suppresses CacheKeyWarning since we're using Redis for state management,
         not traditional caching, so key format warnings aren't relevant.
     """
+    if not uses_redis():
+        raise RuntimeError(f"Redis is not used with STATE_BACKEND={STATE_BACKEND}")
+
     # Suppress cache key warnings since we're using Redis for state management
     warnings.filterwarnings("ignore", category=CacheKeyWarning)
 
@@ -31,3 +63,45 @@ def get_redis_client():
         raise RuntimeError("Cache backend is not django-redis DefaultClient")
 
     return cache.client.get_client(write=True)  # write=True ensures we get a client that can pipeline
+
+
+def _build_storage(backend: str) -> StateStorage:
+    if backend == "memory":
+        from .memory import MemoryStorage
+
+        return MemoryStorage()
+    if backend == "sqlite":
+        from .sqlite import SQLiteStorage
+
+        return SQLiteStorage(STATE_SQLITE_PATH)
+    raise ValueError(f"Unsupported state backend: {backend}")
+
+
+def get_state_storage() -> StateStorage:
+    """Get state storage for the configured backend
+
+    Redis storage is a thin wrapper over the pooled client and is created per
+    call; the other backends are shared by the whole process.
+
+    Raises:
+        ValueError: If STATE_BACKEND names no known backend
+    """
+    global _storage
+    if uses_redis():
+        return RedisAtomic(get_redis_client())
+
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = _build_storage(STATE_BACKEND)
+    return _storage
+
+
+def _reset_after_fork() -> None:
+    """Workers build their own storage (and database connections)"""
+    global _storage, _storage_lock
+    _storage = None
+    _storage_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
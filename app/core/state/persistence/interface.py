@@ -0,0 +1,35 @@
+"""State storage interface
+
+This module defines the contract every state storage backend implements.
+Storage only persists already validated state; validation happens at the
+state manager level.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+
+class StateStorage(ABC):
+    """Interface defining atomic state persistence"""
+
+    @abstractmethod
+    def execute_atomic(
+        self,
+        key: str,
+        operation: str,
+        value: Optional[Dict[str, Any]] = None,
+        ttl: Optional[int] = None,
+        max_retries: int = 3
+    ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Execute atomic storage operation
+
+        Args:
+            key: State key
+            operation: Operation type ('get', 'set', 'delete')
+            value: Optional value for set operation
+            ttl: Optional TTL in seconds for set operation
+            max_retries: Maximum retry attempts for conflicting writes
+
+        Returns:
+            Tuple of (success, result_data, error_message)
+        """
+        pass
@@ -0,0 +1,106 @@
+"""In-process state storage
+
+State kept in a dict in this process, for tests, benchmarks and single-node
+development:
+- Each key holds an immutable (JSON, expiry) entry that writers replace whole,
+  so reads and writes are single dict operations and take no lock; like a
+  Redis SET, the last write to a channel wins
+- TTLs are checked on read; expired entries are purged every SWEEP_INTERVAL
+  writes
+- Values are stored as JSON, so callers never share dicts with storage
+
+State is not shared between processes; run one worker with this backend.
+"""
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .interface import StateStorage
+
+SWEEP_INTERVAL = 1024
+
+
+class MemoryStorage(StateStorage):
+    """Atomic state persistence in process memory"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """Initialize empty storage
+
+        Args:
+            clock: Seconds source for TTLs
+        """
+        self.clock = clock
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._writes = 0
+        self._sweeping = threading.Lock()
+
+    def execute_atomic(
+        self,
+        key: str,
+        operation: str,
+        value: Optional[Dict[str, Any]] = None,
+        ttl: Optional[int] = None,
+        max_retries: int = 3
+    ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Execute atomic storage operation (see StateStorage)"""
+        if operation == 'get':
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= self.clock():
+                return True, None, None
+            try:
+                return True, json.loads(entry[0]), None
+            except json.JSONDecodeError as e:
+                return False, None, f"Invalid JSON data for key {key}: {str(e)}"
+
+        elif operation == 'set':
+            if value is None or ttl is None:
+                return False, None, "Missing value or TTL for set operation"
+            # Strip validation state before storage
+            store_value = value.copy()
+            store_value.pop("_validation", None)
+            try:
+                self._entries[key] = (json.dumps(store_value), self.clock() + ttl)
+            except (TypeError, ValueError) as e:
+                return False, None, f"Memory operation failed: {str(e)}"
+            self._writes += 1
+            if self._writes % SWEEP_INTERVAL == 0:
+                self.sweep()
+            return True, None, None
+
+        elif operation == 'delete':
+            self._entries.pop(key, None)
+            return True, None, None
+
+        return False, None, f"Unknown operation: {operation}"
+
+    def sweep(self) -> int:
+        """Purge expired entries
+
+        Returns:
+            Number of entries purged
+        """
+        if not self._sweeping.acquire(blocking=False):
+            return 0
+        try:
+            now = self.clock()
+            purged = 0
+            for key, (_, expires_at) in self._entries.copy().items():
+                if expires_at > now:
+                    continue
+                entry = self._entries.pop(key, None)
+                if entry is not None and entry[1] > now:
+                    # Rewritten since the copy; put it back unless written again
+                    self._entries.setdefault(key, entry)
+                    continue
+                purged += 1
+            return purged
+        finally:
+            self._sweeping.release()
+
+    def clear(self) -> None:
+        """Drop all state"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,14 +3,19 @@
 This module provides atomic Redis operations for storing and retrieving state.
 All state is schema-validated at a higher level - this layer only handles
 persistence of the validated state.
+
+Every operation is a single Redis command (GET, SETEX or DEL), which Redis
+runs atomically, so each costs one round trip. A state write replaces the
+whole value without reading it first, so a WATCH/MULTI transaction would add
+two round trips without guarding anything.
 """
 import json
 from typing import Any, Dict, Optional, Tuple
 
-from redis import WatchError
+from .interface import StateStorage
 
 
-class RedisAtomic:
+class RedisAtomic(StateStorage):
     """Atomic Redis operations for schema-validated state persistence"""
 
     def __init__(self, redis_client):
@@ -18,7 +23,7 @@ class RedisAtomic:
 
         Args:
             redis_client: Redis client from django-redis or direct redis-py
-                        Must support pipeline() and watch() operations
+                        Must support get(), setex() and delete() operations
 
         Raises:
             RuntimeError: If client doesn't support required operations
@@ -27,8 +32,8 @@ class RedisAtomic:
         self.redis = redis_client
 
         # Verify client supports required operations
-        if not hasattr(self.redis, 'pipeline') or not hasattr(self.redis, 'watch'):
-            raise RuntimeError("Redis client must support pipeline() and watch() operations")
+        if not all(hasattr(self.redis, name) for name in ('get', 'setex', 'delete')):
+            raise RuntimeError("Redis client must support get(), setex() and delete() operations")
 
     def execute_atomic(
         self,
@@ -45,63 +50,41 @@ class RedisAtomic:
             operation: Operation type ('get', 'set', 'delete')
             value: Optional value for set operation
             ttl: Optional TTL for set operation
-            max_retries: Maximum retry attempts for set/delete
+            max_retries: Unused, single commands never conflict
 
         Returns:
             Tuple of (success, result_data, error_message)
         """
-        retry_count = 0
-        while retry_count < max_retries:
-            try:
-                pipe = self.redis.pipeline()
-                pipe.watch(key)
-
-                try:
-                    pipe.multi()
-
-                    if operation == 'get':
-                        pipe.get(key)
-                        result = pipe.execute()
-                        if not result or not result[0]:
-                            return True, None, None
-                        data = json.loads(result[0])
-                        # Strip validation state since it's not persisted
-                        if "_validation" in data:
-                            del data["_validation"]
-                        return True, data, None
-
-                    elif operation == 'set':
-                        if value is None or ttl is None:
-                            return False, None, "Missing value or TTL for set operation"
-                        # Strip validation state before storage
-                        store_value = value.copy()
-                        if "_validation" in store_value:
-                            del store_value["_validation"]
-                        pipe.setex(key, ttl, json.dumps(store_value))
-                        pipe.execute()
-                        return True, None, None
-
-                    elif operation == 'delete':
-                        pipe.delete(key)
-                        pipe.execute()
-                        return True, None, None
-
-                    else:
-                        return False, None, f"Unknown operation: {operation}"
-
-                except WatchError:
-                    retry_count += 1
-                    if retry_count == max_retries:
-                        return False, None, f"Max retries ({max_retries}) exceeded for {operation}"
-                    continue
-
-                except json.JSONDecodeError as e:
-                    return False, None, f"Invalid JSON data for key {key}: {str(e)}"
-
-                finally:
-                    pipe.reset()
-
-            except Exception as e:
-                return False, None, f"Redis operation failed: {str(e)}"
-
-        return False, None, "Max retries exceeded"
+        try:
+            if operation == 'get':
+                raw = self.redis.get(key)
+                if not raw:
+                    return True, None, None
+                data = json.loads(raw)
+                # Strip validation state since it's not persisted
+                if "_validation" in data:
+                    del data["_validation"]
+                return True, data, None
+
+            elif operation == 'set':
+                if value is None or ttl is None:
+                    return False, None, "Missing value or TTL for set operation"
+                # Strip validation state before storage
+                store_value = value.copy()
+                if "_validation" in store_value:
+                    del store_value["_validation"]
+                self.redis.setex(key, ttl, json.dumps(store_value))
+                return True, None, None
+
+            elif operation == 'delete':
+                self.redis.delete(key)
+                return True, None, None
+
+            else:
+                return False, None, f"Unknown operation: {operation}"
+
+        except json.JSONDecodeError as e:
+            return False, None, f"Invalid JSON data for key {key}: {str(e)}"
+
+        except Exception as e:
+            return False, None, f"Redis operation failed: {str(e)}"
@@ -0,0 +1,106 @@
+"""SQLite state storage
+
+State in a SQLite database in WAL mode, for small single-host deployments
+where running Redis is not worth it:
+- Every worker process and thread opens its own connection; WAL lets readers
+  proceed while one writer commits
+- Each operation is one statement, so it is atomic without explicit
+  transactions; writers waiting on the database lock retry for BUSY_TIMEOUT
+- Expiry times are wall clock, shared by all processes; expired rows are
+  purged every SWEEP_INTERVAL writes
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .interface import StateStorage
+
+BUSY_TIMEOUT = 5.0  # seconds
+SWEEP_INTERVAL = 1024
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+
+
+class SQLiteStorage(StateStorage):
+    """Atomic state persistence in a SQLite database"""
+
+    def __init__(self, path: str):
+        """Open (creating if needed) the database
+
+        Args:
+            path: Database file shared by all workers
+        """
+        self.path = path
+        self._local = threading.local()
+        self._writes = 0
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection, reopened after a fork"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, isolation_level=None)
+            # WAL keeps the database consistent without syncing every commit
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def execute_atomic(
+        self,
+        key: str,
+        operation: str,
+        value: Optional[Dict[str, Any]] = None,
+        ttl: Optional[int] = None,
+        max_retries: int = 3
+    ) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
+        """Execute atomic storage operation (see StateStorage)"""
+        try:
+            connection = self._connection()
+
+            if operation == 'get':
+                row = connection.execute(
+                    "SELECT value FROM state WHERE key = ? AND expires_at > ?", (key, time.time())
+                ).fetchone()
+                if row is None:
+                    return True, None, None
+                return True, json.loads(row[0]), None
+
+            elif operation == 'set':
+                if value is None or ttl is None:
+                    return False, None, "Missing value or TTL for set operation"
+                # Strip validation state before storage
+                store_value = value.copy()
+                store_value.pop("_validation", None)
+                connection.execute(
+                    "INSERT OR REPLACE INTO state (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(store_value), time.time() + ttl)
+                )
+                self._writes += 1
+                if self._writes % SWEEP_INTERVAL == 0:
+                    self.sweep()
+                return True, None, None
+
+            elif operation == 'delete':
+                connection.execute("DELETE FROM state WHERE key = ?", (key,))
+                return True, None, None
+
+            return False, None, f"Unknown operation: {operation}"
+
+        except json.JSONDecodeError as e:
+            return False, None, f"Invalid JSON data for key {key}: {str(e)}"
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            return False, None, f"SQLite operation failed: {str(e)}"
+
+    def sweep(self) -> int:
+        """Purge expired rows
+
+        Returns:
+            Number of rows purged
+        """
+        return self._connection().execute("DELETE FROM state WHERE expires_at <= ?", (time.time(),)).rowcount
@@ -7,6 +7,9 @@ Components handle their own data validation.
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from decouple import config
+from jwt import InvalidTokenError, decode
+
 
 @dataclass
 class ValidationResult:
@@ -166,8 +169,6 @@ class StateValidator:
     @classmethod
     def _validate_jwt(cls, jwt_token: str) -> bool:
         """Validate JWT token is not expired"""
-        from decouple import config
-        from jwt import InvalidTokenError, decode
         try:
             decode(jwt_token, config("JWT_SECRET"), algorithms=["HS256"])
             return True
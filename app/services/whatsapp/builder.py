@@ -0,0 +1,206 @@
+"""Single-pass WhatsApp interactive message builder
+
+All Cloud API limits and the rules applied to them live here:
+- Text fields are truncated to their limit
+- Buttons, sections and rows beyond their counts are dropped
+- Missing body, row IDs or titles, or mixing buttons with sections, raise
+  MessageValidationError
+
+Interactive messages are checked and emitted as the final wire dict in one
+pass over their content, whether it comes from InteractiveContent, the
+messaging service or an already-shaped interactive dict.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from core.messaging.exceptions import MessageValidationError
+from core.messaging.types import Button, InteractiveContent, InteractiveType, Section
+
+# WhatsApp Cloud API limits
+LIMITS = {
+    "text_body": 4096,      # Maximum text message length
+    "header": 60,           # Maximum header text length
+    "footer": 60,           # Maximum footer text length
+    "button_text": 20,      # Maximum button text length
+    "list_title": 24,       # Maximum list item title length
+    "list_description": 72,  # Maximum list item description length
+    "buttons_count": 3,     # Maximum number of buttons
+    "sections_count": 10,   # Maximum number of sections
+    "rows_per_section": 10  # Maximum rows per section
+}
+
+# WhatsApp API requires these exact string values
+WHATSAPP_BASE = {
+    "messaging_product": "whatsapp",
+    "recipient_type": "individual"
+}
+
+DEFAULT_LIST_BUTTON = "Select"
+
+_TEXT_BODY = LIMITS["text_body"]
+_HEADER = LIMITS["header"]
+_FOOTER = LIMITS["footer"]
+_BUTTON_TEXT = LIMITS["button_text"]
+_LIST_TITLE = LIMITS["list_title"]
+_LIST_DESCRIPTION = LIMITS["list_description"]
+_BUTTONS_COUNT = LIMITS["buttons_count"]
+_SECTIONS_COUNT = LIMITS["sections_count"]
+_ROWS_PER_SECTION = LIMITS["rows_per_section"]
+
+
+def _invalid(message: str, **details: Any) -> MessageValidationError:
+    return MessageValidationError(
+        message=message,
+        service="whatsapp",
+        action="build_interactive",
+        validation_details=details
+    )
+
+
+def _button(button: Union[Button, Dict[str, Any]]) -> Dict[str, Any]:
+    """Wire reply button from a Button or an already-shaped dict"""
+    if isinstance(button, Button):
+        button_type, button_id, title = button.type, button.id, button.title
+    else:
+        reply = button.get("reply", button)
+        button_type, button_id, title = button.get("type", "reply"), reply.get("id"), reply.get("title")
+    if not button_id or not title:
+        raise _invalid("Button missing required fields (id and title)", error="missing_required_fields")
+    if len(title) > _BUTTON_TEXT:
+        title = title[:_BUTTON_TEXT]
+    return {"type": button_type, "reply": {"id": button_id, "title": title}}
+
+
+def _section(section: Union[Section, Dict[str, Any]]) -> Dict[str, Any]:
+    """Wire list section
+
+    The rows list and its rows are reused when already within limits; only
+    rows that need truncating are copied.
+    """
+    if isinstance(section, Section):
+        title, rows = section.title, section.rows
+    else:
+        title, rows = section.get("title"), section.get("rows", [])
+    if not title:
+        raise _invalid("Section title is required", error="missing_required_field", field="section_title")
+    if len(title) > _LIST_TITLE:
+        title = title[:_LIST_TITLE]
+    if len(rows) > _ROWS_PER_SECTION:
+        rows = rows[:_ROWS_PER_SECTION]
+
+    clipped = None
+    for index, row in enumerate(rows):
+        if "id" not in row or "title" not in row:
+            raise _invalid(
+                "Row missing required fields (id and title)",
+                error="missing_required_fields", section=title, row=row
+            )
+        row_title = row["title"]
+        description = row.get("description")
+        if len(row_title) > _LIST_TITLE or (description and len(description) > _LIST_DESCRIPTION):
+            if clipped is None:
+                clipped = list(rows)
+            clipped[index] = row = {**row, "title": row_title[:_LIST_TITLE]}
+            if description:
+                row["description"] = description[:_LIST_DESCRIPTION]
+    return {"title": title, "rows": rows if clipped is None else clipped}
+
+
+def build_interactive(
+    to: str,
+    body: str,
+    buttons: Optional[Sequence[Union[Button, Dict[str, Any]]]] = None,
+    sections: Optional[Sequence[Union[Section, Dict[str, Any]]]] = None,
+    header: Optional[str] = None,
+    footer: Optional[str] = None,
+    button_text: Optional[str] = None,
+    interactive_type: Optional[InteractiveType] = None
+) -> Dict[str, Any]:
+    """Validate, truncate and emit an interactive message in one pass
+
+    Args:
+        to: Recipient phone number
+        body: Body text
+        buttons: Reply buttons (Button or wire dicts)
+        sections: List sections (Section or dicts with title and rows)
+        header: Optional header text
+        footer: Optional footer text
+        button_text: List menu button text (defaults to "Select")
+        interactive_type: Defaults to button when buttons are given, list otherwise
+
+    Returns:
+        WhatsApp Cloud API message dict
+
+    Raises:
+        MessageValidationError: If required parts are missing or conflicting
+    """
+    if not to:
+        raise _invalid("Recipient (to) is required", error="missing_recipient")
+    if not body:
+        raise _invalid("Message body is required", error="missing_required_field", field="body")
+    if buttons and sections:
+        raise _invalid(
+            "Cannot specify both buttons and sections",
+            error="invalid_params", detail="buttons and sections are mutually exclusive"
+        )
+    if interactive_type is None:
+        interactive_type = InteractiveType.BUTTON if buttons else InteractiveType.LIST
+
+    interactive: Dict[str, Any] = {
+        "type": interactive_type.value,
+        "body": {"text": body if len(body) <= _TEXT_BODY else body[:_TEXT_BODY]}
+    }
+    if header:
+        interactive["header"] = {"type": "text", "text": header[:_HEADER]}
+    if footer:
+        interactive["footer"] = {"text": footer[:_FOOTER]}
+
+    if interactive_type == InteractiveType.BUTTON:
+        interactive["action"] = {
+            "buttons": [_button(button) for button in (buttons or [])[:_BUTTONS_COUNT]]
+        }
+    elif interactive_type == InteractiveType.LIST:
+        interactive["action"] = {
+            "button": (button_text or DEFAULT_LIST_BUTTON)[:_BUTTON_TEXT],
+            "sections": [_section(section) for section in (sections or [])[:_SECTIONS_COUNT]]
+        }
+
+    return {
+        **WHATSAPP_BASE,
+        "to": to,
+        "type": "interactive",
+        "interactive": interactive
+    }
+
+
+def build_from_content(to: str, content: InteractiveContent) -> Dict[str, Any]:
+    """Emit an InteractiveContent as a WhatsApp message"""
+    return build_interactive(
+        to,
+        content.body,
+        buttons=content.buttons,
+        sections=content.sections,
+        header=content.header,
+        footer=content.footer,
+        button_text=content.button_text,
+        interactive_type=content.interactive_type
+    )
+
+
+def build_from_wire(to: str, interactive: Dict[str, Any]) -> Dict[str, Any]:
+    """Check an already-shaped interactive dict against the same rules"""
+    if not interactive.get("type"):
+        raise _invalid("Interactive message type is required", error="missing_type")
+    action = interactive.get("action", {})
+    header = interactive.get("header") or {}
+    footer = interactive.get("footer") or {}
+    sections: List[Dict[str, Any]] = action.get("sections", [])
+    return build_interactive(
+        to,
+        (interactive.get("body") or {}).get("text", ""),
+        buttons=action.get("buttons"),
+        sections=sections,
+        header=header.get("text"),
+        footer=footer.get("text"),
+        button_text=action.get("button"),
+        interactive_type=InteractiveType(interactive["type"])
+    )
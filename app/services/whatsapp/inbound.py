@@ -0,0 +1,146 @@
+"""WhatsApp webhook parsing into InboundEvent
+
+The raw webhook body is decoded once and walked once:
+- Only the first change's first user message is used
+- Bodies for another business number, status updates, unsupported message
+  types and malformed payloads yield no event
+- The resulting InboundEvent carries everything the view, flow processor and
+  messaging service need, so none of them reads the payload again
+
+verify_signature() checks Meta's X-Hub-Signature-256 header against the raw
+body before any of this; it accepts every body while WHATSAPP_APP_SECRET is
+unset.
+"""
+import hashlib
+import hmac
+import json
+from typing import Any, Dict, Optional
+
+from core.messaging.types import InboundEvent, InteractiveType, MessageType
+from decouple import config
+
+CHANNEL_TYPE = "whatsapp"
+
+APP_SECRET = config("WHATSAPP_APP_SECRET", default="")
+SIGNATURE_HEADER = "X-Hub-Signature-256"
+SIGNATURE_PREFIX = "sha256="
+
+_REPLY_TYPES = {
+    "button_reply": InteractiveType.BUTTON,
+    "list_reply": InteractiveType.LIST
+}
+
+
+def sign(body: bytes, secret: str) -> str:
+    """X-Hub-Signature-256 value of a body"""
+    return SIGNATURE_PREFIX + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: Optional[str]) -> bool:
+    """Check a webhook body against its X-Hub-Signature-256 header
+
+    Args:
+        body: Raw request body
+        signature: Header value, None if missing
+
+    Returns:
+        Whether the body was signed with the app secret (always True while
+        WHATSAPP_APP_SECRET is unset)
+    """
+    if not APP_SECRET:
+        return True
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(body, APP_SECRET), signature)
+
+
+def parse_webhook(
+    body: bytes,
+    phone_number_id: Optional[str] = None,
+    mock_testing: bool = False
+) -> Optional[InboundEvent]:
+    """Parse a raw webhook body
+
+    Args:
+        body: Raw request body
+        phone_number_id: Only accept messages to this business number (None accepts any)
+        mock_testing: Whether the request came from the mock server
+
+    Returns:
+        InboundEvent, or None if the body holds no message to process
+    """
+    try:
+        payload = json.loads(body)
+    except (ValueError, TypeError):
+        return None
+    return event_from_payload(payload, phone_number_id, mock_testing)
+
+
+def event_from_payload(
+    payload: Any,
+    phone_number_id: Optional[str] = None,
+    mock_testing: bool = False
+) -> Optional[InboundEvent]:
+    """Build an InboundEvent from an already decoded webhook payload
+
+    Args:
+        payload: Decoded webhook body
+        phone_number_id: Only accept messages to this business number (None accepts any)
+        mock_testing: Whether the request came from the mock server
+
+    Returns:
+        InboundEvent, or None if the payload holds no message to process
+    """
+    try:
+        value = payload["entry"][0]["changes"][0]["value"]
+        if not isinstance(value, dict) or value.get("messaging_product") != CHANNEL_TYPE:
+            return None
+        if phone_number_id is not None and (value.get("metadata") or {}).get("phone_number_id") != phone_number_id:
+            return None
+        # Status updates are handled before request parsing (see statuses.py)
+        if "statuses" in value:
+            return None
+
+        message = (value.get("messages") or [None])[0]
+        # Only process user-initiated messages
+        if not isinstance(message, dict) or not message.get("from"):
+            return None
+        contact = (value.get("contacts") or [None])[0]
+        channel_id = contact.get("wa_id") if isinstance(contact, dict) else None
+        if not channel_id:
+            return None
+
+        message_type = message.get("type")
+        if message_type == MessageType.TEXT.value:
+            return InboundEvent(
+                channel_type=CHANNEL_TYPE,
+                channel_id=channel_id,
+                message_id=message.get("id"),
+                kind=MessageType.TEXT,
+                text=(message.get("text") or {}).get("body", ""),
+                mock_testing=mock_testing
+            )
+
+        if message_type == MessageType.INTERACTIVE.value:
+            interactive: Dict[str, Any] = message.get("interactive") or {}
+            reply_type = interactive.get("type")
+            if reply_type not in _REPLY_TYPES:
+                return None
+            reply = interactive.get(reply_type) or {}
+            return InboundEvent(
+                channel_type=CHANNEL_TYPE,
+                channel_id=channel_id,
+                message_id=message.get("id"),
+                kind=MessageType.INTERACTIVE,
+                interactive_type=_REPLY_TYPES[reply_type],
+                reply_id=reply.get("id"),
+                reply_title=reply.get("title"),
+                reply_description=reply.get("description"),
+                mock_testing=mock_testing
+            )
+
+        # Unsupported message type
+        return None
+
+    except (IndexError, KeyError, TypeError, AttributeError):
+        return None
@@ -0,0 +1,154 @@
+"""Member notifications sent on behalf of the credex backend
+
+Single notifications and batches use the same `incoming_notification`
+template. For batches:
+- The template payload is built and validated once; each recipient only
+  gets its own `to` and body parameters
+- Recipients with missing fields are reported back without being sent
+- With the outbox enabled, all messages are appended in one pipeline and
+  the dispatcher's token bucket paces delivery
+- Otherwise messages go out over the pooled sender from a bounded thread
+  pool, and results carry each response's status code
+"""
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import requests
+from core.messaging.types import Message, MessageRecipient, TemplateContent
+from decouple import config
+
+from . import outbox
+from .outbox import SENT, classify_response, message_id_of
+from .sender import MOCK, POOL_SIZE, PRODUCTION, get_sender
+from .types import WhatsAppMessage
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_TEMPLATE = "incoming_notification"
+NOTIFICATION_LANGUAGE = {"code": "en_US"}
+
+MAX_RECIPIENTS = config("BULK_NOTIFY_MAX_RECIPIENTS", default=1000, cast=int)
+# Concurrent sends per batch when the outbox is disabled; more than the
+# sender's pool size would only wait for a connection
+WORKERS = config("BULK_NOTIFY_WORKERS", default=POOL_SIZE, cast=int)
+
+REQUIRED_FIELDS = ("phoneNumber", "memberName", "message")
+
+QUEUED = "queued"
+FAILED = "failed"
+INVALID = "invalid"
+
+
+def notification_content(member_name: str, text: str) -> TemplateContent:
+    """Template content of a notification to one member"""
+    return TemplateContent(
+        name=NOTIFICATION_TEMPLATE,
+        language=NOTIFICATION_LANGUAGE,
+        components=[_body_component(member_name, text)]
+    )
+
+
+def _body_component(member_name: str, text: str) -> Dict[str, Any]:
+    return {
+        "type": "body",
+        "parameters": [
+            {"type": "text", "text": member_name},
+            {"type": "text", "text": text}
+        ]
+    }
+
+
+def _template_skeleton() -> Dict[str, Any]:
+    """Validated Graph API payload whose recipient and parameters get replaced"""
+    return WhatsAppMessage.from_core_message(Message(
+        recipient=MessageRecipient(type="whatsapp", identifier="0"),
+        content=notification_content("", "")
+    ))
+
+
+def build_payloads(recipients: List[Dict[str, Any]]) -> Tuple[List[Tuple[int, str, Dict[str, Any]]], List[Dict[str, Any]]]:
+    """Build one payload per valid recipient from a single template skeleton
+
+    Args:
+        recipients: Items with phoneNumber, memberName and message
+
+    Returns:
+        Tuple of ([(index, phone number, payload)], [invalid recipient results])
+    """
+    skeleton = _template_skeleton()
+    template = skeleton["template"]
+    payloads, invalid = [], []
+
+    for index, recipient in enumerate(recipients):
+        if not isinstance(recipient, dict) or not all(recipient.get(field) for field in REQUIRED_FIELDS):
+            invalid.append({
+                "index": index,
+                "phoneNumber": recipient.get("phoneNumber") if isinstance(recipient, dict) else None,
+                "status": INVALID,
+                "error": f"Missing required fields: {', '.join(REQUIRED_FIELDS)}"
+            })
+            continue
+
+        phone = str(recipient["phoneNumber"])
+        payloads.append((index, phone, {
+            **skeleton,
+            "to": phone,
+            "template": {
+                **template,
+                "components": [_body_component(str(recipient["memberName"]), str(recipient["message"]))]
+            }
+        }))
+    return payloads, invalid
+
+
+def _send_one(mode: str, index: int, phone: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    result = {"index": index, "phoneNumber": phone}
+    try:
+        response = get_sender(mode).post(payload)
+    except requests.RequestException as e:
+        return {**result, "status": FAILED, "error": str(e)}
+
+    outcome, error = classify_response(response)
+    result["statusCode"] = response.status_code
+    if outcome == SENT:
+        return {**result, "status": SENT, "messageId": message_id_of(response)}
+    return {**result, "status": FAILED, "error": error}
+
+
+def send_bulk(recipients: List[Dict[str, Any]], mock_testing: bool = False) -> List[Dict[str, Any]]:
+    """Notify many members with one template
+
+    Args:
+        recipients: Items with phoneNumber, memberName and message
+        mock_testing: Send to the mock server instead of the Graph API
+
+    Returns:
+        One result per recipient, in input order
+    """
+    mode = MOCK if mock_testing else PRODUCTION
+    payloads, results = build_payloads(recipients)
+
+    if outbox.OUTBOX_ENABLED:
+        entry_ids = outbox.get_outbox().enqueue_many([(phone, payload) for _, phone, payload in payloads], mode)
+        outbox.ensure_dispatcher()
+        results.extend(
+            {"index": index, "phoneNumber": phone, "status": QUEUED, "outboxId": entry_id}
+            for (index, phone, _), entry_id in zip(payloads, entry_ids)
+        )
+    elif payloads:
+        with ThreadPoolExecutor(max_workers=min(WORKERS, len(payloads)), thread_name_prefix="notify") as executor:
+            # Each task runs in a copy of this context so call budgets still count its sends
+            futures = [
+                executor.submit(contextvars.copy_context().run, _send_one, mode, index, phone, payload)
+                for index, phone, payload in payloads
+            ]
+            sent = [future.result() for future in futures]
+        if mode == PRODUCTION:
+            outbox.record_sent([result.get("messageId") for result in sent])
+        results.extend(sent)
+
+    results.sort(key=lambda result: result["index"])
+    logger.info("Bulk notification of %d recipients (%s)", len(results), mode)
+    return results
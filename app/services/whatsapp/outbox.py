@@ -0,0 +1,748 @@
+"""Durable outbound message outbox
+
+This module decouples flow processing from Graph API latency:
+- Messages are appended to Redis Streams partitioned by recipient, so each
+  recipient's messages stay in order while partitions are sent in parallel
+- A dispatcher thread per partition (one owner at a time through a lease)
+  hands entries to per-recipient lanes, so different recipients are sent
+  concurrently while each recipient's messages go out one at a time
+- An entry that needs another attempt is parked with the recipient's later
+  messages behind it until its backoff is over, instead of holding up the
+  partition
+- A Redis token bucket shared by all workers keeps sends within the
+  business number's throughput tier
+- Entries that exhaust their attempts or are rejected move to a failed
+  stream, from which they can be drained back once the incident is over
+- Sent entries are kept under their message ID for a while, so failed
+  delivery statuses (see statuses.py) can send them again; messages sent
+  inline while the outbox is off keep only their send time there, for
+  delivery latency
+
+Delivery is at-least-once: an entry is removed only after a send succeeded,
+so a worker dying mid-send causes a resend by the next lease owner.
+
+Everything here lives in Redis, so the outbox and send time bookkeeping are
+off when STATE_BACKEND is not redis; messages are then sent inline.
+"""
+import json
+import logging
+import math
+import os
+import socket
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import requests
+from core.monitoring.metrics import (OUTBOX_DELIVERIES, OUTBOX_ENQUEUED,
+                                     OUTBOX_QUEUE_DELAY)
+from core.state.persistence.client import get_redis_client, uses_redis
+from decouple import config
+
+from .sender import get_sender
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_ENABLED = config("WHATSAPP_OUTBOX_ENABLED", default=False, cast=bool) and uses_redis()
+# Run dispatcher threads inside web workers; disable to run `manage.py outbox run` instead
+OUTBOX_DISPATCH_IN_PROCESS = config("WHATSAPP_OUTBOX_DISPATCH_IN_PROCESS", default=True, cast=bool)
+PARTITIONS = config("WHATSAPP_OUTBOX_PARTITIONS", default=4, cast=int)
+MAX_ATTEMPTS = config("WHATSAPP_OUTBOX_MAX_ATTEMPTS", default=8, cast=int)
+
+# Cloud API throughput per business number: 80 msg/s by default, 1000 msg/s
+# once Meta upgrades the number
+THROUGHPUT_TIERS = {"standard": 80, "high": 1000}
+THROUGHPUT_TIER = config("WHATSAPP_THROUGHPUT_TIER", default="standard")
+THROUGHPUT = THROUGHPUT_TIERS.get(THROUGHPUT_TIER, THROUGHPUT_TIERS["standard"])
+
+# Concurrent sends per partition; the default keeps enough sends in flight to
+# reach the throughput tier at SEND_LATENCY per Graph API call
+SEND_LATENCY = 0.5  # seconds
+CONCURRENCY = config(
+    "WHATSAPP_OUTBOX_CONCURRENCY",
+    default=max(1, math.ceil(THROUGHPUT * SEND_LATENCY / PARTITIONS)),
+    cast=int
+)
+
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_MAX = 60.0  # seconds
+LEASE_TTL_MS = 15000
+READ_BLOCK_MS = 1000
+PARKED_POLL_MS = 100  # read wait while parked recipients may come due
+READ_COUNT = 10
+
+STREAM_PREFIX = "outbox:whatsapp"
+FAILED_STREAM = f"{STREAM_PREFIX}:failed"
+SENT_PREFIX = f"{STREAM_PREFIX}:sent"
+
+# How long sent entries are kept for correlation with status callbacks
+SENT_TTL = config("WHATSAPP_OUTBOX_SENT_TTL", default=86400, cast=int)
+
+# Graph API error codes worth retrying even though they come with a 4xx:
+# rate limits, pair rate limit, temporary service errors
+RETRYABLE_ERROR_CODES = {4, 80007, 130429, 131000, 131016, 131056, 133004}
+
+SENT = "sent"
+RETRY = "retry"
+DEAD = "dead"
+
+# Atomically refill and take one token; returns seconds to wait (0 when taken)
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def stream_key(partition: int) -> str:
+    """Stream holding pending messages for a partition"""
+    return f"{STREAM_PREFIX}:{partition}"
+
+
+def lease_key(partition: int) -> str:
+    """Key naming the dispatcher that currently owns a partition"""
+    return f"{STREAM_PREFIX}:lease:{partition}"
+
+
+def parked_key(partition: int, recipient: str) -> str:
+    """List of a recipient's messages waiting for its head entry's backoff"""
+    return f"{STREAM_PREFIX}:parked:{partition}:{recipient}"
+
+
+def due_key(partition: int) -> str:
+    """Sorted set of a partition's parked recipients by next attempt time"""
+    return f"{STREAM_PREFIX}:due:{partition}"
+
+
+def sent_key(message_id: str) -> str:
+    """Hash holding a sent entry, keyed by the Graph API message ID (wamid)"""
+    return f"{SENT_PREFIX}:{message_id}"
+
+
+def message_id_of(response: requests.Response) -> Optional[str]:
+    """Graph API message ID of a successful send, if the response carries one"""
+    try:
+        return response.json()["messages"][0]["id"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff for the given (1-based) failed attempt"""
+    return min(BACKOFF_MAX, BACKOFF_BASE * (2 ** (attempt - 1)))
+
+
+def classify_response(response: requests.Response) -> Tuple[str, Optional[str]]:
+    """Decide whether a Graph API response is sent, retryable or permanent
+
+    Returns:
+        Tuple of (outcome, error detail)
+    """
+    if 200 <= response.status_code < 300:
+        return SENT, None
+
+    detail = response.text[:500]
+    try:
+        error = response.json().get("error", {})
+        code = error.get("code")
+        detail = f"{code}: {error.get('message', detail)}"
+    except (ValueError, AttributeError):
+        code = None
+
+    if response.status_code == 429 or response.status_code >= 500 or code in RETRYABLE_ERROR_CODES:
+        return RETRY, detail
+    return DEAD, detail
+
+
+class TokenBucket:
+    """Redis token bucket shared by every worker sending for one number"""
+
+    def __init__(self, redis_client, key: str, rate: float, burst: Optional[float] = None):
+        self.key = key
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._take = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def acquire(self, stop: Optional[threading.Event] = None) -> bool:
+        """Block until a token is taken
+
+        Returns:
+            False if stop was set while waiting
+        """
+        while True:
+            wait = float(self._take(keys=[self.key], args=[self.rate, self.burst]))
+            if wait <= 0:
+                return True
+            if stop is not None:
+                if stop.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class Outbox:
+    """Outbound WhatsApp messages on partitioned Redis Streams"""
+
+    def __init__(self, redis_client, partitions: int = PARTITIONS):
+        """Initialize with a decode_responses Redis client"""
+        self.redis = redis_client
+        self.partitions = partitions
+        self._renew = redis_client.register_script(RENEW_LEASE_SCRIPT)
+        self._release = redis_client.register_script(RELEASE_LEASE_SCRIPT)
+
+    def partition_for(self, recipient: str) -> int:
+        """Stable partition for a recipient so their messages stay ordered"""
+        return zlib.crc32(recipient.encode()) % self.partitions
+
+    def enqueue(self, recipient: str, payload: Dict[str, Any], mode: str, redeliveries: int = 0) -> str:
+        """Append a WhatsApp payload for delivery
+
+        Args:
+            recipient: Recipient phone number
+            payload: Graph API message payload
+            mode: Sender mode (production, mock)
+            redeliveries: Times this message was already sent and reported failed
+
+        Returns:
+            Stream entry ID
+        """
+        fields = {
+            "recipient": recipient,
+            "mode": mode,
+            "payload": json.dumps(payload),
+            "enqueued_at": repr(time.time())
+        }
+        if redeliveries:
+            fields["redeliveries"] = str(redeliveries)
+        entry_id = self.redis.xadd(stream_key(self.partition_for(recipient)), fields)
+        OUTBOX_ENQUEUED.labels(mode=mode).inc()
+        return entry_id
+
+    def enqueue_many(self, messages: List[Tuple[str, Dict[str, Any]]], mode: str) -> List[str]:
+        """Append many (recipient, payload) messages in one round trip
+
+        Returns:
+            Stream entry IDs in input order
+        """
+        if not messages:
+            return []
+        enqueued_at = repr(time.time())
+        pipe = self.redis.pipeline(transaction=False)
+        for recipient, payload in messages:
+            pipe.xadd(stream_key(self.partition_for(recipient)), {
+                "recipient": recipient,
+                "mode": mode,
+                "payload": json.dumps(payload),
+                "enqueued_at": enqueued_at
+            })
+        entry_ids = pipe.execute()
+        OUTBOX_ENQUEUED.labels(mode=mode).inc(len(entry_ids))
+        return entry_ids
+
+    def read(
+        self,
+        partition: int,
+        after: str = "0-0",
+        count: int = READ_COUNT,
+        block_ms: int = READ_BLOCK_MS
+    ) -> List[Tuple[str, Dict[str, str]]]:
+        """Oldest pending entries of a partition after an entry ID, waiting up to block_ms when none"""
+        result = self.redis.xread({stream_key(partition): after}, count=count, block=block_ms)
+        if not result:
+            return []
+        return result[0][1]
+
+    def ack(self, partition: int, entry_id: str) -> None:
+        """Remove a delivered entry"""
+        self.redis.xdel(stream_key(partition), entry_id)
+
+    def _remove(self, pipe, partition: int, entry_id: Optional[str], fields: Dict[str, str]) -> None:
+        """Remove a stream entry, or the head parked entry when entry_id is None"""
+        if entry_id is None:
+            pipe.lpop(parked_key(partition, fields["recipient"]))
+        else:
+            pipe.xdel(stream_key(partition), entry_id)
+
+    def complete(self, partition: int, entry_id: Optional[str], fields: Dict[str, str], message_id: Optional[str]) -> None:
+        """Remove a delivered entry and keep it under its message ID
+
+        Status callbacks for the message (see statuses.py) use the kept copy
+        to measure delivery latency and to resend when delivery failed.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        self._remove(pipe, partition, entry_id, fields)
+        if message_id:
+            key = sent_key(message_id)
+            pipe.hset(key, mapping={**fields, "sent_at": repr(time.time())})
+            pipe.expire(key, SENT_TTL)
+        pipe.execute()
+
+    def record_sent(self, message_ids: List[str]) -> None:
+        """Keep the send time of messages sent inline, under their message IDs
+
+        Status callbacks measure delivery latency from it; without an entry
+        these messages are never sent again.
+        """
+        if not message_ids:
+            return
+        sent_at = repr(time.time())
+        pipe = self.redis.pipeline(transaction=False)
+        for message_id in message_ids:
+            key = sent_key(message_id)
+            pipe.hset(key, "sent_at", sent_at)
+            pipe.expire(key, SENT_TTL)
+        pipe.execute()
+
+    def add_failed(self, fields: Dict[str, str], error: Optional[str], attempts: int, pipe=None) -> None:
+        """Append an entry to the failed stream"""
+        (pipe or self.redis).xadd(FAILED_STREAM, {
+            **fields,
+            "error": error or "",
+            "attempts": str(attempts),
+            "failed_at": repr(time.time())
+        })
+
+    def dead_letter(self, partition: int, entry_id: Optional[str], fields: Dict[str, str], error: Optional[str], attempts: int) -> None:
+        """Move an entry to the failed stream"""
+        pipe = self.redis.pipeline()
+        self.add_failed(fields, error, attempts, pipe=pipe)
+        self._remove(pipe, partition, entry_id, fields)
+        pipe.execute()
+
+    def park(
+        self,
+        partition: int,
+        recipient: str,
+        entries: List[Tuple[str, Dict[str, str]]],
+        due_at: Optional[float] = None,
+        head: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Move stream entries behind a recipient's parked messages
+
+        Args:
+            partition: Recipient's partition
+            recipient: Recipient phone number
+            entries: (entry ID, fields) stream entries in send order
+            due_at: Epoch time of the next attempt; None keeps the current one
+            head: Replaces the first parked entry (its attempt count changed)
+        """
+        key = parked_key(partition, recipient)
+        pipe = self.redis.pipeline()
+        if head is not None:
+            pipe.lset(key, 0, json.dumps(head))
+        for entry_id, fields in entries:
+            pipe.rpush(key, json.dumps(fields))
+            pipe.xdel(stream_key(partition), entry_id)
+        if due_at is not None:
+            pipe.zadd(due_key(partition), {recipient: due_at})
+        pipe.execute()
+
+    def parked_head(self, partition: int, recipient: str) -> Optional[Dict[str, str]]:
+        """First parked entry of a recipient, if any"""
+        head = self.redis.lindex(parked_key(partition, recipient), 0)
+        return json.loads(head) if head else None
+
+    def unpark(self, partition: int, recipient: str) -> None:
+        """Drop a recipient with no parked entries left from the due set"""
+        self.redis.zrem(due_key(partition), recipient)
+
+    def parked_recipients(self, partition: int) -> Set[str]:
+        """Recipients of a partition with parked entries"""
+        return set(self.redis.zrange(due_key(partition), 0, -1))
+
+    def due_recipients(self, partition: int, now: float) -> List[str]:
+        """Parked recipients whose next attempt is due"""
+        return self.redis.zrangebyscore(due_key(partition), "-inf", now)
+
+    def drain_failed(self, limit: Optional[int] = None) -> int:
+        """Re-enqueue failed entries (oldest first) for another round of attempts
+
+        Returns:
+            Number of entries moved back
+        """
+        moved = 0
+        for entry_id, fields in self.redis.xrange(FAILED_STREAM, count=limit):
+            pipe = self.redis.pipeline()
+            pipe.xadd(stream_key(self.partition_for(fields["recipient"])), {
+                "recipient": fields["recipient"],
+                "mode": fields["mode"],
+                "payload": fields["payload"],
+                "enqueued_at": fields["enqueued_at"]
+            })
+            pipe.xdel(FAILED_STREAM, entry_id)
+            pipe.execute()
+            moved += 1
+        return moved
+
+    def stats(self) -> Dict[str, Any]:
+        """Pending entries, parked recipients and owner per partition plus failed count"""
+        pipe = self.redis.pipeline(transaction=False)
+        for partition in range(self.partitions):
+            pipe.xlen(stream_key(partition))
+            pipe.zcard(due_key(partition))
+            pipe.get(lease_key(partition))
+        pipe.xlen(FAILED_STREAM)
+        results = pipe.execute()
+        return {
+            "partitions": [
+                {
+                    "partition": p,
+                    "pending": results[3 * p],
+                    "parked_recipients": results[3 * p + 1],
+                    "owner": results[3 * p + 2]
+                }
+                for p in range(self.partitions)
+            ],
+            "failed": results[-1]
+        }
+
+    def acquire_lease(self, partition: int, owner: str) -> bool:
+        """Take ownership of a partition if nobody holds it"""
+        return bool(self.redis.set(lease_key(partition), owner, nx=True, px=LEASE_TTL_MS))
+
+    def renew_lease(self, partition: int, owner: str) -> bool:
+        """Extend ownership; False if the lease was lost"""
+        return bool(self._renew(keys=[lease_key(partition)], args=[owner, LEASE_TTL_MS]))
+
+    def release_lease(self, partition: int, owner: str) -> None:
+        """Give up ownership if still held"""
+        self._release(keys=[lease_key(partition)], args=[owner])
+
+
+class PartitionDrain:
+    """Lanes of one partition while its dispatcher holds the lease
+
+    A lane sends one recipient's entries in order; entries read for a
+    recipient with a running lane queue on it. A parked recipient gets a lane
+    once its next attempt is due, which sends its parked entries first.
+    """
+
+    def __init__(self, partition: int, parked: Set[str]):
+        self.partition = partition
+        self.parked = parked
+        self.lanes: Dict[str, Deque[Tuple[str, Dict[str, str]]]] = {}
+        self.lock = threading.Lock()
+        self.lane_done = threading.Event()
+        self.closing = threading.Event()
+
+
+class OutboxDispatcher:
+    """Sends outbox entries from background threads, one reader per partition"""
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        limiter: Optional[TokenBucket] = None,
+        max_attempts: int = MAX_ATTEMPTS,
+        concurrency: int = CONCURRENCY
+    ):
+        self.outbox = outbox
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self.concurrency = concurrency
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start one daemon thread per partition"""
+        for partition in range(self.outbox.partitions):
+            thread = threading.Thread(
+                target=self._run_partition,
+                args=(partition,),
+                name=f"outbox-{partition}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(
+            "Outbox dispatcher %s started with %d partitions, %d sends each",
+            self.owner, self.outbox.partitions, self.concurrency
+        )
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop threads and release leases"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run_partition(self, partition: int) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.outbox.acquire_lease(partition, self.owner):
+                    self._stop.wait(LEASE_TTL_MS / 3000)
+                    continue
+                try:
+                    self._drain_partition(partition)
+                finally:
+                    self.outbox.release_lease(partition, self.owner)
+            except Exception as e:
+                logger.error("Outbox partition %d error: %s", partition, e)
+                self._stop.wait(BACKOFF_BASE)
+
+    def _drain_partition(self, partition: int) -> None:
+        """Hand entries to lanes while this dispatcher holds the lease
+
+        Lanes are waited for before returning; entries they did not get to
+        stay in the stream (or parked) for the next lease owner.
+        """
+        renew_interval = LEASE_TTL_MS / 3000
+        renewed_at = time.monotonic()
+        drain = PartitionDrain(partition, self.outbox.parked_recipients(partition))
+        cursor = "0-0"
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"outbox-{partition}-lane")
+        try:
+            while not self._stop.is_set() and not drain.closing.is_set():
+                if time.monotonic() - renewed_at >= renew_interval:
+                    if not self.outbox.renew_lease(partition, self.owner):
+                        logger.warning("Lost outbox lease for partition %d", partition)
+                        return
+                    renewed_at = time.monotonic()
+
+                drain.lane_done.clear()
+                if drain.parked:
+                    for recipient in self.outbox.due_recipients(partition, time.time()):
+                        if len(drain.lanes) >= self.concurrency:
+                            break
+                        self._open_lane(drain, pool, recipient, None)
+
+                capacity = self.concurrency - len(drain.lanes)
+                if capacity <= 0:
+                    drain.lane_done.wait(renew_interval)
+                    continue
+
+                block_ms = PARKED_POLL_MS if drain.parked else READ_BLOCK_MS
+                for entry_id, fields in self.outbox.read(partition, after=cursor, count=capacity, block_ms=block_ms):
+                    cursor = entry_id
+                    self._open_lane(drain, pool, fields["recipient"], (entry_id, fields))
+        finally:
+            drain.closing.set()
+            pool.shutdown(wait=True)
+
+    def _open_lane(
+        self,
+        drain: PartitionDrain,
+        pool: ThreadPoolExecutor,
+        recipient: str,
+        entry: Optional[Tuple[str, Dict[str, str]]]
+    ) -> None:
+        """Queue a stream entry (or a due parked recipient, entry None) on its lane"""
+        with drain.lock:
+            lane = drain.lanes.get(recipient)
+            if lane is not None:
+                if entry is not None:
+                    lane.append(entry)
+                return
+            if entry is not None and recipient in drain.parked:
+                # Keep order behind the parked entries until they are due
+                self.outbox.park(drain.partition, recipient, [entry])
+                return
+            lane = drain.lanes[recipient] = deque([entry] if entry is not None else [])
+        pool.submit(self._run_lane, drain, recipient, lane, entry is None)
+
+    def _run_lane(self, drain: PartitionDrain, recipient: str, lane: Deque[Tuple[str, Dict[str, str]]], parked: bool) -> None:
+        """Send a recipient's parked entries, then its queued stream entries"""
+        try:
+            if parked and not self._send_parked(drain, recipient, lane):
+                return
+            while True:
+                with drain.lock:
+                    if not lane:
+                        return
+                    entry_id, fields = lane.popleft()
+                outcome = self._deliver(drain, entry_id, fields)
+                if outcome is None:
+                    return
+                if outcome == RETRY:
+                    with drain.lock:
+                        rest = list(lane)
+                        lane.clear()
+                        self.outbox.park(
+                            drain.partition, recipient, [(entry_id, fields)] + rest,
+                            due_at=time.time() + backoff_delay(int(fields["attempts"]))
+                        )
+                        drain.parked.add(recipient)
+                    return
+        except Exception as e:
+            # Start over from the stream head so no later entry overtakes this lane's
+            logger.error("Outbox lane for %s in partition %d error: %s", recipient, drain.partition, e)
+            drain.closing.set()
+        finally:
+            with drain.lock:
+                drain.lanes.pop(recipient, None)
+            drain.lane_done.set()
+
+    def _send_parked(self, drain: PartitionDrain, recipient: str, lane: Deque[Tuple[str, Dict[str, str]]]) -> bool:
+        """Send a recipient's parked entries in order
+
+        Returns:
+            True once none are left, False if one was parked again or sending stopped
+        """
+        while True:
+            fields = self.outbox.parked_head(drain.partition, recipient)
+            if fields is None:
+                with drain.lock:
+                    self.outbox.unpark(drain.partition, recipient)
+                    drain.parked.discard(recipient)
+                return True
+            outcome = self._deliver(drain, None, fields)
+            if outcome is None:
+                return False
+            if outcome == RETRY:
+                with drain.lock:
+                    rest = list(lane)
+                    lane.clear()
+                    self.outbox.park(
+                        drain.partition, recipient, rest,
+                        due_at=time.time() + backoff_delay(int(fields["attempts"])),
+                        head=fields
+                    )
+                return False
+
+    def _deliver(self, drain: PartitionDrain, entry_id: Optional[str], fields: Dict[str, str]) -> Optional[str]:
+        """Make one attempt at an entry (entry_id None for a parked head)
+
+        Sent and dead entries are settled here; an entry to retry gets its
+        attempt count in fields and is left for the lane to park.
+
+        Returns:
+            SENT, DEAD or RETRY, or None if stopped or the lease was lost
+        """
+        if self.limiter is not None and not self.limiter.acquire(self._stop):
+            return None
+        if drain.closing.is_set():
+            return None
+
+        mode = fields.get("mode", "production")
+        attempt = int(fields.get("attempts", 0)) + 1
+        try:
+            response = get_sender(mode).post(json.loads(fields["payload"]))
+            outcome, error = classify_response(response)
+        except requests.RequestException as e:
+            outcome, error = RETRY, str(e)
+
+        if outcome == SENT:
+            self.outbox.complete(drain.partition, entry_id, fields, message_id_of(response))
+            OUTBOX_DELIVERIES.labels(mode=mode, outcome=SENT).inc()
+            OUTBOX_QUEUE_DELAY.labels(mode=mode).observe(time.time() - float(fields["enqueued_at"]))
+            return SENT
+
+        if outcome == DEAD or attempt >= self.max_attempts:
+            logger.error("Outbox entry for %s failed after %d attempts: %s", fields["recipient"], attempt, error)
+            self.outbox.dead_letter(drain.partition, entry_id, fields, error, attempt)
+            OUTBOX_DELIVERIES.labels(mode=mode, outcome=DEAD).inc()
+            return DEAD
+
+        OUTBOX_DELIVERIES.labels(mode=mode, outcome=RETRY).inc()
+        logger.warning(
+            "Outbox entry for %s attempt %d failed, parking for %.1fs: %s",
+            fields["recipient"], attempt, backoff_delay(attempt), error
+        )
+        fields["attempts"] = str(attempt)
+        return RETRY
+
+
+_outbox: Optional[Outbox] = None
+_dispatcher: Optional[OutboxDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def dispatcher_redis_client():
+    """Dedicated Redis client for dispatcher threads
+
+    Blocking stream reads hold a connection each, so they must not come out
+    of the request pool; every lane thread needs one as well.
+    """
+    import redis
+    from django.conf import settings
+
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=PARTITIONS * (CONCURRENCY + 2) + 2
+    )
+
+
+def build_dispatcher(redis_client=None) -> OutboxDispatcher:
+    """Build a dispatcher with the configured throughput limit"""
+    redis_client = redis_client or dispatcher_redis_client()
+    number_id = config("WHATSAPP_PHONE_NUMBER_ID", default="default")
+    limiter = TokenBucket(redis_client, f"ratelimit:whatsapp:{number_id}", rate=THROUGHPUT)
+    return OutboxDispatcher(Outbox(redis_client), limiter=limiter)
+
+
+def ensure_dispatcher() -> None:
+    """Start this process's dispatcher on first use"""
+    global _dispatcher
+    if _dispatcher is not None or not OUTBOX_DISPATCH_IN_PROCESS:
+        return
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = build_dispatcher()
+            _dispatcher.start()
+
+
+def get_outbox() -> Outbox:
+    """Outbox for enqueueing from request handling (shares the state client)"""
+    global _outbox
+    if _outbox is None:
+        _outbox = Outbox(get_redis_client())
+    return _outbox
+
+
+def record_sent(message_ids: List[Optional[str]]) -> None:
+    """Keep the send time of inline sends for delivery latency
+
+    Never raises: a send that succeeded is not failed for its bookkeeping.
+    """
+    message_ids = [message_id for message_id in message_ids if message_id]
+    if not message_ids or not uses_redis():
+        return
+    try:
+        get_outbox().record_sent(message_ids)
+    except Exception as e:
+        logger.warning("Could not record send time of %s: %s", message_ids, e)
+
+
+def _reset_after_fork() -> None:
+    """Dispatcher threads don't survive fork; workers start their own"""
+    global _outbox, _dispatcher, _dispatcher_lock
+    _outbox = None
+    _dispatcher = None
+    _dispatcher_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
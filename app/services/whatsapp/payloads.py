@@ -0,0 +1,169 @@
+"""Precompiled WhatsApp payloads for registered message skeletons
+
+Each (template ID, shape) from core.messaging.skeletons is converted and
+validated once through WhatsAppMessage.from_core_message, and its slots are
+compiled to format strings. Sending then only copies the containers on the
+paths to slots, fills in the recipient and slot values, and truncates filled
+strings to their field's Cloud API limit.
+
+Rendered payloads share unfilled parts with the cached skeleton and must be
+treated as read-only.
+"""
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from core.messaging.exceptions import MessageValidationError
+from core.messaging.skeletons import SLOT_MARK, build_skeleton
+from core.messaging.types import Message, MessageContent, MessageRecipient
+
+from .builder import LIMITS
+from .types import WhatsAppMessage
+
+Path = Tuple[Any, ...]
+
+_skeletons: Dict[Tuple[str, Tuple[Hashable, ...]], "PayloadSkeleton"] = {}
+_skeletons_lock = threading.Lock()
+
+
+def _limit_for(path: Path) -> int:
+    """Cloud API length limit of the string field at path"""
+    limits = LIMITS
+    field = path[-1]
+    if field == "description":
+        return limits["list_description"]
+    if field == "title":
+        return limits["button_text"] if "reply" in path else limits["list_title"]
+    if field == "button":
+        return limits["button_text"]
+    if "header" in path:
+        return limits["header"]
+    if "footer" in path:
+        return limits["footer"]
+    return limits["text_body"]
+
+
+def _find_slots(node: Any, path: Path = ()) -> List[Tuple[Path, str]]:
+    """Paths of strings containing slot markers"""
+    if isinstance(node, dict):
+        items = node.items()
+    elif isinstance(node, list):
+        items = enumerate(node)
+    elif isinstance(node, str) and SLOT_MARK in node:
+        return [(path, node)]
+    else:
+        return []
+
+    found = []
+    for key, child in items:
+        found.extend(_find_slots(child, path + (key,)))
+    return found
+
+
+def _compile_text(text: str) -> Tuple[str, List[str]]:
+    """Format string and slot names of a string with slot markers
+
+    Splitting on the marker leaves literal text at even and slot names at odd
+    positions; literal braces are escaped for str.format_map.
+    """
+    parts = text.split(SLOT_MARK)
+    names = parts[1::2]
+    template = "".join(
+        part.replace("{", "{{").replace("}", "}}") if index % 2 == 0 else f"{{{part}}}"
+        for index, part in enumerate(parts)
+    )
+    return template, names
+
+
+def _slot_tree(slots: List[Tuple[Path, str]]) -> Dict[Any, Any]:
+    """Nest slot paths so shared containers are copied once per render
+
+    Leaves are (format string, length limit) tuples.
+    """
+    tree: Dict[Any, Any] = {}
+    for path, text in slots:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = (_compile_text(text)[0], _limit_for(path))
+    return tree
+
+
+def _fill(node: Any, tree: Dict[Any, Any], values: Dict[str, Any]) -> Any:
+    """Copy node along tree, formatting leaves with values"""
+    filled = list(node) if isinstance(node, list) else dict(node)
+    for key, branch in tree.items():
+        if isinstance(branch, tuple):
+            template, limit = branch
+            filled[key] = template.format_map(values)[:limit]
+        else:
+            filled[key] = _fill(node[key], branch, values)
+    return filled
+
+
+class PayloadSkeleton:
+    """Validated payload of one skeleton shape, filled per send"""
+
+    __slots__ = ("template_id", "shape", "content", "payload", "slot_names", "_tree")
+
+    def __init__(self, template_id: str, shape: Tuple[Hashable, ...], content: MessageContent):
+        """Convert and validate content once
+
+        Raises:
+            MessageValidationError: If the content cannot be converted
+        """
+        self.template_id = template_id
+        self.shape = shape
+        self.content = content
+
+        payload = WhatsAppMessage.from_core_message(Message(
+            recipient=MessageRecipient(type="whatsapp", identifier="0"),
+            content=content
+        ))
+        # from_core_message reports conversion errors as a text message
+        if payload.get("type") != content.type.value:
+            raise MessageValidationError(
+                message=f"Skeleton {template_id} could not be converted",
+                service="whatsapp",
+                action="compile_skeleton",
+                validation_details={"template_id": template_id, "shape": repr(shape)}
+            )
+        self.payload = payload
+        slots = _find_slots(payload)
+        self._tree = _slot_tree(slots)
+        self.slot_names = frozenset(
+            name for _, text in slots for name in _compile_text(text)[1]
+        )
+
+    def render(self, to: str, values: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Payload for recipient to with slots filled from values
+
+        Raises:
+            MessageValidationError: If a slot has no value
+        """
+        values = values or {}
+        missing = self.slot_names.difference(values)
+        if missing:
+            raise MessageValidationError(
+                message=f"Missing values for skeleton {self.template_id}: {', '.join(sorted(missing))}",
+                service="whatsapp",
+                action="render_skeleton",
+                validation_details={"template_id": self.template_id, "missing": sorted(missing)}
+            )
+
+        payload = _fill(self.payload, self._tree, values)
+        payload["to"] = to
+        return payload
+
+
+def get_skeleton(template_id: str, shape: Tuple[Hashable, ...] = ()) -> PayloadSkeleton:
+    """Compiled skeleton for template_id and shape, compiling it on first use"""
+    key = (template_id, shape)
+    skeleton = _skeletons.get(key)
+    if skeleton is None:
+        with _skeletons_lock:
+            skeleton = _skeletons.get(key)
+            if skeleton is None:
+                skeleton = _skeletons[key] = PayloadSkeleton(
+                    template_id, shape, build_skeleton(template_id, shape)
+                )
+    return skeleton
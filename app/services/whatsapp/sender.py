@@ -0,0 +1,130 @@
+"""Pooled WhatsApp Graph API sender
+
+This module keeps one long-lived sender per worker process and mode:
+- Settings resolved once, URL and headers prebuilt
+- requests.Session with keep-alive connections to the Graph API (or mock)
+- Latency, status code and call budget accounting for every send
+
+Production and mock sends share the same machinery so mock-mode load tests
+exercise the same connection handling as production.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict
+
+import requests
+from core.monitoring.call_budget import record_http_call
+from core.monitoring.metrics import (WHATSAPP_SEND_LATENCY,
+                                     WHATSAPP_SEND_RESPONSES)
+from core.monitoring.traffic import get_recorder
+from decouple import config
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+PRODUCTION = "production"
+MOCK = "mock"
+
+SEND_TIMEOUT = 10  # seconds
+
+# Connections kept open per sender; sync workers need one, threaded ones more
+POOL_SIZE = config("WHATSAPP_POOL_SIZE", default=10, cast=int)
+
+_senders: Dict[str, "GraphApiSender"] = {}
+_senders_lock = threading.Lock()
+
+
+class GraphApiSender:
+    """Sends WhatsApp payloads over pooled keep-alive connections"""
+
+    def __init__(self, mode: str, url: str, headers: Dict[str, str], timeout: float = SEND_TIMEOUT):
+        """Initialize sender
+
+        Args:
+            mode: Metrics label (production, mock)
+            url: Full messages endpoint URL
+            headers: Headers sent with every request
+            timeout: Request timeout in seconds
+        """
+        self.mode = mode
+        self.url = url
+        self.timeout = timeout
+        self.budget_service = "whatsapp" if mode == PRODUCTION else f"whatsapp_{mode}"
+
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def post(self, payload: Dict[str, Any]) -> requests.Response:
+        """Send payload and record latency and status
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        record_http_call(self.budget_service)
+        started = time.perf_counter()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+        except requests.RequestException:
+            self._observe(started, "error")
+            raise
+        self._observe(started, response.status_code)
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.send(payload)
+        return response
+
+    def _observe(self, started: float, status_code: Any) -> None:
+        WHATSAPP_SEND_LATENCY.labels(mode=self.mode).observe(time.perf_counter() - started)
+        WHATSAPP_SEND_RESPONSES.labels(mode=self.mode, status_code=status_code).inc()
+
+    def close(self) -> None:
+        """Close pooled connections"""
+        self.session.close()
+
+
+def _build_sender(mode: str) -> GraphApiSender:
+    """Resolve settings for mode and build its sender"""
+    if mode == MOCK:
+        return GraphApiSender(
+            mode=MOCK,
+            url=config("MOCK_WHATSAPP_URL", default="http://mock:8001/bot/webhook"),
+            headers={"Content-Type": "application/json"}
+        )
+
+    api_url = config("WHATSAPP_API_URL", default="https://graph.facebook.com/v20.0/")
+    if not api_url.endswith("/"):
+        api_url += "/"
+    return GraphApiSender(
+        mode=PRODUCTION,
+        url=f"{api_url}{config('WHATSAPP_PHONE_NUMBER_ID')}/messages",
+        headers={
+            "Authorization": f"Bearer {config('WHATSAPP_ACCESS_TOKEN')}",
+            "Content-Type": "application/json",
+        }
+    )
+
+
+def get_sender(mode: str = PRODUCTION) -> GraphApiSender:
+    """Get this process's sender for mode, creating it on first use"""
+    sender = _senders.get(mode)
+    if sender is None:
+        with _senders_lock:
+            sender = _senders.get(mode)
+            if sender is None:
+                sender = _senders[mode] = _build_sender(mode)
+    return sender
+
+
+def _reset_after_fork() -> None:
+    """Forked workers must not share the parent's pooled sockets"""
+    global _senders_lock
+    _senders.clear()
+    _senders_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
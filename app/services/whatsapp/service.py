@@ -1,17 +1,18 @@
 """WhatsApp messaging service implementation"""
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
-import requests
 from core.messaging.base import BaseMessagingService
 from core.messaging.exceptions import MessageValidationError
 from core.messaging.types import (Button, InteractiveContent, InteractiveType,
-                                  Message, MessageType, Section, TemplateContent,
+                                  Message, MessageRecipient, TemplateContent,
                                   TextContent)
 from core.state.interface import StateManagerInterface
-from decouple import config
 
+from . import outbox
+from .payloads import get_skeleton
+from .sender import MOCK, PRODUCTION, get_sender
 from .types import WhatsAppMessage
 
 logger = logging.getLogger(__name__)
@@ -38,10 +39,10 @@ class WhatsAppMessagingService(BaseMessagingService):
         proceed_option: bool = False,
         x_is_menu: bool = False,
         navigate_is: str = "Respond",
-        extra_rows: List = [],
+        extra_rows: Optional[List] = None,
         use_buttons: bool = False,
         yes_or_no: bool = False,
-        custom: Dict = dict(),
+        custom: Optional[Dict] = None,
         plain: bool = False,
         include_menu: bool = True,
     ) -> Dict:
@@ -186,29 +187,73 @@ class WhatsAppMessagingService(BaseMessagingService):
                 state_manager=self.state_manager
             )
 
-            # Log basic info - full payload not needed since we're async
-            logger.info("Sending %s message to %s",
-                        message.content.type,
-                        message.recipient.identifier)
+            return self._deliver(message, whatsapp_message)
 
-            # Determine mock mode from state or message metadata
-            handler = (
-                self._handle_mock_send if self._is_mock_mode(message)
-                else self._handle_production_send
-            )
-            return handler(message, whatsapp_message)
+        except Exception as e:
+            raise self._send_error(message, e)
 
+    def send_skeleton(
+        self,
+        recipient: MessageRecipient,
+        template_id: str,
+        values: Optional[Dict[str, Any]] = None,
+        shape: Tuple[Hashable, ...] = ()
+    ) -> Message:
+        """Send a precompiled skeleton, filling in only recipient and slots"""
+        skeleton = get_skeleton(template_id, shape)
+        message = Message(recipient=recipient, content=skeleton.content)
+        try:
+            return self._deliver(message, skeleton.render(recipient.identifier, values))
         except Exception as e:
-            logger.error(f"Error sending message: {str(e)}")
-            raise MessageValidationError(
-                message=f"Failed to send message: {str(e)}",
-                service="whatsapp",
-                action="send_message",
-                validation_details={
-                    "error": str(e),
-                    "message_type": message.content.type if message and message.content else None
-                }
-            )
+            raise self._send_error(message, e)
+
+    def _deliver(self, message: Message, whatsapp_message: Dict) -> Message:
+        """Send or queue a converted payload"""
+        # Log basic info - full payload not needed since we're async
+        logger.info("Sending %s message to %s",
+                    message.content.type,
+                    message.recipient.identifier)
+
+        # Queue for background delivery when the outbox is enabled
+        if outbox.OUTBOX_ENABLED:
+            return self._handle_outbox_send(message, whatsapp_message)
+
+        # Determine mock mode from state or message metadata
+        handler = (
+            self._handle_mock_send if self._is_mock_mode(message)
+            else self._handle_production_send
+        )
+        return handler(message, whatsapp_message)
+
+    @staticmethod
+    def _send_error(message: Message, error: Exception) -> MessageValidationError:
+        logger.error("Error sending message: %s", error)
+        return MessageValidationError(
+            message=f"Failed to send message: {str(error)}",
+            service="whatsapp",
+            action="send_message",
+            validation_details={
+                "error": str(error),
+                "message_type": message.content.type if message and message.content else None
+            }
+        )
+
+    def _handle_outbox_send(self, message: Message, whatsapp_message: Dict) -> Message:
+        """Append message to the outbox; dispatcher threads send it"""
+        mode = MOCK if self._is_mock_mode(message) else PRODUCTION
+        entry_id = outbox.get_outbox().enqueue(
+            recipient=message.recipient.identifier,
+            payload=whatsapp_message,
+            mode=mode
+        )
+        outbox.ensure_dispatcher()
+
+        message.metadata = {
+            "queued_at": datetime.utcnow().isoformat(),
+            "outbox_id": entry_id,
+            "mock": mode == MOCK
+        }
+        return message
 
     def _handle_mock_send(self, message: Message, whatsapp_message: Dict) -> Message:
         """Handle mock message sending path"""
@@ -216,12 +261,7 @@ class WhatsAppMessagingService(BaseMessagingService):
 
         try:
             # Send and wait for response
-            response = requests.post(
-                "http://mock:8001/bot/webhook",
-                json=whatsapp_message,
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            response = get_sender(MOCK).post(whatsapp_message)
 
             # Track when sent and response
             message.metadata = {
@@ -276,23 +316,10 @@ class WhatsAppMessagingService(BaseMessagingService):
         """Handle production message sending path"""
         logger.info("Production mode: sending to WhatsApp")
 
-        # Get API configuration
-        phone_number_id = config("WHATSAPP_PHONE_NUMBER_ID")
-        api_url = config("WHATSAPP_API_URL", default="https://graph.facebook.com/v20.0/")
-        url = f"{api_url}{phone_number_id}/messages"
-        headers = {
-            "Authorization": f"Bearer {config('WHATSAPP_ACCESS_TOKEN')}",
-            "Content-Type": "application/json",
-        }
-
         try:
-            # Send and wait for response
-            response = requests.post(
-                url,
-                json=whatsapp_message,
-                headers=headers,
-                timeout=10
-            )
+            # Send and wait for response over the worker's pooled connection
+            response = get_sender(PRODUCTION).post(whatsapp_message)
+            outbox.record_sent([outbox.message_id_of(response)])
 
             # Track when sent and response
             message.metadata = {
@@ -351,110 +378,21 @@ class WhatsAppMessagingService(BaseMessagingService):
         footer: Optional[str] = None,
         button_text: Optional[str] = None
     ) -> Message:
-        """Send an interactive message following WhatsApp Cloud API format"""
-        # Import WhatsApp limits
-        from .types import WhatsAppMessage
-        LIMITS = WhatsAppMessage.LIMITS
-
-        # Validate and truncate body text
-        if len(body) > LIMITS["text_body"]:
-            body = body[:LIMITS["text_body"]]
-
-        # Validate and truncate header/footer
-        if header and len(header) > LIMITS["header"]:
-            header = header[:LIMITS["header"]]
-        if footer and len(footer) > LIMITS["footer"]:
-            footer = footer[:LIMITS["footer"]]
-
-        # Validate button text for list messages
-        if button_text and len(button_text) > LIMITS["button_text"]:
-            button_text = button_text[:LIMITS["button_text"]]
-
-        # Validate buttons and sections are mutually exclusive
-        if buttons and sections:
-            raise MessageValidationError(
-                message="Cannot specify both buttons and sections",
-                service="whatsapp",
-                action="send_interactive",
-                validation_details={
-                    "error": "invalid_params",
-                    "detail": "buttons and sections are mutually exclusive"
-                }
-            )
-
-        interactive_type = InteractiveType.BUTTON if buttons else InteractiveType.LIST
-
-        if buttons:
-            # Validate and process buttons
-            validated_buttons = []
-            for button in buttons[:LIMITS["buttons_count"]]:  # Limit number of buttons
-                title = button.title[:LIMITS["button_text"]] if len(button.title) > LIMITS["button_text"] else button.title
-                validated_buttons.append(Button(id=button.id, title=title))
-
-            message = Message(
-                content=InteractiveContent(
-                    interactive_type=interactive_type,
-                    body=body,
-                    buttons=validated_buttons,
-                    sections=[],  # Empty sections for button messages
-                    header=header,
-                    footer=footer
-                )
-            )
-
-        elif sections:
-            # Validate and process sections
-            validated_sections = []
-            for section in sections[:LIMITS["sections_count"]]:  # Limit number of sections
-                # Validate section title
-                title = section["title"][:LIMITS["list_title"]] if len(section["title"]) > LIMITS["list_title"] else section["title"]
-
-                # Validate and process rows
-                validated_rows = []
-                for row in section["rows"][:LIMITS["rows_per_section"]]:  # Limit rows per section
-                    # Validate row title and description
-                    row_title = row["title"][:LIMITS["list_title"]]
-                    row_desc = row.get("description", "")
-                    if row_desc:
-                        row_desc = row_desc[:LIMITS["list_description"]]
-
-                    validated_row = {
-                        "id": row["id"],
-                        "title": row_title
-                    }
-                    if row_desc:
-                        validated_row["description"] = row_desc
+        """Send an interactive message following WhatsApp Cloud API format
 
-                    validated_rows.append(validated_row)
-
-                validated_sections.append(Section(
-                    title=title,
-                    rows=validated_rows
-                ))
-
-            message = Message(
-                content=InteractiveContent(
-                    interactive_type=interactive_type,
-                    body=body,
-                    buttons=[],  # Empty buttons for list messages
-                    sections=validated_sections,
-                    button_text=button_text or "Select",
-                    header=header,
-                    footer=footer
-                )
-            )
-
-        else:
-            raise MessageValidationError(
-                message="Either buttons or sections must be provided",
-                service="whatsapp",
-                action="send_interactive",
-                validation_details={
-                    "error": "missing_content",
-                    "detail": "interactive message requires buttons or sections"
-                }
+        Limits are applied once, when the message is built (see builder.py).
+        """
+        message = Message(
+            content=InteractiveContent(
+                interactive_type=InteractiveType.BUTTON if buttons else InteractiveType.LIST,
+                body=body,
+                buttons=buttons or [],
+                sections=sections or [],
+                header=header,
+                footer=footer,
+                button_text=button_text
             )
-
+        )
         return self.send_message(message)
 
     def send_template(
@@ -486,144 +424,3 @@ class WhatsAppMessagingService(BaseMessagingService):
                     "language": language
                 }
             )
-
-    def extract_message_data(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract message data from WhatsApp payload"""
-        if not payload:
-            raise MessageValidationError(
-                message="Message payload is required",
-                service="whatsapp",
-                action="extract_message",
-                validation_details={"error": "missing_payload"}
-            )
-
-        try:
-            # Extract and validate each level
-            entry = payload.get("entry", [])
-            if not entry:
-                raise ValueError("Missing entry array")
-
-            changes = entry[0].get("changes", [])
-            if not changes:
-                raise ValueError("Missing changes array")
-
-            value = changes[0].get("value", {})
-            if not value:
-                raise ValueError("Missing value object")
-
-            # Check if this is a status update
-            if "statuses" in value:
-                return {}
-
-            # Check for messages
-            messages = value.get("messages", [])
-            if not messages:
-                return {}
-
-            message = messages[0]
-            if not message:
-                return {}
-
-            # Only process user-initiated messages
-            if not message.get("from"):
-                return {}
-
-            # Validate this is a WhatsApp message
-            if not value.get("messaging_product") == "whatsapp":
-                raise ValueError("Expected messaging_product 'whatsapp'")
-
-            # Get contact info
-            contacts = value.get("contacts", [])
-            if not contacts:
-                raise ValueError("Missing contacts array")
-
-            contact = contacts[0]
-            if not contact or not isinstance(contact, dict):
-                raise ValueError("Invalid contact object")
-
-            channel_id = contact.get("wa_id")
-            if not channel_id:
-                raise ValueError("Missing WhatsApp ID")
-
-            # Extract message content
-            message_type = message.get("type")
-            if message_type == "text":
-                # Handle text messages
-                text_content = message.get("text", {})
-                return {
-                    "channel": {
-                        "type": "whatsapp",
-                        "identifier": channel_id,
-                        "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                    },
-                    "message": {
-                        "type": MessageType.TEXT.value,
-                        "text": {
-                            "body": text_content.get("body", "")
-                        }
-                    }
-                }
-            elif message_type == "interactive":
-                # Handle interactive messages
-                interactive = message.get("interactive", {})
-                if interactive.get("type") == "button_reply":
-                    button = interactive.get("button_reply", {})
-                    return {
-                        "channel": {
-                            "type": "whatsapp",
-                            "identifier": channel_id,
-                            "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                        },
-                        "message": {
-                            "type": MessageType.INTERACTIVE.value,
-                            "text": {
-                                "interactive_type": InteractiveType.BUTTON.value,
-                                "button": {
-                                    "id": button.get("id"),
-                                    "title": button.get("title"),
-                                    "type": "reply"
-                                }
-                            }
-                        }
-                    }
-                elif interactive.get("type") == "list_reply":
-                    list_reply = interactive.get("list_reply", {})
-                    return {
-                        "channel": {
-                            "type": "whatsapp",
-                            "identifier": channel_id,
-                            "mock_testing": bool(value.get("metadata", {}).get("mock_testing", False))
-                        },
-                        "message": {
-                            "type": MessageType.INTERACTIVE.value,
-                            "text": {
-                                "interactive_type": InteractiveType.LIST.value,
-                                "list_reply": {
-                                    "id": list_reply.get("id"),
-                                    "title": list_reply.get("title"),
-                                    "description": list_reply.get("description")
-                                }
-                            }
-                        }
-                    }
-
-            # Unsupported message type
-            return {}
-
-        except (IndexError, KeyError, ValueError) as e:
-            # Get as much info as possible for error context
-            value = payload.get("entry", [{}])[0].get("changes", [{}])[0].get("value", {})
-            messages = value.get("messages", [])
-            message = messages[0] if messages else {}
-
-            raise MessageValidationError(
-                message=f"Invalid message payload format: {str(e)}",
-                service="whatsapp",
-                action="extract_message",
-                validation_details={
-                    "error": str(e),
-                    "payload": payload,
-                    "value": value,
-                    "message": message
-                }
-            )
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional
 
 from core.error.exceptions import SystemException
 from core.messaging.interface import MessagingServiceInterface
+from core.state.dashboard_index import DashboardIndex
 from core.state.interface import StateManagerInterface
 from core.state.manager import StateManager as CoreStateManager
 
@@ -71,6 +72,18 @@ class StateManager(StateManagerInterface):  # type: ignore
                 action="get_state"
             )
 
+    def get_dashboard_index(self) -> DashboardIndex:
+        """Get lookup index of the dashboard in state"""
+        try:
+            return self._core.get_dashboard_index()
+        except Exception as e:
+            raise SystemException(
+                message=f"Failed to index dashboard: {str(e)}",
+                code="STATE_ERROR",
+                service="whatsapp_state",
+                action="get_dashboard_index"
+            )
+
     def update_state(self, updates: Dict[str, Any]) -> None:
         """Update state using core state manager"""
         try:
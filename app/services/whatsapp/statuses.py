@@ -0,0 +1,253 @@
+"""WhatsApp delivery status ingestion
+
+Status callbacks (sent, delivered, read, failed) arrive on the same webhook
+as user messages but need none of the flow machinery. This module handles
+them before any request parsing or state work:
+- Status-only bodies are recognised on the raw bytes and parsed once
+- Counts per status and failure code go into one Redis hash per minute
+- Latency from our send to each status is kept as a sum, count and
+  cumulative buckets per minute, for delivery SLOs
+- Failed messages sent through the outbox are looked up by message ID and
+  queued again when the failure is retryable, otherwise moved to the
+  outbox's failed stream
+
+Messages sent inline keep only their send time (Outbox.record_sent), so they
+get latency but are not sent again when delivery fails.
+
+All counters for one callback are written in a single pipeline, after one
+lookup of the kept outbox entries.
+"""
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core.monitoring.metrics import WHATSAPP_STATUSES
+from core.state.persistence.client import uses_redis
+from decouple import config
+
+from . import outbox
+from .outbox import RETRYABLE_ERROR_CODES, Outbox, sent_key
+
+logger = logging.getLogger(__name__)
+
+STATUSES = ("sent", "delivered", "read", "failed")
+FAILED = "failed"
+
+BUCKET_PREFIX = "statuses:whatsapp"
+BUCKET_SECONDS = 60
+BUCKET_TTL = config("WHATSAPP_STATUS_BUCKET_TTL", default=7 * 86400, cast=int)
+
+# Upper bounds (seconds) of the cumulative latency buckets
+LATENCY_BUCKETS = (1, 5, 30, 300)
+
+# Failed deliveries of one message are sent again at most this many times
+MAX_REDELIVERIES = config("WHATSAPP_STATUS_MAX_REDELIVERIES", default=3, cast=int)
+
+# Cheap checks on the raw body before deciding to parse it here; "messages"
+# also appears as the change's field name, so only a key counts
+_STATUSES_MARKER = b'"statuses"'
+_MESSAGES_KEY = re.compile(rb'"messages"\s*:')
+
+
+def bucket_key(timestamp: float) -> str:
+    """Hash holding the counters of the minute containing timestamp"""
+    return f"{BUCKET_PREFIX}:{int(timestamp) // BUCKET_SECONDS * BUCKET_SECONDS}"
+
+
+def extract_statuses(body: bytes, phone_number_id: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+    """Statuses of a status-only webhook body
+
+    Args:
+        body: Raw request body
+        phone_number_id: Only accept changes for this business number (None accepts any)
+
+    Returns:
+        List of status objects, or None if the body is not a status-only
+        callback and must go through regular webhook handling
+    """
+    if _STATUSES_MARKER not in body or _MESSAGES_KEY.search(body):
+        return None
+    try:
+        data = json.loads(body)
+        statuses = []
+        for entry in data.get("entry") or []:
+            for change in entry.get("changes") or []:
+                value = change.get("value") or {}
+                if value.get("messages"):
+                    return None
+                if phone_number_id is not None and (value.get("metadata") or {}).get("phone_number_id") != phone_number_id:
+                    continue
+                statuses.extend(
+                    status for status in value.get("statuses") or []
+                    if isinstance(status, dict)
+                )
+    except (ValueError, AttributeError, TypeError):
+        return None
+    return statuses
+
+
+def _error_code(status: Dict[str, Any]) -> Optional[int]:
+    errors = status.get("errors") or []
+    if errors and isinstance(errors[0], dict):
+        return errors[0].get("code")
+    return None
+
+
+class StatusIngestor:
+    """Aggregates status callbacks into per-minute Redis counters"""
+
+    def __init__(self, redis_client, outbox_: Optional[Outbox] = None):
+        """Initialize with a decode_responses Redis client"""
+        self.redis = redis_client
+        self.outbox = outbox_ or Outbox(redis_client)
+
+    def ingest(self, statuses: List[Dict[str, Any]]) -> int:
+        """Count statuses, record latencies and resend retryable failures
+
+        Returns:
+            Number of statuses counted
+        """
+        statuses = [s for s in statuses if s.get("status") in STATUSES and s.get("id")]
+        if not statuses:
+            return 0
+
+        sent = self._lookup_sent(statuses)
+        now = time.time()
+        pipe = self.redis.pipeline(transaction=False)
+        touched = set()
+
+        for status, kept in zip(statuses, sent):
+            name = status["status"]
+            try:
+                timestamp = float(status.get("timestamp") or now)
+            except (TypeError, ValueError):
+                timestamp = now
+            key = bucket_key(timestamp)
+            touched.add(key)
+            pipe.hincrby(key, name, 1)
+            WHATSAPP_STATUSES.labels(status=name).inc()
+
+            sent_at = kept.get("sent_at") if isinstance(kept, dict) else kept
+            if sent_at:
+                latency = max(0.0, timestamp - float(sent_at))
+                pipe.hincrby(key, f"latency_ms:{name}", int(latency * 1000))
+                pipe.hincrby(key, f"latency_count:{name}", 1)
+                for bound in LATENCY_BUCKETS:
+                    if latency <= bound:
+                        pipe.hincrby(key, f"latency_le_{bound}:{name}", 1)
+
+            if name == FAILED:
+                code = _error_code(status)
+                pipe.hincrby(key, f"failed:{code or 'unknown'}", 1)
+                if kept and "payload" in kept:
+                    self._redeliver(status, kept, code)
+
+        for key in touched:
+            pipe.expire(key, BUCKET_TTL)
+        pipe.execute()
+        return len(statuses)
+
+    def _lookup_sent(self, statuses: List[Dict[str, Any]]) -> List[Any]:
+        """Send time of each status's outbox entry; the whole entry for failures
+
+        Failed entries are removed as they are read, so a repeated callback
+        cannot send the message twice.
+        """
+        pipe = self.redis.pipeline()
+        for status in statuses:
+            key = sent_key(status["id"])
+            if status["status"] == FAILED:
+                pipe.hgetall(key)
+                pipe.delete(key)
+            else:
+                pipe.hget(key, "sent_at")
+        results = iter(pipe.execute())
+
+        sent = []
+        for status in statuses:
+            value = next(results)
+            if status["status"] == FAILED:
+                next(results)
+            sent.append(value)
+        return sent
+
+    def _redeliver(self, status: Dict[str, Any], fields: Dict[str, str], code: Optional[int]) -> None:
+        """Queue a failed message again, or record it as failed for good"""
+        redeliveries = int(fields.get("redeliveries", 0))
+        error = f"status {code}: {(status.get('errors') or [{}])[0].get('title', '')}"
+        entry = {k: fields[k] for k in ("recipient", "mode", "payload", "enqueued_at") if k in fields}
+
+        if code in RETRYABLE_ERROR_CODES and redeliveries < MAX_REDELIVERIES:
+            self.outbox.enqueue(
+                recipient=entry["recipient"],
+                payload=json.loads(entry["payload"]),
+                mode=entry.get("mode", "production"),
+                redeliveries=redeliveries + 1
+            )
+            outbox.ensure_dispatcher()
+            logger.warning("Message %s failed with %s, queued again", status["id"], code)
+            return
+
+        self.outbox.add_failed(entry, error, redeliveries + 1)
+        logger.error("Message %s failed with %s, moved to failed stream", status["id"], code)
+
+
+def delivery_stats(redis_client, minutes: int = 60, now: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Per-minute status counts and latencies, oldest first
+
+    Args:
+        redis_client: decode_responses Redis client
+        minutes: Number of most recent minutes to return
+        now: End of the window (defaults to the current time)
+    """
+    now = time.time() if now is None else now
+    starts = [
+        int(now) // BUCKET_SECONDS * BUCKET_SECONDS - offset * BUCKET_SECONDS
+        for offset in range(minutes - 1, -1, -1)
+    ]
+    pipe = redis_client.pipeline(transaction=False)
+    for start in starts:
+        pipe.hgetall(bucket_key(start))
+
+    stats = []
+    for start, fields in zip(starts, pipe.execute()):
+        if not fields:
+            continue
+        minute = {"minute": start, "failed_codes": {}, "latency": {}}
+        for name in STATUSES:
+            minute[name] = int(fields.get(name, 0))
+            count = int(fields.get(f"latency_count:{name}", 0))
+            if count:
+                minute["latency"][name] = {
+                    "count": count,
+                    "mean_seconds": int(fields[f"latency_ms:{name}"]) / 1000 / count,
+                    **{f"le_{bound}": int(fields.get(f"latency_le_{bound}:{name}", 0)) for bound in LATENCY_BUCKETS}
+                }
+        for field, value in fields.items():
+            if field.startswith("failed:"):
+                minute["failed_codes"][field.split(":", 1)[1]] = int(value)
+        stats.append(minute)
+    return stats
+
+
+_ingestor: Optional[StatusIngestor] = None
+_ingestor_lock = threading.Lock()
+
+
+def get_ingestor() -> Optional[StatusIngestor]:
+    """Ingestor for webhook handling (shares the state client and outbox)
+
+    None when STATE_BACKEND is not redis; status callbacks are then only
+    acknowledged.
+    """
+    global _ingestor
+    if not uses_redis():
+        return None
+    if _ingestor is None:
+        with _ingestor_lock:
+            if _ingestor is None:
+                _ingestor = StatusIngestor(outbox.get_outbox().redis, outbox.get_outbox())
+    return _ingestor
@@ -11,19 +11,7 @@ from core.messaging.types import (
     Section
 )
 
-
-# WhatsApp Cloud API limits
-LIMITS = {
-    "text_body": 4096,      # Maximum text message length
-    "header": 60,           # Maximum header text length
-    "footer": 60,           # Maximum footer text length
-    "button_text": 20,      # Maximum button text length
-    "list_title": 24,       # Maximum list item title length
-    "list_description": 72,  # Maximum list item description length
-    "buttons_count": 3,     # Maximum number of buttons
-    "sections_count": 10,   # Maximum number of sections
-    "rows_per_section": 10  # Maximum rows per section
-}
+from .builder import LIMITS
 
 
 class ProgressiveInput:
@@ -3,9 +3,13 @@ import logging
 from typing import Any, Dict, Optional
 
 from core.messaging.exceptions import MessageValidationError
+from core.messaging.types import InteractiveContent
 from core.messaging.types import Message as CoreMessage
 from core.state.interface import StateManagerInterface
 
+from .builder import (LIMITS, WHATSAPP_BASE, build_from_content,
+                      build_from_wire)
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,186 +17,10 @@ class WhatsAppMessage(Dict[str, Any]):
     """WhatsApp message format"""
 
     # WhatsApp API requires these exact string values
-    WHATSAPP_BASE = {
-        "messaging_product": "whatsapp",  # API string
-        "recipient_type": "individual"
-    }
-
-    # WhatsApp Cloud API limits
-    LIMITS = {
-        "text_body": 4096,      # Maximum text message length
-        "header": 60,           # Maximum header text length
-        "footer": 60,           # Maximum footer text length
-        "button_text": 20,      # Maximum button text length
-        "list_title": 24,       # Maximum list item title length
-        "list_description": 72,  # Maximum list item description length
-        "buttons_count": 3,     # Maximum number of buttons
-        "sections_count": 10,   # Maximum number of sections
-        "rows_per_section": 10  # Maximum rows per section
-    }
-
-    @classmethod
-    def validate_interactive(cls, interactive: Dict[str, Any]) -> None:
-        """Validate interactive message structure and limits"""
-        if not interactive.get("type"):
-            raise MessageValidationError(
-                message="Interactive message type is required",
-                service="whatsapp",
-                action="validate_interactive",
-                validation_details={"error": "missing_type"}
-            )
-
-        # Validate body text
-        body = interactive.get("body", {}).get("text", "")
-        if len(body) > cls.LIMITS["text_body"]:
-            raise MessageValidationError(
-                message=f"Body text exceeds {cls.LIMITS['text_body']} characters",
-                service="whatsapp",
-                action="validate_interactive",
-                validation_details={
-                    "error": "text_too_long",
-                    "field": "body",
-                    "length": len(body),
-                    "max_length": cls.LIMITS["text_body"]
-                }
-            )
-
-        # Validate header if present
-        if "header" in interactive:
-            header_text = interactive["header"].get("text", "")
-            if len(header_text) > cls.LIMITS["header"]:
-                raise MessageValidationError(
-                    message=f"Header text exceeds {cls.LIMITS['header']} characters",
-                    service="whatsapp",
-                    action="validate_interactive",
-                    validation_details={
-                        "error": "text_too_long",
-                        "field": "header",
-                        "length": len(header_text),
-                        "max_length": cls.LIMITS["header"]
-                    }
-                )
-
-        # Validate footer if present
-        if "footer" in interactive:
-            footer_text = interactive["footer"].get("text", "")
-            if len(footer_text) > cls.LIMITS["footer"]:
-                raise MessageValidationError(
-                    message=f"Footer text exceeds {cls.LIMITS['footer']} characters",
-                    service="whatsapp",
-                    action="validate_interactive",
-                    validation_details={
-                        "error": "text_too_long",
-                        "field": "footer",
-                        "length": len(footer_text),
-                        "max_length": cls.LIMITS["footer"]
-                    }
-                )
-
-        # Validate action based on type
-        action = interactive.get("action", {})
-        if interactive["type"] == "button":
-            buttons = action.get("buttons", [])
-            if len(buttons) > cls.LIMITS["buttons_count"]:
-                raise MessageValidationError(
-                    message=f"Too many buttons (max {cls.LIMITS['buttons_count']})",
-                    service="whatsapp",
-                    action="validate_interactive",
-                    validation_details={
-                        "error": "too_many_buttons",
-                        "count": len(buttons),
-                        "max_count": cls.LIMITS["buttons_count"]
-                    }
-                )
-            for button in buttons:
-                if len(button["reply"]["title"]) > cls.LIMITS["button_text"]:
-                    raise MessageValidationError(
-                        message=f"Button text exceeds {cls.LIMITS['button_text']} characters",
-                        service="whatsapp",
-                        action="validate_interactive",
-                        validation_details={
-                            "error": "text_too_long",
-                            "field": "button_text",
-                            "text": button["reply"]["title"],
-                            "length": len(button["reply"]["title"]),
-                            "max_length": cls.LIMITS["button_text"]
-                        }
-                    )
-
-        elif interactive["type"] == "list":
-            # Validate button text for list
-            button_text = action.get("button", "")
-            if len(button_text) > cls.LIMITS["button_text"]:
-                raise MessageValidationError(
-                    message=f"List button text exceeds {cls.LIMITS['button_text']} characters",
-                    service="whatsapp",
-                    action="validate_interactive",
-                    validation_details={
-                        "error": "text_too_long",
-                        "field": "button_text",
-                        "text": button_text,
-                        "length": len(button_text),
-                        "max_length": cls.LIMITS["button_text"]
-                    }
-                )
-
-            # Validate sections
-            sections = action.get("sections", [])
-            if len(sections) > cls.LIMITS["sections_count"]:
-                raise MessageValidationError(
-                    message=f"Too many sections (max {cls.LIMITS['sections_count']})",
-                    service="whatsapp",
-                    action="validate_interactive",
-                    validation_details={
-                        "error": "too_many_sections",
-                        "count": len(sections),
-                        "max_count": cls.LIMITS["sections_count"]
-                    }
-                )
-
-            for section in sections:
-                rows = section.get("rows", [])
-                if len(rows) > cls.LIMITS["rows_per_section"]:
-                    raise MessageValidationError(
-                        message=f"Too many rows in section (max {cls.LIMITS['rows_per_section']})",
-                        service="whatsapp",
-                        action="validate_interactive",
-                        validation_details={
-                            "error": "too_many_rows",
-                            "section": section.get("title", "Untitled Section"),
-                            "count": len(rows),
-                            "max_count": cls.LIMITS["rows_per_section"]
-                        }
-                    )
-
-                for row in rows:
-                    if len(row["title"]) > cls.LIMITS["list_title"]:
-                        raise MessageValidationError(
-                            message=f"List item title exceeds {cls.LIMITS['list_title']} characters",
-                            service="whatsapp",
-                            action="validate_interactive",
-                            validation_details={
-                                "error": "text_too_long",
-                                "field": "list_title",
-                                "text": row["title"],
-                                "length": len(row["title"]),
-                                "max_length": cls.LIMITS["list_title"]
-                            }
-                        )
+    WHATSAPP_BASE = WHATSAPP_BASE
 
-                    if "description" in row and len(row["description"]) > cls.LIMITS["list_description"]:
-                        raise MessageValidationError(
-                            message=f"List item description exceeds {cls.LIMITS['list_description']} characters",
-                            service="whatsapp",
-                            action="validate_interactive",
-                            validation_details={
-                                "error": "text_too_long",
-                                "field": "list_description",
-                                "text": row["description"],
-                                "length": len(row["description"]),
-                                "max_length": cls.LIMITS["list_description"]
-                            }
-                        )
+    # WhatsApp Cloud API limits (see builder.py for how they are applied)
+    LIMITS = LIMITS
 
     @classmethod
     def create_message(
@@ -245,9 +73,7 @@ class WhatsAppMessage(Dict[str, Any]):
             message["text"] = {"body": str(text)}
 
         elif message_type == "interactive":
-            interactive = content.get("interactive", {})
-            cls.validate_interactive(interactive)
-            message["interactive"] = interactive
+            return build_from_wire(to, content.get("interactive", {}))
 
         elif message_type == "template":
             message["template"] = content.get("template", {})
@@ -352,14 +178,12 @@ class WhatsAppMessage(Dict[str, Any]):
 
             elif content_type == "interactive":
                 # Handle both dict and object content
-                if hasattr(content, 'to_dict'):
-                    interactive_content = content.to_dict()["interactive"]
-                else:
-                    interactive_content = content.get("interactive", {})
+                if isinstance(content, InteractiveContent):
+                    return build_from_content(channel_id, content)
                 return cls.create_message(
                     to=channel_id,
                     message_type="interactive",
-                    interactive=interactive_content
+                    interactive=content.get("interactive", {})
                 )
 
             elif content_type == "template":
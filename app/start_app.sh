@@ -1,92 +1,142 @@
 #!/bin/bash
 set -e
 
+# Start of the time-to-ready report (config/boot.py, config/gunicorn.py)
+export BOOT_STARTED_AT=${BOOT_STARTED_AT:-$(date +%s.%N)}
+
 echo "Starting application..."
 echo "Environment: $DJANGO_ENV"
 echo "Port: $PORT"
 echo "DEPLOYED_TO_AWS: ${DEPLOYED_TO_AWS:-false}"
+echo "FAST_BOOT: ${FAST_BOOT:-false}"
 
-# Debug Redis configuration
-echo "REDIS_URL from environment: ${REDIS_URL:-not set}"
-REDIS_HOST=$(echo "${REDIS_URL:-redis://localhost:6379/0}" | sed -E 's|redis://([^:/]+).*|\1|')
-echo "Extracted Redis host: $REDIS_HOST"
+if [ "${FAST_BOOT:-false}" = "true" ]; then
+    # Static files are baked into the image and no database is used, so only
+    # Redis and the data directories are checked (in-process, with timings)
+    echo "Fast boot..."
+    export DATABASE_ENABLED=${DATABASE_ENABLED:-false}
+    python -m config.boot
+else
+    # Only the redis state backend needs a Redis server
+    if [ "${STATE_BACKEND:-redis}" = "redis" ]; then
+        # Debug Redis configuration
+        echo "REDIS_URL from environment: ${REDIS_URL:-not set}"
+        REDIS_HOST=$(echo "${REDIS_URL:-redis://localhost:6379/0}" | sed -E 's|redis://([^:/]+).*|\1|')
+        echo "Extracted Redis host: $REDIS_HOST"
 
-# Test Redis connectivity with increased attempts to match task definition grace period
-echo "Waiting for Redis to be ready..."
-max_attempts=60  # Increased to match 300s grace period (5s * 60 = 300s)
-attempt=1
-wait_time=5  # Fixed 5s interval for predictable timing
+        # Test Redis connectivity with increased attempts to match task definition grace period
+        echo "Waiting for Redis to be ready..."
+        max_attempts=60  # Increased to match 300s grace period (5s * 60 = 300s)
+        attempt=1
+        wait_time=5  # Fixed 5s interval for predictable timing
 
-while true; do
-    if [ $attempt -gt $max_attempts ]; then
-        echo "Redis is still unavailable after $max_attempts attempts - giving up"
-        echo "Last Redis connection attempt output:"
-        redis-cli -h "$REDIS_HOST" info | grep -E "^(# Server|redis_version|connected_clients|used_memory|used_memory_human|used_memory_peak|used_memory_peak_human|role)" || true
-        echo "Redis process status:"
-        ps aux | grep redis-server || true
-        echo "Network status:"
-        netstat -an | grep 6379 || true
-        exit 1
-    fi
+        while true; do
+            if [ $attempt -gt $max_attempts ]; then
+                echo "Redis is still unavailable after $max_attempts attempts - giving up"
+                echo "Last Redis connection attempt output:"
+                redis-cli -h "$REDIS_HOST" info | grep -E "^(# Server|redis_version|connected_clients|used_memory|used_memory_human|used_memory_peak|used_memory_peak_human|role)" || true
+                echo "Redis process status:"
+                ps aux | grep redis-server || true
+                echo "Network status:"
+                netstat -an | grep 6379 || true
+                exit 1
+            fi
+
+            echo "Attempting Redis connection (attempt $attempt/$max_attempts waiting ${wait_time}s)..."
+
+            if redis-cli -h "$REDIS_HOST" ping > /dev/null 2>&1; then
+                echo "Redis connection successful!"
+                echo "Redis server info:"
+                redis-cli -h "$REDIS_HOST" info | grep -E "^(# Server|redis_version|connected_clients|used_memory|used_memory_human|used_memory_peak|used_memory_peak_human|role)"
+                echo "Redis persistence status:"
+                redis-cli -h "$REDIS_HOST" config get appendonly
+                echo "Redis memory settings:"
+                redis-cli -h "$REDIS_HOST" config get maxmemory
+                redis-cli -h "$REDIS_HOST" config get maxmemory-policy
+                break
+            else
+                echo "Redis connection failed. Server response:"
+                redis-cli -h "$REDIS_HOST" ping || true
+                echo "Checking Redis port status:"
+                netstat -an | grep 6379 || true
+                echo "Retrying in ${wait_time}s..."
+                sleep $wait_time
+                attempt=$((attempt + 1))
+            fi
+        done
 
-    echo "Attempting Redis connection (attempt $attempt/$max_attempts waiting ${wait_time}s)..."
+        echo "Redis is ready!"
+    else
+        echo "STATE_BACKEND=$STATE_BACKEND, not waiting for Redis"
+    fi
 
-    if redis-cli -h "$REDIS_HOST" ping > /dev/null 2>&1; then
-        echo "Redis connection successful!"
-        echo "Redis server info:"
-        redis-cli -h "$REDIS_HOST" info | grep -E "^(# Server|redis_version|connected_clients|used_memory|used_memory_human|used_memory_peak|used_memory_peak_human|role)"
-        echo "Redis persistence status:"
-        redis-cli -h "$REDIS_HOST" config get appendonly
-        echo "Redis memory settings:"
-        redis-cli -h "$REDIS_HOST" config get maxmemory
-        redis-cli -h "$REDIS_HOST" config get maxmemory-policy
-        break
+    # Create required directories based on DEPLOYED_TO_AWS setting
+    if [ "${DEPLOYED_TO_AWS:-false}" = "true" ]; then
+        echo "Using EFS storage..."
+        # Ensure EFS mount directories exist
+        mkdir -p /efs-vols/app-data/data/{static,media,logs}
+        chmod -R 755 /efs-vols/app-data/data
     else
-        echo "Redis connection failed. Server response:"
-        redis-cli -h "$REDIS_HOST" ping || true
-        echo "Checking Redis port status:"
-        netstat -an | grep 6379 || true
-        echo "Retrying in ${wait_time}s..."
-        sleep $wait_time
-        attempt=$((attempt + 1))
+        echo "Using local storage..."
+        # Create local directories
+        mkdir -p /app/data/{static,media,logs}
+        chmod -R 755 /app/data
     fi
-done
 
-echo "Redis is ready!"
+    # In production collect static files
+    if [ "${DJANGO_ENV:-development}" = "production" ]; then
+        echo "Collecting static files..."
+        python manage.py collectstatic --noinput
+    fi
 
-# Create required directories based on DEPLOYED_TO_AWS setting
-if [ "${DEPLOYED_TO_AWS:-false}" = "true" ]; then
-    echo "Using EFS storage..."
-    # Ensure EFS mount directories exist
-    mkdir -p /efs-vols/app-data/data/{static,media,logs}
-    chmod -R 755 /efs-vols/app-data/data
-else
-    echo "Using local storage..."
-    # Create local directories
-    mkdir -p /app/data/{static,media,logs}
-    chmod -R 755 /app/data
+    # Apply database migrations
+    echo "Applying database migrations..."
+    python manage.py migrate --noinput
 fi
 
-# In production collect static files
-if [ "${DJANGO_ENV:-development}" = "production" ]; then
-    echo "Collecting static files..."
-    python manage.py collectstatic --noinput
+# Determine environment and set appropriate server command; deployed tasks
+# always run Gunicorn, whatever their DJANGO_ENV
+SERVE_WITH_GUNICORN=false
+if [ "${DJANGO_ENV:-development}" = "production" ] || [ "${DEPLOYED_TO_AWS:-false}" = "true" ]; then
+    SERVE_WITH_GUNICORN=true
 fi
 
-# Apply database migrations
-echo "Applying database migrations..."
-python manage.py migrate --noinput
+if [ "$SERVE_WITH_GUNICORN" = "true" ] && [ "${SERVER_MODE:-wsgi}" = "asgi" ]; then
+    echo "Starting Gunicorn server with Uvicorn workers (ASGI)..."
+    # Every flow thread may hold a Redis and a Graph API connection at once
+    export ASYNC_FLOW_THREADS=${ASYNC_FLOW_THREADS:-100}
+    export REDIS_MAX_CONNECTIONS=${REDIS_MAX_CONNECTIONS:-$ASYNC_FLOW_THREADS}
+    export WHATSAPP_POOL_SIZE=${WHATSAPP_POOL_SIZE:-$ASYNC_FLOW_THREADS}
+    echo "Workers: ${GUNICORN_WORKERS:-1}, flow threads per worker: $ASYNC_FLOW_THREADS"
+    echo "Redis connections: $REDIS_MAX_CONNECTIONS, WhatsApp pool size: $WHATSAPP_POOL_SIZE"
 
-# Determine environment and set appropriate server command
-if [ "${DJANGO_ENV:-development}" = "production" ]; then
+    # One event loop per worker; flow work runs on its thread pool
+    exec gunicorn config.asgi:application \
+        --config python:config.gunicorn \
+        --bind 0.0.0.0:${PORT:-8000} \
+        --workers ${GUNICORN_WORKERS:-1} \
+        --worker-class uvicorn_worker.UvicornWorker \
+        --preload \
+        --max-requests 1000 \
+        --max-requests-jitter 50 \
+        --log-level ${LOG_LEVEL:-info} \
+        --access-logfile - \
+        --error-logfile - \
+        --timeout ${GUNICORN_TIMEOUT:-120} \
+        --graceful-timeout 30 \
+        --keep-alive 65
+elif [ "$SERVE_WITH_GUNICORN" = "true" ]; then
     echo "Starting Gunicorn server in production mode..."
-    echo "Workers: ${GUNICORN_WORKERS:-2}"
+    echo "Workers: ${GUNICORN_WORKERS:-2} (${GUNICORN_WORKER_CLASS:-sync}, threads: ${GUNICORN_THREADS:-1})"
 
-    # Using sync worker with preload for better memory efficiency
+    # Sync workers by default; gthread and gevent are safe for the request path
     exec gunicorn config.wsgi:application \
+        --config python:config.gunicorn \
         --bind 0.0.0.0:${PORT:-8000} \
         --workers ${GUNICORN_WORKERS:-2} \
-        --worker-class sync \
+        --worker-class ${GUNICORN_WORKER_CLASS:-sync} \
+        --threads ${GUNICORN_THREADS:-1} \
+        --worker-connections ${GUNICORN_WORKER_CONNECTIONS:-100} \
         --preload \
         --max-requests 1000 \
         --max-requests-jitter 50 \
@@ -44,27 +44,23 @@ def send_message(args: argparse.Namespace) -> None:
         print("\nServer Response:")
         print(response.text)
 
-        # Start polling for messages
-        last_check = int(time.time() * 1000)  # Start from current time
+        # Long-poll for replies to this number, starting from current time
+        last_check = int(time.time() * 1000)
+        after = 0
         print("\nWaiting for responses...")
 
         while True:
             try:
-                # Poll messages endpoint
-                messages_url = f"http://localhost:{args.port}/messages?since={last_check}"
-                response = requests.get(messages_url)
+                # Wait on the server until a newer message arrives
+                params = {"to": args.phone, "wait": 25}
+                params.update({"after": after} if after else {"since": last_check})
+                response = requests.get(f"http://localhost:{args.port}/messages", params=params, timeout=35)
                 response.raise_for_status()
 
                 # Process any new messages
-                messages = response.json()
-                if messages:
-                    for message in messages:
-                        print(f"\nReceived: {json.dumps(message, indent=2)}")
-                        # Update last check time from filename
-                        last_check = max(last_check, int(time.time() * 1000))
-
-                # Wait before next poll
-                time.sleep(1)
+                for message in response.json():
+                    print(f"\nReceived: {json.dumps(message, indent=2)}")
+                    after = message["_seq"]
 
             except KeyboardInterrupt:
                 print("\nStopping message polling...")
@@ -5,6 +5,14 @@ class WhatsAppMock {
         this.ui = new ChatUI();
         this.ui.setupEventListeners((messageType) => this.sendMessage(messageType));
         this.ui.updateStatus();
+        this.subscribe();
+    }
+
+    subscribe() {
+        // Stream new messages; EventSource reconnects with the last ID it saw
+        const events = new EventSource(`${window.location.origin}/events?after=${this.ui.getLastSeq()}`);
+        events.onmessage = (event) => this.ui.appendMessage(JSON.parse(event.data));
+        events.onerror = () => console.warn('Message stream interrupted, reconnecting...');
     }
 
 
@@ -44,8 +52,7 @@ class WhatsAppMock {
                 throw new Error(`Server responded with ${response.status}: ${await response.text()}`);
             }
 
-            // Show refresh notification
-            this.ui.showNotification('Click Refresh to update conversation. Wait a few seconds to make sure app response is included.');
+            // Sent and app messages arrive over the event stream
             this.ui.disableSendButton(false);
         } catch (error) {
             console.error('Error:', error);
@@ -14,54 +14,81 @@ export class ChatUI {
     }
 
     formatExistingMessages() {
+        document.querySelectorAll('.message.whatsapp-text, .message.whatsapp-interactive').forEach(message => {
+            this.formatMessage(message);
+        });
+    }
+
+    formatMessage(message) {
         // Format text messages
-        const textMessages = document.querySelectorAll('.message.whatsapp-text');
-        textMessages.forEach(message => {
+        if (message.classList.contains('whatsapp-text')) {
             const rawText = message.getAttribute('data-raw-text');
             if (rawText) {
                 message.innerHTML = formatWhatsAppText(rawText);
             }
-        });
+            return;
+        }
 
         // Format interactive messages
-        const interactiveMessages = document.querySelectorAll('.message.whatsapp-interactive');
-        interactiveMessages.forEach(message => {
-            const interactiveData = message.getAttribute('data-interactive');
-            if (interactiveData) {
-                try {
-                    const interactive = JSON.parse(interactiveData);
-                    message.innerHTML = formatInteractiveMessage(interactive);
-
-                    // Add click handlers for buttons and list items
-                    message.querySelectorAll('.whatsapp-button:not(.list-select-button), .list-item').forEach(element => {
-                        element.addEventListener('click', () => {
-                            const id = element.getAttribute('data-id');
-                            const type = element.classList.contains('whatsapp-button') ? 'button' : 'list';
-                            const title = element.querySelector('.item-description')?.textContent || id;
-
-                            // Simulate user selecting this option with WhatsApp standard format
-                            this.messageInput.value = `${type}:${id}`;
-                            if (this.onSendMessage) {
-                                this.onSendMessage('interactive');
-                            }
-                        });
+        const interactiveData = message.getAttribute('data-interactive');
+        if (interactiveData) {
+            try {
+                const interactive = JSON.parse(interactiveData);
+                message.innerHTML = formatInteractiveMessage(interactive);
+
+                // Add click handlers for buttons and list items
+                message.querySelectorAll('.whatsapp-button:not(.list-select-button), .list-item').forEach(element => {
+                    element.addEventListener('click', () => {
+                        const id = element.getAttribute('data-id');
+                        const type = element.classList.contains('whatsapp-button') ? 'button' : 'list';
+                        const title = element.querySelector('.item-description')?.textContent || id;
+
+                        // Simulate user selecting this option with WhatsApp standard format
+                        this.messageInput.value = `${type}:${id}`;
+                        if (this.onSendMessage) {
+                            this.onSendMessage('interactive');
+                        }
                     });
-
-                    // Add click handler for list select button
-                    message.querySelectorAll('.list-select-button').forEach(button => {
-                        button.addEventListener('click', () => {
-                            const listContainer = button.closest('.interactive-list');
-                            if (listContainer) {
-                                listContainer.classList.add('active');
-                            }
-                        });
+                });
+
+                // Add click handler for list select button
+                message.querySelectorAll('.list-select-button').forEach(button => {
+                    button.addEventListener('click', () => {
+                        const listContainer = button.closest('.interactive-list');
+                        if (listContainer) {
+                            listContainer.classList.add('active');
+                        }
                     });
-                } catch (e) {
-                    console.error('Error parsing interactive message:', e);
-                    message.innerHTML = '<div class="error">Error displaying interactive message</div>';
-                }
+                });
+            } catch (e) {
+                console.error('Error parsing interactive message:', e);
+                message.innerHTML = '<div class="error">Error displaying interactive message</div>';
             }
-        });
+        }
+    }
+
+    appendMessage(msg) {
+        // Same markup the server renders for stored messages
+        const message = document.createElement('div');
+        const direction = msg.from ? 'incoming' : 'outgoing';
+        if (msg.type === 'text' && msg.text?.body) {
+            message.className = `message ${direction}-message whatsapp-text`;
+            message.setAttribute('data-raw-text', msg.text.body);
+        } else if (msg.type === 'interactive') {
+            message.className = `message whatsapp-interactive ${direction}-message`;
+            message.setAttribute('data-interactive', JSON.stringify(msg.interactive || {}));
+        } else {
+            return;
+        }
+        message.setAttribute('data-seq', msg._seq);
+        document.getElementById('messageList').appendChild(message);
+        this.formatMessage(message);
+        this.chatContainer.scrollTop = this.chatContainer.scrollHeight;
+    }
+
+    getLastSeq() {
+        const messages = document.querySelectorAll('.message[data-seq]');
+        return messages.length ? Number(messages[messages.length - 1].getAttribute('data-seq')) : 0;
     }
 
     showNotification(text) {
@@ -70,9 +97,6 @@ export class ChatUI {
         notificationDiv.textContent = text;
         this.chatContainer.appendChild(notificationDiv);
         this.chatContainer.scrollTop = this.chatContainer.scrollHeight;
-
-        // Format any new messages that were added
-        this.formatExistingMessages();
     }
 
     updateStatus() {
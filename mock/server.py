@@ -1,12 +1,22 @@
-"""Mock WhatsApp server implementation."""
+"""Mock WhatsApp server implementation.
+
+Bot messages are kept in memory (see store.py) and served to the UI and CLI
+as JSON (/messages, with optional long-poll) or as Server-Sent Events
+(/events). Requests are handled on threads with HTTP/1.1 keep-alive.
+"""
+import hashlib
+import hmac
+import html
 import json
 import logging
 import os
-import socketserver
+import threading
 import time
-from http.server import SimpleHTTPRequestHandler
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
 
 import requests
+from store import DEFAULT_CAPACITY, MessageStore
 
 # Configure logging - show important messages only
 logging.basicConfig(
@@ -22,16 +32,28 @@ logging.getLogger("http.server").setLevel(logging.WARNING)
 # The actual app endpoint we're testing
 APP_ENDPOINT = 'http://app:8000/bot/webhook'
 
-# Directory to store messages
-MESSAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "messages")
+# Webhooks are signed as Meta signs them when the app checks signatures
+APP_SECRET = os.environ.get("WHATSAPP_APP_SECRET", "")
 
-# Create messages directory if it doesn't exist
-os.makedirs(MESSAGES_DIR, exist_ok=True)
+# Messages kept per recipient, and an optional journal to keep them across restarts
+STORE = MessageStore(
+    capacity=int(os.environ.get("MOCK_BUFFER_SIZE", DEFAULT_CAPACITY)),
+    journal_path=os.environ.get("MOCK_JOURNAL") or None
+)
+
+# Longest long-poll wait, and interval of SSE keep-alive comments (seconds)
+MAX_WAIT = 30
+SSE_KEEPALIVE = 15
 
 
 class MockWhatsAppHandler(SimpleHTTPRequestHandler):
     """Handler for serving mock WhatsApp interface and handling webhooks."""
 
+    # Keep-alive, so the app's pooled sender reuses its connections; headers
+    # and body are written separately, so Nagle would delay every response
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
     def __init__(self, *args, directory=None, **kwargs):
         # Serve from current directory
         directory = os.path.dirname(os.path.abspath(__file__))
@@ -50,22 +72,27 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
             return 'text/html'
         return super().guess_type(path)
 
-    def _send_200(self, content=None):
-        """Send 200 OK with optional JSON content"""
+    def _send_json(self, status, content=None):
+        """Send a JSON response (empty body if content is None)"""
+        body = json.dumps(content).encode('utf-8') if content is not None else b""
         try:
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
             self._send_cors_headers()
             self.end_headers()
-            if content:
-                self.wfile.write(json.dumps(content).encode('utf-8'))
-                self.wfile.flush()
+            self.wfile.write(body)
+            self.wfile.flush()
         except Exception as e:
             # Ignore all errors - client probably disconnected
             logger.debug("Connection closed: %s", e)
 
+    def _send_200(self, content=None):
+        """Send 200 OK with optional JSON content"""
+        self._send_json(200, content)
+
     def _save_message(self, message):
-        """Save message to file for UI/CLI to read."""
+        """Store message for UI/CLI to read."""
         try:
             # Ensure message is JSON serializable
             if isinstance(message, str):
@@ -80,52 +107,14 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
                 (message.get("type") == "text" and message.get("text", {}).get("body")) or
                 (message.get("type") == "interactive" and message.get("interactive"))
             ):
-                # Create timestamp-based filename
-                timestamp = int(time.time() * 1000)  # millisecond precision
-                filename = f"{timestamp}.json"
-                filepath = os.path.join(MESSAGES_DIR, filename)
-
-                # Add filename to message data for timestamp tracking
-                message_with_meta = {
-                    **message,
-                    "_filename": filename  # Add filename to message data
-                }
-
-                # Save message to file
-                with open(filepath, 'w') as f:
-                    json.dump(message_with_meta, f, indent=2)
+                STORE.append(message)
 
         except Exception as e:
             logger.error("Failed to save message: %s", e)
 
-    def _get_messages(self, since=None):
-        """Get messages from file storage, optionally after a timestamp."""
-        messages = []
-        try:
-            # List all message files
-            files = sorted(os.listdir(MESSAGES_DIR))
-            for filename in files:
-                if not filename.endswith('.json'):
-                    continue
-
-                # Get timestamp from filename
-                timestamp = int(filename[:-5])  # Remove .json
-                if since and timestamp <= since:
-                    continue
-
-                # Read message
-                filepath = os.path.join(MESSAGES_DIR, filename)
-                with open(filepath) as f:
-                    message = json.load(f)
-                    # Ensure filename is included in message data
-                    if '_filename' not in message:
-                        message['_filename'] = filename
-                    messages.append(message)
-
-        except Exception as e:
-            logger.error("Error reading messages: %s", e)
-
-        return messages
+    def _query(self):
+        """Query parameters of the request as a flat dict"""
+        return {key: values[-1] for key, values in parse_qs(urlsplit(self.path).query).items()}
 
     def _forward_to_app(self, message):
         """Transform and forward message to app."""
@@ -171,16 +160,20 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
             }
 
             # Add mock testing headers
+            body = json.dumps(webhook_message).encode()
             headers = {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
                 "X-Mock-Testing": "true"
             }
+            if APP_SECRET:
+                digest = hmac.new(APP_SECRET.encode(), body, hashlib.sha256).hexdigest()
+                headers["X-Hub-Signature-256"] = f"sha256={digest}"
 
             # Send request and handle response
             response = requests.post(
                 APP_ENDPOINT,
-                json=webhook_message,
+                data=body,
                 headers=headers,
                 timeout=30  # Match CLI client timeout
             )
@@ -219,10 +212,9 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
                         }
                     self._save_message(outgoing_message)
 
-                    # Acknowledge receipt immediately and close connection
+                    # Acknowledge receipt immediately
                     self._send_200({"success": True})
                     # Start forwarding to app in a separate thread
-                    import threading
                     threading.Thread(target=self._forward_to_app, args=(message,)).start()
                     logger.info("UI -> Server-> app-1 complete: %s", message["message"])
                     return
@@ -242,7 +234,7 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
                     # Create outgoing message
                     outgoing_message = {
                         "from": "app",  # Explicitly mark as from app
-                        "to": None,  # App messages don't have a to field
+                        "to": messages.get("to") or message.get("to"),  # Member the app replied to
                         "type": messages.get("type", "text")
                     }
 
@@ -265,10 +257,13 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
                     "contacts": [{"input": message.get("to"), "wa_id": message.get("to")}],
                     "messages": [{"id": f"wamid.{hex(int.from_bytes(os.urandom(16), 'big'))[2:]}"}]
                 })
+            else:
+                self._send_json(400, {"error": "Empty request body"})
 
         except Exception as e:
-            # Just log and continue
+            # Log and answer, so keep-alive clients are not left waiting
             logger.error("Error handling webhook: %s", e)
+            self._send_json(500, {"error": str(e)})
 
     def log_request(self, code='-', size='-'):
         """Log an accepted request."""
@@ -284,83 +279,102 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
         """Log a message."""
         pass  # Suppress default logging
 
+    def _render_messages(self, messages):
+        """Message elements for the index page"""
+        messages_html = ''
+        for msg in messages:
+            direction = 'incoming' if msg.get('from') else 'outgoing'
+            if msg.get('type') == 'text' and msg.get('text', {}).get('body'):
+                # Escape special characters for HTML attribute
+                escaped_body = html.escape(msg['text']['body'])
+                messages_html += f"""
+                <div class="message {direction}-message whatsapp-text" data-seq="{msg['_seq']}" data-raw-text="{escaped_body}"></div>
+                """
+            elif msg.get('type') == 'interactive':
+                # Convert interactive message to JSON string and escape for HTML attribute
+                escaped_json = html.escape(json.dumps(msg.get('interactive', {})))
+                messages_html += f"""
+                <div class="message whatsapp-interactive {direction}-message" data-seq="{msg['_seq']}" data-interactive="{escaped_json}"></div>
+                """
+        return messages_html
+
+    def _stream_events(self, after, recipient):
+        """Send new messages as Server-Sent Events until the client leaves"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self._send_cors_headers()
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            while True:
+                messages = STORE.read(after=after, recipient=recipient, wait=SSE_KEEPALIVE)
+                if messages:
+                    after = messages[-1]["_seq"]
+                    chunk = "".join(f"id: {m['_seq']}\ndata: {json.dumps(m)}\n\n" for m in messages)
+                else:
+                    chunk = ": keep-alive\n\n"
+                self.wfile.write(chunk.encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("Event stream closed")
+
     def do_GET(self):
         """Handle GET requests."""
-        if self.path == "/" or self.path == "" or self.path == "/index.html":
-            # Get all messages
-            messages = self._get_messages()
+        path = urlsplit(self.path).path
 
+        if path == "/" or path == "" or path == "/index.html":
             # Read the index.html template
             with open(os.path.join(os.path.dirname(__file__), 'index.html'), 'r') as f:
                 html_content = f.read()
 
-            # Create message elements
-            messages_html = ''
-            for msg in messages:
-                if msg.get('type') == 'text' and msg.get('text', {}).get('body'):
-                    direction = 'incoming' if msg.get('from') else 'outgoing'
-                    body = msg['text']['body']
-                    # Escape special characters for HTML attribute
-                    escaped_body = body.replace('"', '&quot;').replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                    messages_html += f"""
-                    <div class="message {direction}-message whatsapp-text" data-raw-text="{escaped_body}"></div>
-                    """
-                elif msg.get('type') == 'interactive':
-                    direction = 'incoming' if msg.get('from') else 'outgoing'
-                    interactive = msg.get('interactive', {})
-                    # Convert interactive message to JSON string and escape for HTML attribute
-                    escaped_json = json.dumps(interactive).replace('"', '&quot;')
-                    # Add debug info
-                    messages_html += f"""
-                    <div class="message whatsapp-interactive {direction}-message" data-interactive="{escaped_json}"></div>
-                    """
-
-            # Replace placeholder with messages
-            html_content = html_content.replace('{messages_placeholder}', messages_html)
+            # Replace placeholder with all stored messages
+            html_content = html_content.replace('{messages_placeholder}', self._render_messages(STORE.read()))
+            body = html_content.encode()
 
             # Send response
             self.send_response(200)
             self.send_header('Content-Type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self._send_cors_headers()
             self.end_headers()
-            self.wfile.write(html_content.encode())
+            self.wfile.write(body)
             return
 
-        if self.path == "/clear-conversation":
-            try:
-                # Delete all files in messages directory
-                for filename in os.listdir(MESSAGES_DIR):
-                    if filename.endswith('.json'):
-                        os.remove(os.path.join(MESSAGES_DIR, filename))
-                logger.info("VimbisoPay Mock cleared")
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self._send_cors_headers()
-                self.end_headers()
-                self.wfile.write(json.dumps({"success": True}).encode())
-            except Exception as e:
-                logger.error("Error clearing conversation: %s", e)
-                self.send_response(500)
-                self.end_headers()
+        if path == "/clear-conversation":
+            STORE.clear()
+            logger.info("VimbisoPay Mock cleared")
+            self._send_200({"success": True})
             return
 
-        if self.path.startswith("/messages"):
-            # Get since parameter if provided
-            since = None
-            if "?" in self.path:
-                query = self.path.split("?")[1]
-                params = dict(param.split("=") for param in query.split("&"))
-                since = int(params.get("since", 0))
-
-            # Get messages
-            messages = self._get_messages(since)
+        if path == "/messages":
+            # Cursor: `after` message sequence number, or `since` millisecond timestamp;
+            # `wait` long-polls for up to that many seconds when nothing is newer
+            params = self._query()
+            try:
+                messages = STORE.read(
+                    after=int(params.get("after", 0)),
+                    since=int(params["since"]) if params.get("since") else None,
+                    recipient=params.get("to"),
+                    wait=min(float(params.get("wait", 0)), MAX_WAIT)
+                )
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            self._send_200(messages)
+            return
 
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self._send_cors_headers()
-            self.end_headers()
-            self.wfile.write(json.dumps(messages).encode())
+        if path == "/events":
+            # Reconnecting EventSource clients send the last ID they saw
+            params = self._query()
+            try:
+                after = int(self.headers.get("Last-Event-ID") or params.get("after", STORE.last_seq()))
+            except ValueError as e:
+                self._send_json(400, {"error": str(e)})
+                return
+            self._stream_events(after, params.get("to"))
             return
 
         try:
@@ -371,6 +385,7 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
                     # Send response with CORS headers
                     self.send_response(200)
                     self.send_header('Content-Type', self.guess_type(file_path))
+                    self.send_header('Content-Length', str(len(content)))
                     self._send_cors_headers()
                     self.end_headers()
                     self.wfile.write(content)
@@ -387,6 +402,7 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, X-Mock-Testing')
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def _send_cors_headers(self):
@@ -406,19 +422,16 @@ class MockWhatsAppHandler(SimpleHTTPRequestHandler):
         if self.path.startswith("/bot/webhook"):
             self._handle_webhook()
         else:
-            try:
-                self.send_response(404)
-                self.end_headers()
-            except Exception as e:
-                logger.debug("Error sending 404: %s", e)
+            self._send_json(404)
 
 
 def run_server(port=8001):
     """Run the mock server."""
     logger.info("VimbisoPay Mock up at: http://localhost:%d", port)
 
-    server = socketserver.TCPServer(("", port), MockWhatsAppHandler)
-    server.allow_reuse_address = True
+    # One thread per connection; long-poll and SSE readers only block their own
+    server = ThreadingHTTPServer(("", port), MockWhatsAppHandler)
+    server.daemon_threads = True
 
     try:
         server.serve_forever()
@@ -426,6 +439,7 @@ def run_server(port=8001):
         logger.info("Shutting down...")
     finally:
         server.server_close()
+        STORE.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+"""In-memory message store for the mock server.
+
+Messages live in a bounded ring buffer per recipient instead of one file each:
+- Every message gets a sequence number (_seq) and millisecond timestamp
+  (_timestamp); readers ask for messages after a sequence number or, like the
+  old file store, after a timestamp
+- Long-poll readers wait on a condition until a newer message arrives
+- An optional append-only journal (one JSON line per message) is replayed and
+  compacted to the retained messages on start
+"""
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 1000
+
+
+class MessageStore:
+    """Bounded per-recipient message buffers with blocking reads"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, journal_path: Optional[str] = None):
+        """Create the store, replaying the journal if there is one
+
+        Args:
+            capacity: Messages kept per recipient; older ones are dropped
+            journal_path: Optional append-only journal file
+        """
+        self.capacity = capacity
+        self.journal_path = journal_path
+        self._buffers: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._seq = 0
+        self._changed = threading.Condition()
+        self._journal = None
+
+        if journal_path:
+            self._replay(journal_path)
+            self._journal = open(journal_path, "a", encoding="utf-8")
+
+    def _buffer(self, recipient: str) -> Deque[Dict[str, Any]]:
+        buffer = self._buffers.get(recipient)
+        if buffer is None:
+            buffer = self._buffers[recipient] = deque(maxlen=self.capacity)
+        return buffer
+
+    def _replay(self, path: str) -> None:
+        """Load retained messages from the journal and rewrite it with only those"""
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted write
+                self._buffer(message.get("to") or "").append(message)
+                self._seq = max(self._seq, message.get("_seq", 0))
+
+        retained = sorted((m for buffer in self._buffers.values() for m in buffer), key=lambda m: m["_seq"])
+        compacted = f"{path}.tmp"
+        with open(compacted, "w", encoding="utf-8") as journal:
+            for message in retained:
+                journal.write(json.dumps(message) + "\n")
+        os.replace(compacted, path)
+        logger.info("Replayed %d messages from %s", len(retained), path)
+
+    def append(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a message and wake waiting readers
+
+        Returns:
+            The stored message with _seq and _timestamp added
+        """
+        with self._changed:
+            self._seq += 1
+            stored = {**message, "_seq": self._seq, "_timestamp": int(time.time() * 1000)}
+            self._buffer(stored.get("to") or "").append(stored)
+            if self._journal:
+                self._journal.write(json.dumps(stored) + "\n")
+                self._journal.flush()
+            self._changed.notify_all()
+        return stored
+
+    def _newer(self, after: int, since: Optional[int], recipient: Optional[str]) -> List[Dict[str, Any]]:
+        """Messages after a sequence number (and timestamp), oldest first"""
+        if recipient is not None:
+            buffers = [self._buffers.get(recipient, ())]
+        else:
+            buffers = list(self._buffers.values())
+
+        newer = []
+        for buffer in buffers:
+            # Buffers are in sequence order; walk back only over new messages
+            for message in reversed(buffer):
+                if message["_seq"] <= after or (since is not None and message["_timestamp"] <= since):
+                    break
+                newer.append(message)
+        newer.sort(key=lambda message: message["_seq"])
+        return newer
+
+    def read(
+        self,
+        after: int = 0,
+        since: Optional[int] = None,
+        recipient: Optional[str] = None,
+        wait: float = 0
+    ) -> List[Dict[str, Any]]:
+        """Messages newer than a cursor, optionally waiting for one
+
+        Args:
+            after: Only messages with a greater _seq
+            since: Only messages with a greater _timestamp (milliseconds)
+            recipient: Only messages to this number (None for all)
+            wait: Seconds to wait when there is nothing newer yet
+
+        Returns:
+            Matching messages, oldest first (empty if the wait ran out)
+        """
+        deadline = time.monotonic() + wait
+        with self._changed:
+            while True:
+                newer = self._newer(after, since, recipient)
+                remaining = deadline - time.monotonic()
+                if newer or remaining <= 0:
+                    return newer
+                self._changed.wait(remaining)
+
+    def last_seq(self) -> int:
+        """Sequence number of the latest message"""
+        with self._changed:
+            return self._seq
+
+    def clear(self) -> None:
+        """Drop all messages and truncate the journal"""
+        with self._changed:
+            self._buffers.clear()
+            if self._journal:
+                self._journal.seek(0)
+                self._journal.truncate()
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        """Close the journal"""
+        with self._changed:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
@@ -122,6 +122,7 @@ module "ecs" {
     whatsapp_access_token                = var.whatsapp_access_token
     whatsapp_phone_number_id             = var.whatsapp_phone_number_id
     whatsapp_business_id                 = var.whatsapp_business_id
+    whatsapp_app_secret                  = var.whatsapp_app_secret
   }
 
   tags = local.common_tags
@@ -63,6 +63,9 @@ resource "aws_ecs_task_definition" "app" {
         { name = "WHATSAPP_ACCESS_TOKEN", value = var.django_env.whatsapp_access_token },
         { name = "WHATSAPP_PHONE_NUMBER_ID", value = var.django_env.whatsapp_phone_number_id },
         { name = "WHATSAPP_BUSINESS_ID", value = var.django_env.whatsapp_business_id },
+        { name = "WHATSAPP_APP_SECRET", value = var.django_env.whatsapp_app_secret },
+        { name = "DEPLOYED_TO_AWS", value = "true" },
+        { name = "FAST_BOOT", value = "true" },
         { name = "GUNICORN_WORKERS", value = "2" },
         { name = "GUNICORN_TIMEOUT", value = "120" },
         { name = "DJANGO_LOG_LEVEL", value = "DEBUG" },
@@ -98,24 +101,10 @@ resource "aws_ecs_task_definition" "app" {
           readOnly     = false
         }
       ]
-      command = [
-        "bash",
-        "-c",
-        <<-EOT
-        set -e
-        mkdir -p /efs-vols/app-data/data/{static,media,logs}
-        chmod 755 /efs-vols/app-data/data  # Ensure directory is writable for SQLite
-        ln -sfn /efs-vols/app-data/data /app/data
-        cd /app
-        python manage.py collectstatic --noinput
-        exec gunicorn config.wsgi:application \
-          --bind "0.0.0.0:8000" \
-          --workers "$${GUNICORN_WORKERS:-2}" \
-          --timeout "$${GUNICORN_TIMEOUT:-120}" \
-          --access-logfile - \
-          --error-logfile -
-        EOT
-      ]
+      # Fast boot (config/boot.py) then Gunicorn with --preload; static files
+      # are collected into the image and data directories live on EFS
+      workingDirectory = "/app"
+      command          = ["./start_app.sh"]
       healthCheck = {
         command     = ["CMD-SHELL", "curl -f http://localhost:8000/health/ || exit 1"]
         interval    = 30
@@ -169,6 +169,7 @@ variable "django_env" {
     whatsapp_access_token                = string
     whatsapp_phone_number_id             = string
     whatsapp_business_id                 = string
+    whatsapp_app_secret                  = string
   })
   sensitive = true
 }
@@ -57,6 +57,12 @@ variable "whatsapp_phone_number_id" {
   sensitive   = true
 }
 
+variable "whatsapp_app_secret" {
+  description = "WhatsApp app secret (verifies webhook signatures)"
+  type        = string
+  sensitive   = true
+}
+
 variable "whatsapp_business_id" {
   description = "WhatsApp business ID"
   type        = string